@@ -1,6 +1,11 @@
 from .adf_object import ADFObject
 from .adf_object import adf_mark_list, adf_node_list
-from .adf_object import load_adf
+from .adf_object import load_adf, shared_mark
+from .adf_object import adf_schema, adf_validator, set_schema_source
+from .adf_index import ADFIndex
+from .adf_patch import apply_patch, diff
+from .adf_stream import iter_load_adf, load_adf_stream, iter_csv_table_chunks, write_csv_tables
+from .adf_template import ADFTemplate, compile_template, render_batch
 
 from .adf_simple import ADFHardBreak, ADFRule
 from .adf_simple import ADFText, ADFDate, ADFPlaceholder
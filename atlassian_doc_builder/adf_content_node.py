@@ -1,19 +1,21 @@
+from typing import Optional
+
 import jsonschema
 
-from .adf_object import adf_schema, ADFObject
+from .adf_index import ADFIndex
+from .adf_object import adf_validator, ADFObject
 
 
 class ADFContentObject(ADFObject):
+    __slots__ = ()
+
     def __getitem__(self, idx):
         if type(idx) is int:
             return self.local_info['content'][idx]
-        levels, cur_obj = list(idx), self.local_info['content']
-        while levels:
-            cur_idx = levels.pop(0)
-            cur_obj = cur_obj[cur_idx]
-            if not levels:
-                return cur_obj
-            cur_obj = cur_obj.local_info['content']
+        cur_obj = self
+        for cur_idx in idx:
+            cur_obj = cur_obj.local_info['content'][cur_idx]
+        return cur_obj
 
     def __len__(self):
         return len(self.local_info['content'])
@@ -32,21 +34,60 @@ ADFParagraph, ADFBlockquote, ADFBulletList, ADFOrderList, ADFListItem = tuple(
 
 
 class ADFDoc(ADFContentObject.node_class_factory('doc')):
+    __slots__ = ('_index',)  # ADFIndex from build_index(), not set without index.
+
     def __init__(self, chain_mode=True, **kwargs):
         super(ADFDoc, self).__init__(chain_mode=chain_mode, **kwargs)
         self.local_info['version'] = 1
 
-    def validate(self):
+    def __getstate__(self):
+        state = super(ADFDoc, self).__getstate__()
+        state.pop('_index', None)  # Not copied by clone() and pickle. Build the index of the copy again.
+        return state
+
+    def build_index(self, attrs=('localId',)) -> ADFIndex:
+        """
+        Index all the nodes of the document by type and by the values of the attributes, see ADFIndex.find().
+        The index is kept up to date by the changes through add(), extend_content(), assign_info() and apply_patch().
+        The children of lazily loaded nodes are materialized.
+        :param attrs: Names of the attributes indexed, e.g. ('localId', 'state').
+        :return: ADFIndex, also available as the property "index".
+        """
+        self._index = ADFIndex(self, attrs)
+        return self._index
+
+    def drop_index(self):
+        """
+        Remove the index of build_index().
+        :return: Current Node
+        """
+        self._index = None
+        return self
+
+    @property
+    def index(self) -> Optional[ADFIndex]:
+        return getattr(self, '_index', None)
+
+    def validate(self, fast=False, incremental=False):
         """
         Validate the output object with the ADF Schema. Raise Exception when validation fails.
+        :param fast: Raise the first error found instead of collecting all errors for the most relevant one.
+        :param incremental: Validate the nodes changed since the last validation only, see validate_tree().
         :return: Rendered result
         """
+        if incremental:
+            return self.validate_tree().render()
         render_result = self.render()
-        jsonschema.validate(render_result, adf_schema())
+        errors = adf_validator().iter_errors(render_result)
+        error = next(errors, None) if fast else jsonschema.exceptions.best_match(errors)
+        if error is not None:
+            raise error
         return render_result
 
 
 class ADFHeading(ADFContentObject.node_class_factory('heading')):
+    __slots__ = ()
+
     def __init__(self, level=None, chain_mode=True, **kwargs):
         new_kwargs = {k: v for k, v in kwargs.items() if k != 'attrs'}
         super(ADFHeading, self).__init__(chain_mode=chain_mode, **new_kwargs)
@@ -63,6 +104,8 @@ class ADFHeading(ADFContentObject.node_class_factory('heading')):
 
 
 class ADFCodeBlock(ADFContentObject.node_class_factory('codeBlock')):
+    __slots__ = ()
+
     def __init__(self, language=None, chain_mode=True, **kwargs):
         new_kwargs = {k: v for k, v in kwargs.items() if k != 'attrs'}
         super(ADFCodeBlock, self).__init__(chain_mode=chain_mode, **new_kwargs)
@@ -79,6 +122,8 @@ class ADFCodeBlock(ADFContentObject.node_class_factory('codeBlock')):
 
 
 class ADFPanel(ADFContentObject.node_class_factory('panel')):
+    __slots__ = ()
+
     def __init__(self, panel_type=None, chain_mode=True, **kwargs):
         new_kwargs = {k: v for k, v in kwargs.items() if k != 'attrs'}
         new_attrs = {k: v for k, v in kwargs.get('attrs', {}).items() if k != 'panelType'}
@@ -96,6 +141,8 @@ class ADFPanel(ADFContentObject.node_class_factory('panel')):
 
 
 class ADFExpand(ADFContentObject.node_class_factory('expand')):
+    __slots__ = ()
+
     def __init__(self, title=None, chain_mode=True, **kwargs):
         new_kwargs = {k: v for k, v in kwargs.items() if k != 'attrs'}
         super(ADFExpand, self).__init__(chain_mode=chain_mode, **new_kwargs)
@@ -112,6 +159,8 @@ class ADFExpand(ADFContentObject.node_class_factory('expand')):
 
 
 class ADFTaskList(ADFContentObject.node_class_factory('taskList')):
+    __slots__ = ()
+
     def __init__(self, local_id=None, chain_mode=True, **kwargs):
         new_kwargs = {k: v for k, v in kwargs.items() if k != 'attrs'}
         super(ADFTaskList, self).__init__(chain_mode=chain_mode, **new_kwargs)
@@ -128,6 +177,8 @@ class ADFTaskList(ADFContentObject.node_class_factory('taskList')):
 
 
 class ADFTaskItem(ADFContentObject.node_class_factory('taskItem')):
+    __slots__ = ()
+
     def __init__(self, state=None, local_id=None, chain_mode=True, **kwargs):
         new_kwargs = {k: v for k, v in kwargs.items() if k != 'attrs'}
         super(ADFTaskItem, self).__init__(chain_mode=chain_mode, **new_kwargs)
@@ -0,0 +1,84 @@
+from typing import Iterable, List
+
+from .adf_object import ADFObject, _node_indexes, _root_node
+
+
+class ADFIndex:
+    """
+    Index of the nodes under a document by type and by the values of selected attributes, see ADFDoc.build_index().
+    Kept up to date by add(), extend_content(), assign_info(), apply_variable() and apply_patch() on the nodes of the
+    document.
+    Marks are not indexed.
+    """
+
+    def __init__(self, root: ADFObject, attrs: Iterable[str] = ('localId',)):
+        self.root, self.attrs = root, tuple(attrs)
+        self._entries = {}  # id of node -> (node, keys)
+        self._buckets = {}  # key -> {id of node: node}. Key: node type, or (attribute name, value).
+        for node, _, _ in root._walk('pre', None, False, True, False):
+            self._add(node)
+        _node_indexes.add(self)
+
+    def find(self, node_type=None, **attrs) -> List[ADFObject]:
+        """
+        Nodes of the type with the attribute values, in the order they were indexed. e.g. find('taskItem', state='TODO')
+        The smallest set of nodes indexed for one of the conditions is checked against the others.
+        Nodes detached from the document since they were indexed are skipped.
+        :param node_type: Type of the nodes. Any type if not specified.
+        :param attrs: Values of the attributes. At least one indexed attribute is required without node_type.
+        :return: List of ADFObject
+        """
+        keys = [(name, value) for name, value in attrs.items() if name in self.attrs]
+        if node_type is not None:
+            keys.append(node_type)
+        if not keys:
+            raise ValueError(f'Specify the node type or one of the attributes indexed: {self.attrs}')
+        candidates = min((self._buckets.get(key, {}) for key in keys), key=len)
+        found = []
+        for node_id, node in list(candidates.items()):
+            if _root_node(node) is not self.root:
+                self._remove(node_id)
+            elif (node_type is None or node.type == node_type) and \
+                    all((node.local_info.get('attrs') or {}).get(name) == value for name, value in attrs.items()):
+                found.append(node)
+        return found
+
+    def find_one(self, node_type=None, **attrs):
+        """
+        First node found by find(), e.g. find_one(localId='...').
+        :return: ADFObject or None
+        """
+        return next(iter(self.find(node_type, **attrs)), None)
+
+    def _node_keys(self, node):
+        keys = [node.type]
+        if attrs := node.local_info.get('attrs'):
+            keys.extend(
+                (name, value) for name in self.attrs
+                if isinstance(value := attrs.get(name), (str, int, float, bool))
+            )
+        return keys
+
+    def _add(self, node):
+        if (node_id := id(node)) in self._entries:
+            self._remove(node_id)
+        self._entries[node_id] = (node, keys := self._node_keys(node))
+        for key in keys:
+            self._buckets.setdefault(key, {})[node_id] = node
+
+    def _remove(self, node_id):
+        _, keys = self._entries.pop(node_id)
+        for key in keys:
+            bucket = self._buckets[key]
+            del bucket[node_id]
+            if not bucket:
+                del self._buckets[key]
+
+    def _update(self, node, field, values):
+        # Called for the nodes of the document when a field is changed, with the child nodes added.
+        if field == 'content':
+            for child_node in values:
+                for sub_node, _, _ in child_node._walk('pre', None, False, True, False):
+                    self._add(sub_node)
+        elif field != 'marks' and node.is_node:
+            self._add(node)
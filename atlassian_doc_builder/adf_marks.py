@@ -10,6 +10,8 @@ ADFStrong, ADFEm, ADFStrike, ADFCode, ADFUnderline = tuple(
 
 
 class ADFLink(ADFObject.node_class_factory('link')):
+    __slots__ = ()
+
     def __init__(self, url=None, chain_mode=True, **kwargs):
         new_kwargs = {k: v for k, v in kwargs.items() if k != 'attrs'}
         new_attrs = {k: v for k, v in kwargs.get('attrs', {}).items() if k != 'href'}
@@ -27,6 +29,8 @@ class ADFLink(ADFObject.node_class_factory('link')):
 
 
 class ADFBreakout(ADFObject.node_class_factory('breakout')):
+    __slots__ = ()
+
     def __init__(self, mode=None, chain_mode=True, **kwargs):
         new_kwargs = {k: v for k, v in kwargs.items() if k != 'attrs'}
         super(ADFBreakout, self).__init__(chain_mode=chain_mode, **new_kwargs)
@@ -43,6 +47,8 @@ class ADFBreakout(ADFObject.node_class_factory('breakout')):
 
 
 class ADFSubsup(ADFObject.node_class_factory('subsup')):
+    __slots__ = ()
+
     def __init__(self, type=None, chain_mode=True, **kwargs):
         new_kwargs = {k: v for k, v in kwargs.items() if k != 'attrs'}
         super(ADFSubsup, self).__init__(chain_mode=chain_mode, **new_kwargs)
@@ -59,6 +65,8 @@ class ADFSubsup(ADFObject.node_class_factory('subsup')):
 
 
 class ADFTextColor(ADFObject.node_class_factory('textColor')):
+    __slots__ = ()
+
     def __init__(self, color=None, chain_mode=True, **kwargs):
         new_kwargs = {k: v for k, v in kwargs.items() if k != 'attrs'}
         super(ADFTextColor, self).__init__(chain_mode=chain_mode, **new_kwargs)
@@ -75,6 +83,8 @@ class ADFTextColor(ADFObject.node_class_factory('textColor')):
 
 
 class ADFAlignment(ADFObject.node_class_factory('alignment')):
+    __slots__ = ()
+
     def __init__(self, align=None, chain_mode=True, **kwargs):
         new_kwargs = {k: v for k, v in kwargs.items() if k != 'attrs'}
         super(ADFAlignment, self).__init__(chain_mode=chain_mode, **new_kwargs)
@@ -91,6 +101,8 @@ class ADFAlignment(ADFObject.node_class_factory('alignment')):
 
 
 class ADFIndentation(ADFObject.node_class_factory('indentation')):
+    __slots__ = ()
+
     def __init__(self, level=None, chain_mode=True, **kwargs):
         new_kwargs = {k: v for k, v in kwargs.items() if k != 'attrs'}
         super(ADFIndentation, self).__init__(chain_mode=chain_mode, **new_kwargs)
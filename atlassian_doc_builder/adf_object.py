@@ -1,56 +1,245 @@
+import gc
+import hashlib
 import json
 import logging
+import os
 import re
-import urllib.request
+import weakref
+from collections import deque
 from functools import lru_cache as cache
 from typing import Union
 
+import jsonschema
+
+from . import adf_schema_tables
+from .adf_frozen import FrozenDict, FrozenList, freeze, thaw
+from .adf_schema_compiler import _resolve_types, decode_mark_list, decode_node_list
+from .adf_schema_store import SCHEMA_URL, SCHEMA_SOURCES, load_schema
+
 logger = logging.getLogger(__name__)
 
+_schema_config = {
+    'source': os.environ.get('ADF_SCHEMA_SOURCE', 'bundled'),
+    'url': os.environ.get('ADF_SCHEMA_URL', SCHEMA_URL),
+    'cache_dir': None,
+}
+
 
 @cache
 def adf_schema():
-    with urllib.request.urlopen('https://go.atlassian.com/adf-json-schema') as response:
-        return json.load(response)
+    return load_schema(**_schema_config)
+
+
+def _short_circuit_any_of(full_any_of):
+    def any_of(validator, subschemas, instance, schema):
+        # Stop at the first matching branch. Collect the errors of every branch only when nothing matches.
+        if any(validator.evolve(schema=subschema).is_valid(instance) for subschema in subschemas):
+            return
+        yield from full_any_of(validator, subschemas, instance, schema)
+
+    return any_of
+
+
+def _local_ref(full_ref, definitions):
+    def ref(validator, reference, instance, schema):
+        # Resolve "#/definitions/..." with a dict lookup. Anything else goes through the full resolver.
+        if reference.startswith('#/definitions/') and (subschema := definitions.get(reference[14:])) is not None:
+            yield from validator.descend(instance, subschema)
+        else:
+            yield from full_ref(validator, reference, instance, schema)
+
+    return ref
+
+
+@cache
+def adf_validator():
+    """
+    Validator compiled from the current schema. The meta-schema is checked once.
+    Shared across threads, the validator holds no per-call state.
+    :return: jsonschema Validator
+    """
+    schema = adf_schema()
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    validator_class = jsonschema.validators.extend(validator_class, {
+        'anyOf': _short_circuit_any_of(validator_class.VALIDATORS['anyOf']),
+        '$ref': _local_ref(validator_class.VALIDATORS['$ref'], schema.get('definitions', {})),
+    })
+    return validator_class(schema)
+
+
+@cache
+def adf_type_validators():
+    """
+    Validators of each node/mark type against its own definition in the schema.
+    Items of "content" and "marks" are not checked, the child nodes are validated by their own definition.
+    The types of tuple-form items are listed by adf_item_types().
+    :return: {node_type: jsonschema Validator}
+    """
+    definitions, validator = adf_schema()['definitions'], adf_validator()
+    type_validators = {}
+    for key, value in definitions.items():
+        if key[-5:] not in ('_node', '_mark') or value.get('type') != 'object':
+            continue
+        properties = dict(value['properties'])
+        for field in ('content', 'marks'):
+            if field in properties:
+                field_schema = properties[field]
+                if '$ref' in field_schema:
+                    field_schema = definitions[field_schema['$ref'].split('/')[-1]]
+                properties[field] = {k: v for k, v in field_schema.items() if k != 'items'}
+        type_validators[value['properties']['type']['enum'][0]] = validator.evolve(
+            schema={**value, 'properties': properties}
+        )
+    return type_validators
+
+
+@cache
+def adf_item_types():
+    """
+    Child types allowed at each position of the tuple-form "content" and "marks" (e.g. the first child of listItem).
+    Children after the listed positions are only checked against adf_allowed_types().
+    :return: {node_type: {field: tuple of frozenset or None}}, only for the fields with tuple-form items.
+    """
+    definitions = adf_schema()['definitions']
+    item_types = {}
+    for key, value in definitions.items():
+        if key[-5:] not in ('_node', '_mark') or value.get('type') != 'object':
+            continue
+        node_type = value['properties']['type']['enum'][0]
+        item_types.pop(node_type, None)  # The same definition as adf_type_validators(), the last one wins.
+        for field in ('content', 'marks'):
+            field_schema = value['properties'].get(field, {})
+            if '$ref' in field_schema:
+                field_schema = definitions[field_schema['$ref'].split('/')[-1]]
+            if isinstance(items := field_schema.get('items'), list):
+                item_types.setdefault(node_type, {})[field] = tuple(
+                    frozenset(resolved) if (resolved := _resolve_types(item, definitions)) is not None else None
+                    for item in items
+                )
+    return item_types
+
+
+def set_schema_source(source='bundled', url=SCHEMA_URL, cache_dir=None):
+    """
+    Select where the ADF schema of this process comes from. Cached schema and node tables are reset.
+    :param source: "bundled" -> Snapshot shipped with the package. No network access.
+                   "cached"  -> On-disk cache, refreshed with ETag/If-Modified-Since.
+                   "live"    -> Download on every process start.
+    :param url: Location of the schema for "cached" and "live".
+    :param cache_dir: Directory of the on-disk cache for "cached".
+    """
+    if source not in SCHEMA_SOURCES:
+        raise ValueError(f'Unknown schema source: {source}. Choose from {SCHEMA_SOURCES}.')
+    _schema_config.update(source=source, url=url, cache_dir=cache_dir)
+    adf_schema.cache_clear()
+    adf_validator.cache_clear()
+    adf_type_validators.cache_clear()
+    adf_item_types.cache_clear()
+    adf_node_list.cache_clear()
+    adf_mark_list.cache_clear()
+    adf_allowed_types.cache_clear()
+    _trusted_type_details.cache_clear()
+    _reset_type_details()
+    _shared_marks.clear()
+
+
+@cache
+def adf_mark_list():
+    if _schema_config['source'] == 'bundled':
+        return adf_schema_tables.MARK_LIST
+    return decode_mark_list(adf_schema())
+
+
+@cache
+def adf_node_list():
+    if _schema_config['source'] == 'bundled':
+        return adf_schema_tables.NODE_LIST
+    return decode_node_list(adf_schema())
+
+
+_RENDER_SKIPPED_FIELDS = frozenset(('type', 'content'))
+_NUMBER_TYPES = (bool, int, float)
+_DIGEST_ENCODER = json.JSONEncoder(sort_keys=True, separators=(',', ':'), check_circular=False)
+_CHILD_DIGEST_PREFIXES = {'content': b'\0content', 'marks': b'\0marks'}
+_NO_SHARED_FIELDS = frozenset()  # One instance for all the nodes, an empty frozenset is not a singleton.
+_JSON_ENCODER = json.JSONEncoder()  # Same settings as json.dumps() with default arguments.
 
 
-def _decode_schema_with_filter(schema, filter_expression):
+@cache
+def adf_allowed_types():
+    """
+    Child types allowed in the "content" and "marks" of each node type. None if the field is not constrained.
+    :return: {node_type: {'content': frozenset or None, 'marks': frozenset or None}}
+    """
     return {
-        v['properties']['type']['enum'][0]: {
-            'prop': {
-                prop_key: prop_detail.get('type', 'string') if prop_key not in ('attrs', 'content') else
-                {'attrs': 'object', 'content': 'array'}[prop_key]
-
-                for prop_key, prop_detail in v.get('properties', {}).items()
-                if prop_key != 'type'
-            },
-            'required': tuple(v.get('required', [])),
-            'attrs': v.get('properties', {}).get('attrs', {})
+        node_type: {
+            field: frozenset(allowed) if (allowed := node_detail.get(f'allowed_{field}')) is not None else None
+            for field in ('content', 'marks')
         }
-        for k, v in schema['definitions'].items()
-        if filter_expression(k, v)
+        for node_type, node_detail in adf_node_list().items()
     }
 
 
+_TYPE_DETAIL_NAMES = ('is_node', 'is_mark', '_object_list', '_node_prop')
+_resolved_type_classes = weakref.WeakSet()
+
+
+class _TypeDetail:
+    """
+    Schema detail of the node type of a class from node_class_factory(), e.g. "_node_prop".
+    Looked up on the first access and stored on the class for all its instances, until the schema source changes.
+    """
+
+    def __set_name__(self, owner, name):
+        self.owner, self.name = owner, name
+
+    def __get__(self, instance, owner=None):
+        is_node, object_list, node_prop, _ = _trusted_type_details(self.owner.type)
+        for name, value in zip(_TYPE_DETAIL_NAMES, (is_node, not is_node, object_list, node_prop)):
+            setattr(self.owner, name, value)
+        _resolved_type_classes.add(self.owner)
+        return getattr(self.owner, self.name)
+
+
+def _new_type_details(node_class=None):
+    type_details = {name: _TypeDetail() for name in _TYPE_DETAIL_NAMES}
+    if node_class is not None:
+        for name, type_detail in type_details.items():
+            type_detail.__set_name__(node_class, name)
+    return type_details
+
+
+def _reset_type_details():
+    for node_class in list(_resolved_type_classes):
+        for name, type_detail in _new_type_details(node_class).items():
+            setattr(node_class, name, type_detail)
+    _resolved_type_classes.clear()
+
+
 @cache
-def adf_mark_list():
-    return _decode_schema_with_filter(
-        adf_schema(),
-        lambda key, value: 'mark' in key[-4:] and value.get('type') == 'object'
+def _slot_descriptors(node_class):
+    # Read and write the slots through their descriptors, class attributes may shadow them. e.g. "type".
+    return tuple(
+        (name, base.__dict__[name]) for base in node_class.__mro__ for name in base.__dict__.get('__slots__', ())
     )
 
 
 @cache
-def adf_node_list():
-    return _decode_schema_with_filter(
-        adf_schema(),
-        lambda key, value: 'node' in key[-4:] and value.get('type') == 'object'
-    )
+def _has_extra_state(node_class):
+    # Slots added by subclasses (e.g. the width of tables) or an instance dict of subclasses without __slots__.
+    return len(_slot_descriptors(node_class)) > len(ADFObject.__slots__) or node_class.__dictoffset__ != 0
 
 
 class ADFObject(object):
+    # Nodes of the classes from node_class_factory() take "type" from their class, other nodes hold it in the slot.
+    # "is_node", "is_mark", "_object_list" and "_node_prop" are shared by all the nodes of a type.
+    __slots__ = ('chain_mode', '_parent', '_validated', '_rendered', '_digest', '_shared_fields', 'local_info', 'type')
+    _type_on_class = False
     PATTERN_EXP, PATTERN_VAR = re.compile(r'\{[^}]+\}'), re.compile('[0-9a-zA-Z_]+')
     node_class_registry, node_class_attr_name = {}, '__adf_type__'
+    # Reject child nodes not allowed by the schema when they are added. e.g. table in listItem.
+    check_structure = os.environ.get('ADF_CHECK_STRUCTURE', '') not in ('', '0')
 
     def __init__(self, node_type, chain_mode=True, **kwargs):
         """
@@ -60,21 +249,22 @@ class ADFObject(object):
             chain_mode: True  -> Return Original Node
             chain_mode: False -> Return the new Node
         """
-        node_list, mark_list = adf_node_list(), adf_mark_list()
         self.chain_mode = chain_mode
         self._parent = None
+        self._validated, self._rendered, self._digest = False, None, None
+        self._shared_fields = _NO_SHARED_FIELDS
 
-        self.type = node_type
-        self.is_node, self.is_mark = self.type in node_list, self.type in mark_list
-        if not self.is_node and not self.is_mark:
-            raise RuntimeError(f'{node_type} does not exists in the schema.')
-
-        self._object_list = node_list if self.is_node else mark_list
-        self._node_prop = self._object_list[self.type]['prop']
+        if not self._type_on_class:
+            _trusted_type_details(node_type)  # Raise RuntimeError if the type does not exist.
+            self.type = node_type
+        else:
+            # The type of the class, e.g. "decisionList" for ADFDecisionList. A base class from node_class_factory()
+            # (e.g. ADFTaskList) passes its own type up the chain of __init__.
+            node_type = self.type
         self.local_info = {
             prop_key: ADFObject._default_field(prop_type)
             for prop_key, prop_type in self._node_prop.items()
-            if prop_key in self._object_list[self.type]['required']
+            if prop_key in self._object_list[node_type]['required']
         }
         if kwargs:
             for key, value in kwargs.items():
@@ -82,7 +272,24 @@ class ADFObject(object):
 
     @property
     def parent(self):
-        return self._parent
+        return self._parent if self._parent is not _SHARED_PARENT else None
+
+    # Overridden by the class attributes of the classes from node_class_factory().
+    @property
+    def is_node(self):
+        return _trusted_type_details(self.type)[0]
+
+    @property
+    def is_mark(self):
+        return not _trusted_type_details(self.type)[0]
+
+    @property
+    def _object_list(self):
+        return _trusted_type_details(self.type)[1]
+
+    @property
+    def _node_prop(self):
+        return _trusted_type_details(self.type)[2]
 
     def add(self, key_or_node, chain_mode=None, **kwargs):
         """
@@ -93,8 +300,17 @@ class ADFObject(object):
         :return: self.chain_mode ? Current node : New Node
         """
         new_chain_mode = self.chain_mode if chain_mode is None else chain_mode
-        new_node = key_or_node if issubclass(type(key_or_node), ADFObject) else ADFObject(key_or_node,
-                                                                                          chain_mode=new_chain_mode)
+        if issubclass(type(key_or_node), ADFObject):
+            new_node = key_or_node
+        elif self.chain_mode and not kwargs and (shared := _shared_marks.get((('type', key_or_node),))) is not None:
+            new_node = shared
+        else:
+            new_node = ADFObject(key_or_node, chain_mode=new_chain_mode)
+            if self.chain_mode and new_node.is_mark:
+                # The new mark is not returned. Share it with the other nodes having the same mark.
+                for field, value in kwargs.items():
+                    new_node.assign_info(field, value)
+                new_node, kwargs = shared_mark(new_node), {}
         new_node_field_name = 'marks' if new_node.is_mark else 'content'
         if new_node_field_name not in self._node_prop:
             raise ValueError(f'Adding a {new_node_field_name}: {new_node.type} to node: {self.type} is forbidden.')
@@ -114,38 +330,414 @@ class ADFObject(object):
         nodes = [nodes] if isinstance(nodes, ADFObject) else nodes
         return self.assign_info('content', *nodes)
 
-    def render(self):
+    def clone(self):
+        """
+        Copy this node and all the child nodes. The copy has no parent.
+        Field values (e.g. "attrs") and the render are shared by the copies, a field is copied on the first change by
+        assign_info() or apply_variable(). Modify the nodes with them only, not through local_info.
+        :return: New Node
+        """
+        top_node = self._clone_node()
+        clone_stack = [(self, top_node)]
+        while clone_stack:
+            source_node, new_node = clone_stack.pop()
+            for field in ('content', 'marks'):
+                if field not in source_node.local_info:
+                    continue
+                children, source_children = [], source_node.local_info[field]
+                for child_node in list.__iter__(source_children):
+                    if isinstance(child_node, ADFObject) and child_node._parent is not _SHARED_PARENT:
+                        clone_stack.append((child_node, child_node := child_node._clone_node()))
+                        child_node._parent = new_node
+                    children.append(child_node)  # Children never accessed of a lazily loaded node are shared.
+                if isinstance(source_children, LazyContentList):
+                    children = source_children._with_children(children, new_node)
+                new_node.local_info[field] = children
+        return top_node
+
+    def _clone_node(self):
+        node_class = self.__class__
+        new_node = node_class.__new__(node_class)
+        if _has_extra_state(node_class):
+            new_node.__setstate__(self.__getstate__())
+        elif not node_class._type_on_class:
+            new_node.type = self.type
+        new_node.chain_mode, new_node._validated, new_node._rendered = self.chain_mode, self._validated, self._rendered
+        new_node._digest, new_node._parent, new_node.local_info = self._digest, None, dict(self.local_info)
+        self._share_fields(new_node)
+        return new_node
+
+    def _share_fields(self, other_node):
+        # Mark the dict and list fields as shared by the two nodes. Each one is copied on the first change.
+        self._shared_fields = other_node._shared_fields = _shared_field_set(tuple(
+            field for field, value in self.local_info.items()
+            if field not in ('content', 'marks') and isinstance(value, (dict, list))
+        ))
+
+    def __getstate__(self):
+        state = dict(getattr(self, '__dict__', {}))  # Subclasses without __slots__.
+        for name, descriptor in _slot_descriptors(type(self)):
+            try:
+                state[name] = descriptor.__get__(self)
+            except AttributeError:
+                pass  # Not set, e.g. "type" of the classes from node_class_factory().
+        return state
+
+    def __setstate__(self, state):
+        descriptors = dict(_slot_descriptors(type(self)))
+        self._digest = None
+        for name, value in state.items():
+            if name in descriptors:
+                descriptors[name].__set__(self, value)
+            else:
+                self.__dict__[name] = value
+
+    def _own_field(self, field):
+        # Copy a field value shared with a clone before modifying it in place.
+        if field in self._shared_fields:
+            self.local_info[field] = thaw(self.local_info[field])
+            self._shared_fields = self._shared_fields - {field}
+
+    def walk(self, order='pre', prune=None, marks=False, materialize=True):
+        """
+        Iterate over the current node and all the nodes under it, without recursion.
+        The children of a node are read when the iteration resumes after it, stop at any time without visiting them.
+        :param order: "pre": Depth-first, each node before its children. "post": Depth-first, each node after its
+            children. "bfs": Breadth-first, level by level.
+        :param prune: Function called with each node. Nodes for which it returns True are skipped with all the nodes
+            under them.
+        :param marks: Visit the marks of each node too, before its content.
+        :param materialize: Visit the children never accessed of lazily loaded nodes, see LazyContentList.
+            Otherwise, they are skipped.
+        :return: Generator of (node, depth, path). The path is the JSON pointer from the current node,
+            e.g. "/content/1/marks/0", see apply_patch().
+        """
+        if order not in ('pre', 'post', 'bfs'):
+            raise ValueError(f'Unknown order "{order}", expected "pre", "post" or "bfs".')
+        return self._walk(order, prune, marks, materialize, True)
+
+    def _walk(self, order, prune, marks, materialize, paths):
+        # walk(), without building the paths when not needed.
+        if prune is not None and prune(self):
+            return
+        fields = ('marks', 'content') if marks else ('content',)
+        field_set = frozenset(fields)
+        # Depth-first: The children of each node on the stack are read one by one, when needed.
+        if order == 'pre':
+            yield (self, 0, '')
+            walk_stack = [_child_entries(self, 0, '', prune, fields, materialize, paths)]
+            while walk_stack:
+                if (cur_entry := next(walk_stack[-1], None)) is None:
+                    walk_stack.pop()
+                    continue
+                yield cur_entry
+                if not field_set.isdisjoint(cur_entry[0].local_info):
+                    walk_stack.append(_child_entries(*cur_entry, prune, fields, materialize, paths))
+        elif order == 'post':
+            walk_stack = [((self, 0, ''), _child_entries(self, 0, '', prune, fields, materialize, paths))]
+            while walk_stack:
+                if (cur_entry := next(walk_stack[-1][1], None)) is None:
+                    yield walk_stack.pop()[0]
+                elif field_set.isdisjoint(cur_entry[0].local_info):
+                    yield cur_entry
+                else:
+                    walk_stack.append((cur_entry, _child_entries(*cur_entry, prune, fields, materialize, paths)))
+        else:
+            walk_queue = deque([(self, 0, '')])
+            while walk_queue:
+                yield (cur_entry := walk_queue.popleft())
+                if not field_set.isdisjoint(cur_entry[0].local_info):
+                    walk_queue.extend(_child_entries(*cur_entry, prune, fields, materialize, paths))
+
+    def render(self, mutable=False):
         """
         Build a dictionary object with the current node and all the nodes under it.
+        The result is cached on each node and rebuilt only for the nodes changed since the last call.
+        :param mutable: Return a modifiable deep copy instead of the read-only cached result.
         :return: dict
         """
-        # BFS Rendering.
-        # Marks does not have further child node. Recursive call accepted.
-        render_queue, top_node_rendered = [(self, None)], None
-        while render_queue:
-            cur_node, parent_node = render_queue.pop(0)
-            current_level_rendered = {
-                prop_key: prop_value
-                for prop_key, prop_value in cur_node.local_info.items()
-                if prop_value is not None and (
-                        not isinstance(prop_value, dict) or not isinstance(prop_value, list) or len(prop_value) > 0
-                ) and prop_key not in {'type', 'content'}
-            }
-            current_level_rendered['type'] = cur_node.type
+        if self._rendered is None:
+            # Nodes without a cached render, parents before their children. Subtrees with a cached render are skipped.
+            # Rendered in the reverse order: The render of all children is ready before their parent.
+            pending, render_stack = [], [self]
+            while render_stack:
+                cur_node = render_stack.pop()
+                pending.append(cur_node)
+                if (children := cur_node.local_info.get('content')) is not None:
+                    # Raw children of a lazily loaded node are not ADFObject, they are frozen by _render_fields().
+                    render_stack.extend([
+                        child_node for child_node in list.__iter__(children)
+                        if isinstance(child_node, ADFObject) and child_node._rendered is None
+                    ])
+            # The renders do not form cycles. The cyclic GC is paused, its collections would scan all the renders
+            # created so far again and again, and the cost per node would grow with the size of the document.
+            gc_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                for cur_node in reversed(pending):
+                    cur_node._rendered = cur_node._render_fields()
+            finally:
+                if gc_enabled:
+                    gc.enable()
+
+        return thaw(self._rendered) if mutable else self._rendered
+
+    def _render_fields(self):
+        # Render the current node with the cached render of its children. Marks does not have further child node.
+        rendered = {}
+        for prop_key, prop_value in self.local_info.items():
+            if prop_value is None or prop_key in _RENDER_SKIPPED_FIELDS:
+                continue
+            rendered[prop_key] = FrozenList([mark.render() for mark in prop_value]) if prop_key == 'marks' else \
+                freeze(prop_value)
+        rendered['type'] = self.type
+        if 'content' in self.local_info:
+            rendered['content'] = FrozenList([
+                child_node._rendered if isinstance(child_node, ADFObject) else child_node
+                for child_node in _raw_children(self.local_info['content'], freeze_raw=True)
+            ])
+        return FrozenDict(rendered)
+
+    def iter_json_chunks(self):
+        """
+        Generate the JSON text of the current node piece by piece, without building the rendered tree.
+        Memory usage is bounded by the depth of the tree. The output is identical to json.dumps(node.render()).
+        :return: Generator of str
+        """
+        encode = _JSON_ENCODER.encode
+        # Each level: [iterator of child nodes, closing text, is first child]
+        json_stack = [[iter((self,)), '', True]]
+        while json_stack:
+            level = json_stack[-1]
+            cur_node = next(level[0], None)
+            if cur_node is None:
+                json_stack.pop()
+                if level[1]:
+                    yield level[1]
+                continue
+            if not level[2]:
+                yield ', '
+            level[2] = False
+
+            if not isinstance(cur_node, ADFObject):
+                yield encode(cur_node)  # Never accessed child of a lazily loaded node.
+            elif cur_node._rendered is not None:
+                yield encode(cur_node._rendered)
+            elif 'content' not in cur_node.local_info:
+                yield encode(cur_node._json_fields())
+            else:
+                # "content" is always the last key. Open the list after the other fields.
+                yield encode(cur_node._json_fields())[:-1] + ', "content": ['
+                json_stack.append([_raw_children(cur_node.local_info['content']), ']}', True])
+
+    def write_json(self, fp, buffer_size=1 << 16):
+        """
+        Write the JSON text of the current node to a text stream, see iter_json_chunks().
+        :param fp: Text stream with write(), e.g. a file opened in text mode or socket.makefile('w').
+        :param buffer_size: Number of characters collected before each write.
+        :return: Current Node
+        """
+        buffered, buffered_size = [], 0
+        for chunk in self.iter_json_chunks():
+            buffered.append(chunk)
+            buffered_size += len(chunk)
+            if buffered_size >= buffer_size:
+                fp.write(''.join(buffered))
+                buffered, buffered_size = [], 0
+        if buffered:
+            fp.write(''.join(buffered))
+        return self
+
+    def _json_fields(self):
+        # Fields of the current node as in render(), without content and without filling the render cache.
+        fields = {
+            prop_key: prop_value if prop_key != 'marks' else [
+                mark._rendered if mark._rendered is not None else mark._json_fields() for mark in prop_value
+            ]
+            for prop_key, prop_value in self.local_info.items()
+            if prop_value is not None and prop_key not in _RENDER_SKIPPED_FIELDS
+        }
+        fields['type'] = self.type
+        return fields
+
+    def validate_tree(self):
+        """
+        Validate the current node and all the nodes under it, each against the definition of its own type.
+        Subtrees unchanged since the last successful validation are skipped.
+        Rules depending on the parent (e.g. marks of a paragraph in a table cell) are checked by ADFDoc.validate() only.
+        Raise jsonschema.ValidationError when validation fails.
+        :return: Current Node
+        """
+        type_validators, allowed_types, item_types = adf_type_validators(), adf_allowed_types(), adf_item_types()
+        visited, check_stack = [], [self]
+        while check_stack:
+            cur_node = check_stack.pop()
+            if cur_node._validated:
+                continue
+            instance = {k: v for k, v in cur_node.local_info.items() if v is not None and k not in ('content', 'marks')}
+            instance['type'] = cur_node.type
+            for field in ('content', 'marks'):
+                if field not in cur_node.local_info:
+                    continue
+                # Child nodes are validated separately. Only the number of children matters here.
+                instance[field] = [None] * len(cur_node.local_info[field])
+                allowed_children = allowed_types[cur_node.type][field]
+                positions = item_types.get(cur_node.type, {}).get(field, ())
+                for i, child_node in enumerate(cur_node.local_info[field]):
+                    if allowed_children is not None and child_node.type not in allowed_children or \
+                            i < len(positions) and positions[i] is not None and child_node.type not in positions[i]:
+                        raise jsonschema.ValidationError(
+                            f'"{child_node.type}" is not allowed at {i} in the {field} of "{cur_node.type}"')
+                    check_stack.append(child_node)
+            if (error := next(type_validators[cur_node.type].iter_errors(instance), None)) is not None:
+                raise error
+            visited.append(cur_node)
+
+        for cur_node in visited:
+            cur_node._validated = True
+        return self
+
+    def _invalidate(self):
+        # Drop the validation result, the cached render and digest of the current node and its ancestors.
+        # Nodes under a validated/rendered/digested ancestor are validated/rendered/digested.
+        # Stop at the first node already invalidated.
+        cur_node = self
+        while cur_node is not None and \
+                (cur_node._validated or cur_node._rendered is not None or cur_node._digest is not None):
+            cur_node._validated, cur_node._rendered, cur_node._digest = False, None, None
+            cur_node = cur_node._parent
+
+    def __hash__(self):
+        """
+        Structural hash of the current node and all the nodes under it, equal for nodes with an equal render.
+        Taken from the structural digest, see digest(). Do not modify a node while it is a key of a dict or in a set.
+        """
+        return hash(self.digest())
+
+    def digest(self) -> bytes:
+        """
+        Structural digest of the current node and all the nodes under it: 128-bit BLAKE2b of the canonical JSON of the
+        fields of each node and the digests of its children. Equal for nodes with an equal render, and different for
+        nodes with a different render unless a collision of BLAKE2b is found.
+        Cached on each node like render(), only the changed nodes and their ancestors are digested again.
+        :return: bytes
+        """
+        # Post-order, the same as render().
+        digest_stack = [(self, False)] if self._digest is None else []
+        while digest_stack:
+            cur_node, children_ready = digest_stack.pop()
+            if children_ready:
+                cur_node._digest = cur_node._digest_fields()
+                continue
+            digest_stack.append((cur_node, True))
+            for field in ('content', 'marks'):
+                if field in cur_node.local_info:
+                    digest_stack.extend(
+                        (child_node, False) for child_node in _raw_children(cur_node.local_info[field])
+                        if isinstance(child_node, ADFObject) and child_node._digest is None
+                    )
+        return self._digest
+
+    def _digest_fields(self):
+        # Same as _value_digest(self.render()), with the cached digest of the children.
+        fields = _plain_fields(self)
+        fields['type'] = self.type
+        return _fields_digest(fields, (
+            (field, [
+                child_node._digest if isinstance(child_node, ADFObject) else _value_digest(child_node)
+                for child_node in _raw_children(self.local_info[field])
+            ])
+            for field in ('content', 'marks') if field in self.local_info
+        ))
+
+    def dedupe(self):
+        """
+        Make the identical subtrees under the current node share their storage. Field values (e.g. "attrs" and "text")
+        and the render are shared by all the copies of a subtree, a field is copied on the first change like clone().
+        Marks are replaced by shared marks, see shared_mark().
+        The first copy of each repeated subtree is rendered once, render() skips the other copies.
+        Children never accessed of a lazily loaded node are not changed.
+        :return: Current Node
+        """
+        self.digest()
+        first_copies, repeated_copies = {}, []  # digest -> [first copy of each subtree], [(first copy, repeated copy)]
+        dedupe_stack = [self]
+        while dedupe_stack:
+            cur_node = dedupe_stack.pop()
             if 'marks' in cur_node.local_info:
-                current_level_rendered['marks'] = [child_node.render() for child_node in cur_node.local_info['marks']]
+                marks = cur_node.local_info['marks']
+                for index, mark in enumerate(marks):
+                    if mark._parent is not _SHARED_PARENT:
+                        marks[index] = _share_mark(mark)
+            same_digest_nodes = first_copies.setdefault(cur_node._digest, [])
+            if (first_copy := next((node for node in same_digest_nodes if node == cur_node), None)) is not None:
+                repeated_copies.append((first_copy, cur_node))
+                continue
+            same_digest_nodes.append(cur_node)
             if 'content' in cur_node.local_info:
-                current_level_rendered['content'] = []
-                render_queue.extend(
-                    (child_node, current_level_rendered) for child_node in cur_node.local_info['content']
+                dedupe_stack.extend(
+                    child_node for child_node in _raw_children(cur_node.local_info['content'])
+                    if isinstance(child_node, ADFObject)
                 )
 
-            if parent_node is not None:
-                parent_node['content'].append(current_level_rendered)
-            else:
-                top_node_rendered = current_level_rendered
+        for first_copy, repeated_copy in repeated_copies:
+            first_copy.render()
+            share_stack = [(first_copy, repeated_copy)]
+            while share_stack:
+                node, other_node = share_stack.pop()
+                for field, value in node.local_info.items():
+                    if field not in ('content', 'marks') and other_node.local_info.get(field) is not None:
+                        other_node.local_info[field] = value
+                node._share_fields(other_node)
+                other_node._rendered, other_node._digest = node._rendered, node._digest
+                other_node._validated = other_node._validated or node._validated
+                if 'marks' in node.local_info:
+                    other_marks = other_node.local_info['marks']
+                    for index, mark in enumerate(node.local_info['marks']):
+                        if mark._parent is _SHARED_PARENT:
+                            other_marks[index] = mark
+                if 'content' in node.local_info:
+                    share_stack.extend(
+                        (child_node, other_child_node) for child_node, other_child_node in zip(
+                            _raw_children(node.local_info['content']),
+                            _raw_children(other_node.local_info['content'])
+                        )
+                        if isinstance(child_node, ADFObject) and isinstance(other_child_node, ADFObject)
+                    )
+        return self
 
-        return top_node_rendered
+    def __eq__(self, other):
+        """
+        Structural equality: Nodes with an equal render are equal, regardless of their class and parent.
+        Subtrees with a different digest are not compared further.
+        """
+        if not isinstance(other, ADFObject):
+            return NotImplemented
+        if self.digest() != other.digest():
+            return False
+        # All the nodes under are digested.
+        compare_stack = [(self, other)]
+        while compare_stack:
+            node, other_node = compare_stack.pop()
+            if node is other_node:
+                continue
+            if not isinstance(node, ADFObject) or not isinstance(other_node, ADFObject):
+                # Child never accessed of a lazily loaded node.
+                if not _values_equal(_render_of(node), _render_of(other_node)):
+                    return False
+                continue
+            if node._digest != other_node._digest or node.type != other_node.type or \
+                    not _values_equal(_plain_fields(node), _plain_fields(other_node)):
+                return False
+            for field in ('content', 'marks'):
+                if (field in node.local_info) != (field in other_node.local_info):
+                    return False
+                if field in node.local_info:
+                    children, other_children = node.local_info[field], other_node.local_info[field]
+                    if len(children) != len(other_children):
+                        return False
+                    compare_stack.extend(zip(_raw_children(children), _raw_children(other_children)))
+        return True
 
     def assign_info(self, field, *values, **kwargs):
         """
@@ -155,22 +747,15 @@ class ADFObject(object):
         :param kwargs: Values to be added to a dict.
         :return: Current Node
         """
-        if field not in self._node_prop:
-            raise KeyError(f'"{field}" does not exists in the node "{self.type}"')
-        if field == 'content':
-            values = values[0] if values and isinstance(values[0], list) else values
-            if any(not issubclass(type(node), ADFObject) or not node.is_node for node in values):
-                raise RuntimeError(f'"{field} only accepts ADFObject which is a node.')
-        if field == 'marks':
-            values = values[0] if values and isinstance(values[0], list) else values
-            if any(not issubclass(type(node), ADFObject) or not node.is_mark for node in values):
-                raise RuntimeError(f'"{field} only accepts ADFObject which is a mark.')
+        values = self._checked_values(field, values)
         self.local_info.setdefault(field, ADFObject._default_field(self._node_prop[field]))
+        self._own_field(field)
 
         if isinstance(self.local_info[field], list):
             if field in ('content', 'marks'):
                 for node in values:
-                    node._parent = self
+                    if node._parent is not _SHARED_PARENT:
+                        node._parent = self
             if values:
                 if isinstance(values[0], list):
                     self.local_info[field].extend(values[0])
@@ -188,8 +773,32 @@ class ADFObject(object):
                 raise RuntimeError(f'Specify 1 value for the field "{field}"')
             self.local_info[field] = values[0]
 
+        self._invalidate()
+        _update_index(self, field, values)
+        _update_width(self, field, values)
         return self
 
+    def _checked_values(self, field, values):
+        # Values of assign_info() after the checks of the field. Child nodes are returned as a list or a tuple.
+        if field not in self._node_prop:
+            raise KeyError(f'"{field}" does not exists in the node "{self.type}"')
+        if self._parent is _SHARED_PARENT:
+            raise TypeError(f'The mark "{self.type}" is shared and read-only. Replace it with a new mark instead.')
+        if field == 'content':
+            values = values[0] if values and isinstance(values[0], list) else values
+            if any(not issubclass(type(node), ADFObject) or not node.is_node for node in values):
+                raise RuntimeError(f'"{field} only accepts ADFObject which is a node.')
+        if field == 'marks':
+            values = values[0] if values and isinstance(values[0], list) else values
+            if any(not issubclass(type(node), ADFObject) or not node.is_mark for node in values):
+                raise RuntimeError(f'"{field} only accepts ADFObject which is a mark.')
+        if field in ('content', 'marks') and self.check_structure and \
+                (allowed_children := adf_allowed_types()[self.type][field]) is not None:
+            for node in values:
+                if node.type not in allowed_children:
+                    raise ValueError(f'Adding a {field}: {node.type} to node: {self.type} is forbidden.')
+        return values
+
     def apply_variable(self, **kwargs):
         """
         Replace all format string expressions under this node, including all child nodes.
@@ -197,23 +806,28 @@ class ADFObject(object):
         :param kwargs: Variables to be replaced.
         :return: Current Node
         """
-        resolve_queue = [self]
-        while resolve_queue:
-            cur_obj = resolve_queue.pop(0)
-            if issubclass(type(cur_obj), ADFObject):
-                cur_obj = cur_obj.local_info
-            if isinstance(cur_obj, dict):
+        for cur_node, _, _ in self._walk('bfs', None, True, True, False):
+            # (field of the node, dict in the field)
+            resolve_stack, changed_fields = [(None, cur_node.local_info)], set()
+            while resolve_stack:
+                field, cur_obj = resolve_stack.pop()
                 for item_key, item_value in cur_obj.items():
-                    if item_key in ('content', 'marks'):
-                        resolve_queue.extend(item_value)
+                    item_field = item_key if field is None else field
                     if isinstance(item_value, dict):
-                        resolve_queue.append(item_value)
+                        if field is None and item_key in cur_node._shared_fields:
+                            cur_node._own_field(item_key)
+                            item_value = cur_obj[item_key]
+                        resolve_stack.append((item_field, item_value))
                     if isinstance(item_value, str) and (expressions := ADFObject.PATTERN_EXP.findall(item_value)):
                         invalid_variables = [expression for expression in expressions if
                                              ADFObject.PATTERN_VAR.fullmatch(expression[1:-1].strip()) is None]
                         if invalid_variables:
                             raise ValueError(f'Invalid expression detected: {invalid_variables}')
                         cur_obj[item_key] = item_value.format(**kwargs)
+                        cur_node._invalidate()
+                        changed_fields.add(item_field)
+            for field in changed_fields:
+                _update_index(cur_node, field, ())
 
         return self
 
@@ -236,8 +850,12 @@ class ADFObject(object):
             f'ADFAuto{node_type.capitalize()}',
             (cls,),
             {
+                '__slots__': (),
                 '__init__': __new_init__,
                 ADFObject.node_class_attr_name: node_type,
+                '_type_on_class': True,
+                'type': node_type,
+                **_new_type_details(),
             }
         )
 
@@ -260,33 +878,347 @@ class ADFObject(object):
         ]
 
 
-def load_adf(input_object: Union[dict, list]) -> Union[ADFObject, list]:
+def load_adf(input_object: Union[dict, list], trusted=False, lazy=False) -> Union[ADFObject, list]:
+    """
+    Build ADFObjects from a rendered ADF document or a list of them.
+    :param input_object: dict or list of dict in ADF format.
+    :param trusted: Skip all the checks for input known to be valid, e.g. documents stored by this package.
+        Node constructors are not called, the nodes hold exactly the fields of the input.
+    :param lazy: Build the child nodes on first access, see LazyContentList. Nodes are built as trusted.
+        Do not modify the input afterwards, the children never accessed are rendered from it.
+    :return: ADFObject or list of ADFObject
+    """
     if isinstance(input_object, list):
-        return [load_adf(obj) for obj in input_object]
+        return [load_adf(obj, trusted=trusted, lazy=lazy) for obj in input_object]
 
     if 'type' not in input_object:
         raise ValueError('Loading ADF document with the filed "type" missing.')
-    top_node = None
-
-    build_queue = [([input_object], None)]
-    while build_queue:
-        input_objects, parent_node = build_queue.pop(0)
-        for input_object in input_objects:
-            object_args = {k: v for k, v in input_object.items() if k not in ('type', 'content', 'marks')}
-            new_node = ADFObject.get_last_node_class(node_type := input_object['type'])(
-                node_type=node_type, **object_args)
-
-            for field, value in input_object.items():
-                if field == 'type':
-                    continue
-                if field in ('content', 'marks'):
-                    new_node.assign_info(field)
-                    build_queue.append((value, new_node))
+    if lazy:
+        return _load_adf_lazy(input_object)
+    if trusted:
+        return _load_adf_trusted(input_object)
+    top_node = _load_node(input_object)
+    # The children of each node are built when it is visited, before walk() reads them.
+    sources = {id(top_node): input_object}
+    for cur_node, _, _ in top_node._walk('bfs', None, False, True, False):
+        source = sources.pop(id(cur_node))
+        for field in ('content', 'marks'):
+            for child_source in source.get(field, ()):
+                # A mark loaded before is shared without being built again.
+                if field == 'marks' and (input_key := _mark_key(child_source)) is not None and \
+                        (shared := _shared_marks.get((_LOADED_MARK, input_key))) is not None:
+                    cur_node.add(shared)
                     continue
-                new_node.assign_info(field, value)
+                child_node = _load_node(child_source)
+                if field == 'content':
+                    sources[id(child_node)] = child_source
+                elif (child_node := shared_mark(child_node))._parent is _SHARED_PARENT and input_key is not None:
+                    _shared_marks[(_LOADED_MARK, input_key)] = child_node
+                cur_node.add(child_node)
+    return top_node
 
-            if parent_node is not None:
-                parent_node.add(new_node)
-            else:
-                top_node = new_node
+
+def _load_node(input_object):
+    # Build a node with all the checks, without its children.
+    object_args = {k: v for k, v in input_object.items() if k not in ('type', 'content', 'marks')}
+    new_node = ADFObject.get_last_node_class(node_type := input_object['type'])(node_type=node_type, **object_args)
+    for field, value in input_object.items():
+        if field in ('content', 'marks'):
+            new_node.assign_info(field)
+        elif field != 'type':
+            new_node.assign_info(field, value)
+    return new_node
+
+
+@cache
+def _trusted_type_details(node_type):
+    node_list, mark_list = adf_node_list(), adf_mark_list()
+    is_node = node_type in node_list
+    if not is_node and node_type not in mark_list:
+        raise RuntimeError(f'{node_type} does not exists in the schema.')
+    object_list = node_list if is_node else mark_list
+    node_prop, required = object_list[node_type]['prop'], object_list[node_type]['required']
+    return is_node, object_list, node_prop, tuple(k for k in node_prop if k in required)
+
+
+def _new_trusted_node(source):
+    # Build a node from a dict without "content" and "marks", bypassing the constructor and all the checks.
+    node_type = source['type']
+    _, _, node_prop, required_fields = _trusted_type_details(node_type)
+    node_class = ADFObject.get_last_node_class(node_type)
+    node = node_class.__new__(node_class)
+    node.chain_mode, node._parent, node._validated, node._rendered, node._digest = True, None, False, None, None
+    node._shared_fields = _NO_SHARED_FIELDS
+    if not node_class._type_on_class:
+        node.type = node_type
+    # Same field order as the constructor: Required fields first, "content" and "marks" last.
+    local_info = node.local_info = dict.fromkeys(required_fields)
+    for field, value in source.items():
+        if field not in ('type', 'content', 'marks'):
+            local_info[field] = thaw(value)
+    for field in required_fields:
+        if local_info[field] is None:
+            local_info[field] = ADFObject._default_field(node_prop[field])
+    return node
+
+
+def _load_adf_trusted(input_object):
+    top_node = _new_trusted_node(input_object)
+    build_stack = [(top_node, input_object)]
+    while build_stack:
+        parent_node, source = build_stack.pop()
+        for field in source:
+            if field == 'content':
+                child_nodes = parent_node.local_info[field] = [_new_trusted_node(child) for child in source[field]]
+                for child_node in child_nodes:
+                    child_node._parent = parent_node
+                build_stack.extend(zip(child_nodes, source[field]))
+            elif field == 'marks':
+                _load_marks(parent_node, source[field])
     return top_node
+
+
+def _load_adf_lazy(input_object):
+    new_node = _new_trusted_node(input_object)
+    if isinstance(input_object, FrozenDict):
+        # Rendered before being loaded. The render is still valid.
+        new_node._rendered = input_object
+    for field in input_object:
+        if field == 'content':
+            new_node.local_info['content'] = LazyContentList(input_object['content'], new_node)
+        elif field == 'marks':
+            _load_marks(new_node, input_object['marks'])
+    return new_node
+
+
+class _SharedParent:
+    # Parent of the shared marks, which have many. Pickled as a reference to the module attribute.
+    def __reduce__(self):
+        return '_SHARED_PARENT'
+
+
+_SHARED_PARENT = _SharedParent()
+_SHARED_MARKS_LIMIT = 1 << 12
+_shared_marks = {}  # Key of the fields -> shared mark. Reset when full.
+_LOADED_MARK = 'load_adf'  # Key prefix of the input of load_adf(), the constructor may add fields.
+_node_indexes = weakref.WeakSet()  # ADFIndex of all the documents, see ADFDoc.build_index().
+
+
+def _mark_key(fields):
+    # Hashable key of the fields of a mark, in their order. None if the mark is not shareable.
+    key = []
+    for field, value in fields.items():
+        if isinstance(value, dict):
+            if not all(_shareable_value(v) for v in value.values()):
+                return None
+            value = tuple((k, type(v), v) for k, v in value.items())
+        elif not _shareable_value(value):
+            return None
+        key.append((field, value))
+    return tuple(key)
+
+
+def _shareable_value(value):
+    # Nested values may be modified in place. Variables of apply_variable() are replaced in place.
+    if isinstance(value, str):
+        return ADFObject.PATTERN_EXP.search(value) is None
+    return value is None or isinstance(value, (bool, int, float))
+
+
+def _shared_mark_with_key(key, build_mark):
+    if key is None:
+        return build_mark()
+    if (mark := _shared_marks.get(key)) is None:
+        if len(_shared_marks) >= _SHARED_MARKS_LIMIT:
+            _shared_marks.clear()
+        mark = _shared_marks[key] = build_mark()
+        mark.render()
+        mark._parent = _SHARED_PARENT
+    return mark
+
+
+def _shared_mark_from(source):
+    # Shared mark equal to a rendered mark, built as trusted.
+    return _shared_mark_with_key(_mark_key(source), lambda: _new_trusted_node(source))
+
+
+def _load_marks(parent_node, sources):
+    marks = parent_node.local_info['marks'] = [_shared_mark_from(source) for source in sources]
+    for mark in marks:
+        if mark._parent is not _SHARED_PARENT:
+            mark._parent = parent_node
+
+
+def _share_mark(mark):
+    # Shared mark equal to a mark. The mark itself becomes the shared one if there is none yet.
+    return _shared_mark_with_key(_mark_key(mark._json_fields()), lambda: mark)
+
+
+def shared_mark(mark: Union[ADFObject, str], **fields) -> ADFObject:
+    """
+    Shared read-only instance of a mark, one per combination of type and fields. The render is built once.
+    Marks added by type with add() (e.g. add('strong')) in chain mode and marks loaded by load_adf() are shared already.
+    A shared mark has no parent and is added to any number of nodes. assign_info() on it raises TypeError.
+    :param mark: Mark without parent, e.g. ADFLink(url). Or type of a new mark, e.g. "strong".
+    :param fields: Fields of the new mark, e.g. attrs={'href': url}.
+    :return: Shared mark. The input mark itself if it has nested values or variables of apply_variable() in the fields.
+    """
+    if not isinstance(mark, ADFObject):
+        mark = ADFObject(mark, **fields)
+    if not mark.is_mark:
+        raise ValueError(f'Only marks can be shared, not "{mark.type}".')
+    if mark._parent is _SHARED_PARENT:
+        return mark
+    if mark._parent is not None:
+        raise ValueError(f'The mark "{mark.type}" is added to a node already.')
+    return _share_mark(mark)
+
+
+def _fields_digest(fields, children):
+    # Digest of a node from its fields but "content" and "marks", and the digests of the children of these two.
+    # The canonical JSON tells True, 1 and 1.0 apart and does not depend on the order of the dict keys. It never
+    # contains a NUL byte, which starts the digests of the children of each field.
+    digest = hashlib.blake2b(_DIGEST_ENCODER.encode(fields).encode(), digest_size=16)
+    for field, child_digests in children:
+        digest.update(_CHILD_DIGEST_PREFIXES[field])
+        digest.update(b''.join(child_digests))
+    return digest.digest()
+
+
+def _value_digest(value):
+    # Digest of a rendered node, e.g. a child never accessed of a lazily loaded node. See ADFObject.digest().
+    return _fields_digest(
+        {k: v for k, v in value.items() if v is not None and k not in ('content', 'marks')},
+        ((field, [_value_digest(child) for child in value[field]]) for field in ('content', 'marks') if field in value)
+    )
+
+
+def _values_equal(value, other):
+    # Same as ==, except that the numbers and booleans of different types are not equal, e.g. True and 1.
+    if isinstance(value, dict):
+        return isinstance(other, dict) and value.keys() == other.keys() and \
+            all(_values_equal(v, other[k]) for k, v in value.items())
+    if isinstance(value, list):
+        return isinstance(other, list) and len(value) == len(other) and all(map(_values_equal, value, other))
+    return value == other and (type(value) is type(other) or not isinstance(value, _NUMBER_TYPES))
+
+
+def _plain_fields(node):
+    # Fields of a node as in render(), except "type", "content" and "marks".
+    return {k: v for k, v in node.local_info.items() if v is not None and k not in ('type', 'content', 'marks')}
+
+
+def _render_of(child_node):
+    return child_node.render() if isinstance(child_node, ADFObject) else child_node
+
+
+@cache
+def _shared_field_set(fields):
+    # One set per combination of fields, instead of one per cloned node.
+    return frozenset(fields)
+
+
+class LazyContentList(list):
+    """
+    "content" of a node loaded by load_adf(lazy=True).
+    Child nodes are kept as dict and turned into ADFObject on the first access by index, iteration or pop().
+    Children never accessed are rendered as is.
+    """
+
+    def __init__(self, raw_children, owner):
+        super(LazyContentList, self).__init__(raw_children)
+        self._owner = owner
+
+    def _materialize(self, index):
+        if isinstance(child := list.__getitem__(self, index), dict):
+            child = _load_adf_lazy(child)
+            child._parent = self._owner
+            if self._owner._digest is not None:
+                child.digest()  # Nodes under a digested node are digested.
+            list.__setitem__(self, index, child)
+        return child
+
+    def raw_items(self, freeze_raw=False):
+        """
+        Iterate the children without materializing them: ADFObject, or dict for the children never accessed.
+        :param freeze_raw: Replace the dict children with a read-only copy, which is shared by all renders.
+        """
+        for index, child in enumerate(list.__iter__(self)):
+            if freeze_raw and isinstance(child, dict) and not isinstance(child, FrozenDict):
+                list.__setitem__(self, index, child := freeze(child))
+            yield child
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._materialize(i) for i in range(*index.indices(len(self)))]
+        return self._materialize(index)
+
+    def __iter__(self):
+        index = 0
+        while index < len(self):
+            yield self._materialize(index)
+            index += 1
+
+    def __reversed__(self):
+        return iter(self[::-1])
+
+    def pop(self, index=-1):
+        self._materialize(index)
+        return super(LazyContentList, self).pop(index)
+
+    def copy(self):
+        return list(self)
+
+    def _with_children(self, children, owner):
+        # Same kind of list for a clone of the owner.
+        return LazyContentList(children, owner)
+
+
+def _root_node(node):
+    while node._parent is not None and node._parent is not _SHARED_PARENT:
+        node = node._parent
+    return node
+
+
+def _update_index(node, field, values):
+    # Keep the index of the document up to date after a change of a node. Nothing to do without any index.
+    if _node_indexes and (node_index := getattr(_root_node(node), '_index', None)) is not None:
+        node_index._update(node, field, values)
+
+
+def _cells_width(cells):
+    # Number of columns covered by the cells of a row. A cell without colspan covers 1 column.
+    return sum(((cell.local_info.get('attrs') or {}).get('colspan', 1) for cell in cells), 0)
+
+
+def _update_width(node, field, values):
+    # Keep the width counted by ADFTable and ADFTableRow ("_width") up to date after assign_info(), for the rows and
+    # cells of any class. Cells added to a row widen the row and the table, a colspan changed makes them count again.
+    if field == 'content' and node.type == 'tableRow':
+        if (row_width := getattr(node, '_width', None)) is not None:
+            node._width = row_width = row_width + _cells_width(values)
+        if (table_width := getattr(node._parent, '_width', None)) is not None:
+            node._parent._width = max(
+                table_width, row_width if row_width is not None else _cells_width(node.local_info['content'])
+            )
+    elif field == 'attrs' and node.type in ('tableCell', 'tableHeader'):
+        for width_node in (node._parent, getattr(node._parent, '_parent', None)):
+            if getattr(width_node, '_width', None) is not None:
+                width_node._width = None
+
+
+def _child_entries(node, depth, path, prune, fields, materialize, paths):
+    # Entries of walk() for the children of a node, in order.
+    child_depth = depth + 1
+    for field in fields:
+        if field not in node.local_info:
+            continue
+        children = node.local_info[field] if materialize else _raw_children(node.local_info[field])
+        for index, child_node in enumerate(children):
+            if isinstance(child_node, ADFObject) and (prune is None or not prune(child_node)):
+                yield child_node, child_depth, f'{path}/{field}/{index}' if paths else None
+
+
+def _raw_children(content, freeze_raw=False):
+    # Children of a node without materializing lazily loaded ones.
+    return content.raw_items(freeze_raw) if isinstance(content, LazyContentList) else iter(content)
@@ -0,0 +1,318 @@
+from difflib import SequenceMatcher
+from typing import List, Union
+
+from .adf_frozen import thaw
+from .adf_object import ADFObject, _SHARED_PARENT, _plain_fields, _raw_children, _render_of, _update_index, \
+    _value_digest, _values_equal, load_adf
+
+_MATCHED_CHILDREN_LIMIT = 1 << 20  # Product of the numbers of old and new children given to SequenceMatcher.
+
+
+def _pointer(path, key):
+    # JSON pointer of a key under the path, RFC 6901.
+    return f'{path}/{str(key).replace("~", "~0").replace("/", "~1")}'
+
+
+def _pointer_keys(path):
+    if path == '':
+        return []
+    if not path.startswith('/'):
+        raise ValueError(f'Invalid JSON pointer "{path}".')
+    return [key.replace('~1', '/').replace('~0', '~') for key in path[1:].split('/')]
+
+
+def diff(old: Union[ADFObject, dict], new: Union[ADFObject, dict], strict=False) -> List[dict]:
+    """
+    Edits from one document to another, as a JSON Patch (RFC 6902) of the renders.
+    Child nodes are matched by their structural digest, cached on each node like the render, see ADFObject.digest().
+    Subtrees with an equal digest are equal and not compared further. Between two ADFObject without changes, the
+    result is known from the digest of the top nodes. Changed nodes of the same type are patched field by field.
+    :param old: ADFObject, or rendered document loaded by load_adf(lazy=True).
+    :param new: ADFObject, or rendered document loaded by load_adf(lazy=True).
+    :param strict: Compare the subtrees with an equal digest with == as well, which walks them.
+    :return: List of operations, e.g. {"op": "replace", "path": "/content/0/content/1/text", "value": "foo"}.
+        Values of nodes are their read-only render.
+    """
+    operations = []
+    if isinstance(old, ADFObject) and isinstance(new, ADFObject) and old.digest() == new.digest() and \
+            (not strict or old == new):
+        return operations
+    # A rendered document is digested once, by its children compared in _diff_content().
+    old = old if isinstance(old, ADFObject) else load_adf(old, lazy=True)
+    new = new if isinstance(new, ADFObject) else load_adf(new, lazy=True)
+    _diff_nodes(old, new, '', operations, strict)
+    return operations
+
+
+def _diff_nodes(old, new, path, operations, strict):
+    # The nodes are different, or not compared yet.
+    if old.type != new.type:
+        operations.append({'op': 'replace', 'path': path, 'value': new.render()})
+        return
+    _diff_values(_plain_fields(old), _plain_fields(new), path, operations)
+    if 'marks' in old.local_info and 'marks' in new.local_info and \
+            len(old.local_info['marks']) == len(new.local_info['marks']):
+        # A mark of another type is replaced as a whole, its type cannot be patched.
+        for index, (old_mark, new_mark) in enumerate(zip(old.local_info['marks'], new.local_info['marks'])):
+            if old_mark is not new_mark:
+                _diff_nodes(old_mark, new_mark, _pointer(_pointer(path, 'marks'), index), operations, strict)
+    elif 'marks' in old.local_info or 'marks' in new.local_info:
+        _diff_values(
+            {'marks': [mark.render() for mark in old.local_info['marks']]} if 'marks' in old.local_info else {},
+            {'marks': [mark.render() for mark in new.local_info['marks']]} if 'marks' in new.local_info else {},
+            path, operations
+        )
+    if 'content' not in old.local_info or 'content' not in new.local_info:
+        _diff_values(
+            {'content': old.render()['content']} if 'content' in old.local_info else {},
+            {'content': new.render()['content']} if 'content' in new.local_info else {},
+            path, operations
+        )
+    else:
+        _diff_content(old.local_info['content'], new.local_info['content'], _pointer(path, 'content'), operations,
+                      strict)
+
+
+def _diff_content(old_children, new_children, path, operations, strict):
+    old_raw_children, new_raw_children = list(_raw_children(old_children)), list(_raw_children(new_children))
+    opcodes = _content_opcodes([_child_digest(child) for child in old_raw_children],
+                               [_child_digest(child) for child in new_raw_children])
+    # From the end to the start, the indexes before each operation are not shifted by it.
+    for tag, old_start, old_end, new_start, new_end in reversed(opcodes):
+        if tag == 'equal':
+            for offset in reversed(range(old_end - old_start) if strict else ()):
+                if not _children_equal(old_raw_children[old_start + offset], new_raw_children[new_start + offset]):
+                    # Same digest, different values.
+                    _diff_nodes(old_children[old_start + offset], new_children[new_start + offset],
+                                _pointer(path, old_start + offset), operations, strict)
+            continue
+        paired = min(old_end - old_start, new_end - new_start)
+        for index in reversed(range(old_start + paired, old_end)):
+            operations.append({'op': 'remove', 'path': _pointer(path, index)})
+        for offset in range(paired, new_end - new_start):
+            operations.append({
+                'op': 'add', 'path': _pointer(path, old_start + offset),
+                'value': _render_of(new_raw_children[new_start + offset]),
+            })
+        for offset in reversed(range(paired)):
+            # Changed in place. Materialize the lazily loaded children to compare them field by field.
+            _diff_nodes(old_children[old_start + offset], new_children[new_start + offset],
+                        _pointer(path, old_start + offset), operations, strict)
+
+
+def _content_opcodes(old_digests, new_digests):
+    # SequenceMatcher.get_opcodes() of the digests of the children. The common prefix and suffix are trimmed first, a
+    # single edit is linear. The rest is replaced in place when it is too long for the matcher, which is quadratic.
+    prefix, shorter = 0, min(len(old_digests), len(new_digests))
+    while prefix < shorter and old_digests[prefix] == new_digests[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < shorter - prefix and old_digests[-1 - suffix] == new_digests[-1 - suffix]:
+        suffix += 1
+    old_end, new_end = len(old_digests) - suffix, len(new_digests) - suffix
+
+    opcodes = [('equal', 0, prefix, 0, prefix)] if prefix else []
+    if (old_end - prefix) * (new_end - prefix) > _MATCHED_CHILDREN_LIMIT:
+        opcodes.append(('replace', prefix, old_end, prefix, new_end))
+    elif old_end > prefix or new_end > prefix:
+        opcodes.extend(
+            (tag, old_start + prefix, old_stop + prefix, new_start + prefix, new_stop + prefix)
+            for tag, old_start, old_stop, new_start, new_stop in SequenceMatcher(
+                None, old_digests[prefix:old_end], new_digests[prefix:new_end], autojunk=False
+            ).get_opcodes()
+        )
+    if suffix:
+        opcodes.append(('equal', old_end, len(old_digests), new_end, len(new_digests)))
+    return opcodes
+
+
+def _child_digest(child):
+    return child.digest() if isinstance(child, ADFObject) else _value_digest(child)
+
+
+def _children_equal(old_child, new_child):
+    if isinstance(old_child, ADFObject) and isinstance(new_child, ADFObject):
+        return old_child == new_child
+    return _values_equal(_render_of(old_child), _render_of(new_child))
+
+
+def _diff_values(old, new, path, operations):
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old:
+            if key not in new:
+                operations.append({'op': 'remove', 'path': _pointer(path, key)})
+        for key, value in new.items():
+            if key not in old:
+                operations.append({'op': 'add', 'path': _pointer(path, key), 'value': value})
+            else:
+                _diff_values(old[key], value, _pointer(path, key), operations)
+    elif isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        for index, (old_value, new_value) in enumerate(zip(old, new)):
+            _diff_values(old_value, new_value, _pointer(path, index), operations)
+    elif old != new or type(old) is not type(new):
+        operations.append({'op': 'replace', 'path': path, 'value': new})
+
+
+def apply_patch(node: Union[ADFObject, dict], operations: List[dict]) -> ADFObject:
+    """
+    Apply a JSON Patch (RFC 6902) to a node in place, e.g. the output of diff().
+    Each path is resolved from the node through the nodes on it only. The children of lazily loaded nodes are not
+    materialized apart from those on the paths, and only the nodes on the paths are rendered again.
+    Nodes are added with the same checks as assign_info(), from ADFObject or rendered nodes.
+    A shared mark is replaced by a copy before its fields are changed, see shared_mark().
+    :param node: ADFObject, or rendered document loaded by load_adf(lazy=True).
+    :param operations: List of operations "add", "remove", "replace" and "test".
+    :return: The node patched. A new node if the whole node is replaced with the path "".
+    """
+    node = node if isinstance(node, ADFObject) else load_adf(node, lazy=True)
+    for operation in operations:
+        node = _apply_operation(node, operation)
+    return node
+
+
+def _apply_operation(top_node, operation):
+    op, keys, value = operation['op'], _pointer_keys(operation['path']), operation.get('value')
+    if op not in ('add', 'remove', 'replace', 'test'):
+        raise ValueError(f'Unsupported operation "{op}".')
+    if not keys:
+        if op == 'remove':
+            raise ValueError('The top node cannot be removed.')
+        if op == 'test':
+            _test_value(top_node, value)
+            return top_node
+        return _as_node(value)
+
+    # Down to the node owning the target, through the child nodes.
+    path_nodes, position = [top_node], 0
+    while position + 2 < len(keys) and keys[position] in ('content', 'marks'):
+        children = path_nodes[-1].local_info[keys[position]]
+        child_index = _list_index(children, keys[position + 1])
+        if (child_node := children[child_index])._parent is _SHARED_PARENT and op != 'test':
+            children[child_index] = child_node = child_node._clone_node()
+            child_node._parent = path_nodes[-1]
+        path_nodes.append(child_node)
+        position += 2
+    node, field, keys = path_nodes[-1], keys[position], keys[position + 1:]
+
+    new_nodes = ()
+    if field in ('content', 'marks') and keys:
+        new_nodes = _apply_child(node, field, keys[0], op, value)
+    elif not keys:
+        new_nodes = _apply_field(node, field, op, value)
+    else:
+        node._checked_values(field, ())
+        if op != 'test':
+            node._own_field(field)
+        container = node.local_info[field]
+        for key in keys[:-1]:
+            container = container[_list_index(container, key)] if isinstance(container, list) else container[key]
+        _apply_value(container, keys[-1], op, value)
+
+    if op != 'test':
+        node._invalidate()
+        _update_index(node, field, new_nodes)
+        if field == 'content' and node.type in ('table', 'tableRow') or \
+                field == 'attrs' and node.type in ('tableCell', 'tableHeader'):
+            # Rows or cells added, removed or replaced, or a colspan changed. See ADFTable.
+            for path_node in path_nodes:
+                if getattr(path_node, '_width', None) is not None:
+                    path_node._width = None  # Counted again on the next read.
+    return top_node
+
+
+def _apply_child(node, field, key, op, value):
+    # Return the child nodes added.
+    children = node.local_info[field]
+    index = _list_index(children, key, op == 'add')
+    if op == 'test':
+        _test_value(children[index], value)
+        return ()
+    if op != 'add':
+        _detach(list.__getitem__(children, index))
+    if op == 'remove':
+        del children[index]
+        return ()
+    new_node = _as_node(value)
+    node._checked_values(field, [new_node])
+    if new_node._parent is not _SHARED_PARENT:
+        new_node._parent = node
+    if op == 'add':
+        children.insert(index, new_node)
+    else:
+        list.__setitem__(children, index, new_node)
+    return [new_node]
+
+
+def _apply_field(node, field, op, value):
+    # Return the child nodes added.
+    if op == 'test':
+        _test_value(node.local_info[field], value)
+        return ()
+    if op != 'add' and node.local_info.get(field) is None:
+        raise KeyError(f'"{field}" does not exists in the node "{node.type}"')
+    if op == 'remove':
+        node._checked_values(field, ())
+        _detach_field(node, field)
+        node.local_info.pop(field)
+        return ()
+    if field in ('content', 'marks'):
+        new_nodes = node._checked_values(field, [_as_node(child_node) for child_node in value])
+        _detach_field(node, field)
+        for child_node in new_nodes:
+            if child_node._parent is not _SHARED_PARENT:
+                child_node._parent = node
+        node.local_info[field] = list(new_nodes)
+        return new_nodes
+    node._checked_values(field, (value,))
+    node._own_field(field)
+    node.local_info[field] = thaw(value)
+    return ()
+
+
+def _apply_value(container, key, op, value):
+    # Operation in a field value, e.g. "attrs".
+    if isinstance(container, list):
+        key = _list_index(container, key, op == 'add')
+    if op == 'test':
+        _test_value(container[key], value)
+    elif op == 'remove':
+        del container[key]
+    elif op == 'add' and isinstance(container, list):
+        container.insert(key, thaw(value))
+    else:
+        if op == 'replace' and isinstance(container, dict) and key not in container:
+            raise KeyError(f'"{key}" does not exist.')
+        container[key] = thaw(value)
+
+
+def _list_index(items, key, allow_end=False):
+    if allow_end and key == '-':
+        return len(items)
+    if not key.isdigit() or (key != '0' and key.startswith('0')):
+        raise ValueError(f'Invalid index "{key}".')
+    if (index := int(key)) > len(items) or (index == len(items) and not allow_end):
+        raise IndexError(f'Index {index} out of range.')
+    return index
+
+
+def _as_node(value):
+    return value if isinstance(value, ADFObject) else load_adf(thaw(value))
+
+
+def _detach(child_node):
+    if isinstance(child_node, ADFObject) and child_node._parent is not _SHARED_PARENT:
+        child_node._parent = None
+
+
+def _detach_field(node, field):
+    # Children of a whole "content" or "marks" field being replaced or removed.
+    if field in ('content', 'marks'):
+        for child_node in _raw_children(node.local_info.get(field) or ()):
+            _detach(child_node)
+
+
+def _test_value(value, expected):
+    if isinstance(value, list):
+        value = [_render_of(item) for item in _raw_children(value)]
+    if _render_of(value) != expected:
+        raise ValueError('The value is not equal to the value tested.')
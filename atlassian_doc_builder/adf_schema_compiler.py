@@ -0,0 +1,137 @@
+import os
+import pprint
+
+from .adf_schema_store import BUNDLED_SCHEMA_VERSION, load_bundled_schema
+
+TABLES_MODULE_PATH = os.path.join(os.path.dirname(__file__), 'adf_schema_tables.py')
+
+
+def _is_node_definition(key, value):
+    return 'node' in key[-4:] and value.get('type') == 'object'
+
+
+def _is_mark_definition(key, value):
+    return 'mark' in key[-4:] and value.get('type') == 'object'
+
+
+def _resolve_types(fragment, definitions, seen=()):
+    """
+    Resolve a schema fragment to the set of ADF types it accepts.
+    :return: set of types, or None when the fragment does not constrain the type.
+    """
+    if not isinstance(fragment, dict):
+        return None
+    if '$ref' in fragment:
+        ref_name = fragment['$ref'].split('/')[-1]
+        if ref_name in seen:
+            return set()
+        return _resolve_types(definitions.get(ref_name), definitions, seen + (ref_name,))
+    if 'anyOf' in fragment or 'oneOf' in fragment:
+        resolved = [_resolve_types(f, definitions, seen) for f in fragment.get('anyOf', fragment.get('oneOf'))]
+        return None if any(r is None for r in resolved) else set().union(*resolved)
+    if 'allOf' in fragment:
+        resolved = [r for f in fragment['allOf'] if (r := _resolve_types(f, definitions, seen)) is not None]
+        return set.intersection(*resolved) if resolved else None
+    if type_enum := fragment.get('properties', {}).get('type', {}).get('enum'):
+        return set(type_enum)
+    return None
+
+
+def _field_overrides(fragment, field, definitions):
+    # Yield the schema of a field in a definition and all the allOf members of it.
+    if '$ref' in fragment:
+        yield from _field_overrides(definitions.get(fragment['$ref'].split('/')[-1], {}), field, definitions)
+    for member in fragment.get('allOf', []):
+        yield from _field_overrides(member, field, definitions)
+    if field in fragment.get('properties', {}):
+        yield fragment['properties'][field]
+
+
+def _resolve_items(array_schema, definitions):
+    if '$ref' in array_schema:
+        return _resolve_items(definitions.get(array_schema['$ref'].split('/')[-1], {}), definitions)
+    if 'items' not in array_schema:
+        return None if array_schema.get('maxItems') != 0 else set()
+    items = array_schema['items']
+    # Tuple-typed arrays (e.g. listItem) are read as "any of the listed positions".
+    resolved = [_resolve_types(item, definitions) for item in (items if isinstance(items, list) else [items])]
+    return None if any(r is None for r in resolved) else set().union(*resolved)
+
+
+def _allowed_types(definitions, field):
+    """
+    Collect the child types allowed in a field for each node type, over the node and all its variants.
+    e.g. "paragraph_with_alignment_node" contributes "alignment" to the marks of "paragraph".
+    :return: {node_type: tuple of child types or None when the field is not constrained}
+    """
+    contributions = {}
+    for key, value in definitions.items():
+        node_types = _resolve_types(value, definitions)
+        if not key.endswith('_node') or not node_types or len(node_types) != 1:
+            continue
+        contributions.setdefault(next(iter(node_types)), []).extend(
+            _resolve_items(field_schema, definitions) for field_schema in _field_overrides(value, field, definitions)
+        )
+
+    # A field without item constraint in all variants accepts anything.
+    return {
+        node_type: tuple(sorted(set().union(*constrained))) if (constrained := [c for c in v if c is not None]) else
+        None
+        for node_type, v in contributions.items()
+    }
+
+
+def decode_schema_with_filter(schema, filter_expression):
+    definitions = schema['definitions']
+    allowed_content, allowed_marks = _allowed_types(definitions, 'content'), _allowed_types(definitions, 'marks')
+    decoded = {}
+    for k, v in definitions.items():
+        if not filter_expression(k, v):
+            continue
+        node_type = v['properties']['type']['enum'][0]
+        prop = {
+            prop_key: prop_detail.get('type', 'string') if prop_key not in ('attrs', 'content') else
+            {'attrs': 'object', 'content': 'array'}[prop_key]
+
+            for prop_key, prop_detail in v.get('properties', {}).items()
+            if prop_key != 'type'
+        }
+        decoded[node_type] = {
+            'prop': prop,
+            'required': tuple(v.get('required', [])),
+            'attrs': v.get('properties', {}).get('attrs', {}),
+            'allowed_content': allowed_content.get(node_type) if 'content' in prop else None,
+            'allowed_marks': allowed_marks.get(node_type) if 'marks' in prop else None,
+        }
+    return decoded
+
+
+def decode_node_list(schema):
+    return decode_schema_with_filter(schema, _is_node_definition)
+
+
+def decode_mark_list(schema):
+    return decode_schema_with_filter(schema, _is_mark_definition)
+
+
+def write_schema_tables(schema=None, path=TABLES_MODULE_PATH, schema_version=BUNDLED_SCHEMA_VERSION):
+    """
+    Generate a Python module with the node and mark tables of the schema.
+    Importing the module replaces the schema decoding at runtime.
+    :param schema: Schema to be compiled. Default: The bundled snapshot.
+    :param path: Output path of the module.
+    :param schema_version: Version tag recorded in the module.
+    """
+    schema = schema if schema is not None else load_bundled_schema()
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(
+            '# Generated by atlassian_doc_builder.adf_schema_compiler. Do not edit.\n'
+            '# Regenerate with: python -m atlassian_doc_builder.adf_schema_compiler\n\n'
+            f'SCHEMA_VERSION = {schema_version!r}\n\n'
+            f'NODE_LIST = {pprint.pformat(decode_node_list(schema), width=120, sort_dicts=False)}\n\n'
+            f'MARK_LIST = {pprint.pformat(decode_mark_list(schema), width=120, sort_dicts=False)}\n'
+        )
+
+
+if __name__ == '__main__':
+    write_schema_tables()
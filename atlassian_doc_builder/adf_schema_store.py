@@ -0,0 +1,124 @@
+import json
+import logging
+import os
+import sys
+import urllib.error
+import urllib.request
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_URL = 'https://go.atlassian.com/adf-json-schema'
+SCHEMA_SOURCES = ('bundled', 'cached', 'live')
+BUNDLED_SCHEMA_VERSION = 'adf-full-v1'
+BUNDLED_SCHEMA_PATH = os.path.join(os.path.dirname(__file__), 'schema', 'adf_full_v1.json')
+
+
+def default_cache_dir():
+    if cache_dir := os.environ.get('ADF_SCHEMA_CACHE_DIR'):
+        return cache_dir
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'atlassian_doc_builder')
+
+
+def load_bundled_schema():
+    """
+    Load the schema snapshot shipped with the package. No network access.
+    :return: dict
+    """
+    with open(BUNDLED_SCHEMA_PATH, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def fetch_live_schema(url=SCHEMA_URL, timeout=30):
+    """
+    Download the schema from the given URL unconditionally.
+    :return: dict
+    """
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        return json.load(response)
+
+
+def load_cached_schema(url=SCHEMA_URL, cache_dir=None, timeout=30):
+    """
+    Load the schema from the on-disk cache, refreshing it with a conditional request (ETag/If-Modified-Since).
+    Fall back to the cached copy, then the bundled snapshot, when the server is unreachable.
+    :param url: Location of the schema.
+    :param cache_dir: Directory of the cache. Default: $ADF_SCHEMA_CACHE_DIR or ~/.cache/atlassian_doc_builder
+    :param timeout: Timeout of the request in seconds.
+    :return: dict
+    """
+    cache_dir = cache_dir or default_cache_dir()
+    schema_path = os.path.join(cache_dir, 'adf_schema.json')
+    meta_path = os.path.join(cache_dir, 'adf_schema.meta.json')
+    cached_schema, meta = _read_json(schema_path), _read_json(meta_path) or {}
+    if meta.get('url') != url:
+        cached_schema, meta = None, {}
+
+    request = urllib.request.Request(url)
+    if cached_schema is not None:
+        if meta.get('etag'):
+            request.add_header('If-None-Match', meta['etag'])
+        if meta.get('last_modified'):
+            request.add_header('If-Modified-Since', meta['last_modified'])
+
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            schema = json.load(response)
+            etag, last_modified = response.headers.get('ETag'), response.headers.get('Last-Modified')
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and cached_schema is not None:
+            return cached_schema
+        logger.warning('Failed to refresh the ADF schema from %s: HTTP %s', url, e.code)
+        return cached_schema if cached_schema is not None else load_bundled_schema()
+    except (urllib.error.URLError, OSError, ValueError) as e:
+        logger.warning('Failed to refresh the ADF schema from %s: %s', url, e)
+        return cached_schema if cached_schema is not None else load_bundled_schema()
+
+    os.makedirs(cache_dir, exist_ok=True)
+    _write_json(schema_path, schema)
+    _write_json(meta_path, {'url': url, 'etag': etag, 'last_modified': last_modified})
+    return schema
+
+
+def load_schema(source='bundled', url=SCHEMA_URL, cache_dir=None):
+    """
+    Load the ADF schema from the specified source.
+    :param source: One of "bundled", "cached" or "live".
+    :param url: Location of the schema. Not used by "bundled".
+    :param cache_dir: Directory of the cache. Used by "cached" only.
+    :return: dict
+    """
+    if source == 'bundled':
+        return load_bundled_schema()
+    if source == 'cached':
+        return load_cached_schema(url, cache_dir)
+    if source == 'live':
+        return fetch_live_schema(url)
+    raise ValueError(f'Unknown schema source: {source}. Choose from {SCHEMA_SOURCES}.')
+
+
+def _read_json(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json(path, obj):
+    # Write then rename, concurrent workers never see a partial file.
+    temp_path = f'{path}.{os.getpid()}.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(obj, f)
+    os.replace(temp_path, path)
+
+
+if __name__ == '__main__':
+    # Refresh the bundled snapshot and the precompiled tables: python -m atlassian_doc_builder.adf_schema_store [URL]
+    from atlassian_doc_builder.adf_schema_compiler import write_schema_tables
+
+    new_schema = fetch_live_schema(sys.argv[1] if len(sys.argv) > 1 else SCHEMA_URL)
+    with open(BUNDLED_SCHEMA_PATH, 'w', encoding='utf-8') as output:
+        json.dump(new_schema, output, indent=2)
+        output.write('\n')
+    write_schema_tables(new_schema)
@@ -0,0 +1,671 @@
+# Generated by atlassian_doc_builder.adf_schema_compiler. Do not edit.
+# Regenerate with: python -m atlassian_doc_builder.adf_schema_compiler
+
+SCHEMA_VERSION = 'adf-full-v1'
+
+NODE_LIST = {'blockCard': {'prop': {'attrs': 'object'},
+               'required': ('type', 'attrs'),
+               'attrs': {'anyOf': [{'type': 'object',
+                                    'properties': {'url': {'type': 'string'}, 'localId': {'type': 'string'}},
+                                    'required': ['url'],
+                                    'additionalProperties': False},
+                                   {'type': 'object',
+                                    'properties': {'data': {}, 'localId': {'type': 'string'}},
+                                    'required': ['data'],
+                                    'additionalProperties': False}]},
+               'allowed_content': None,
+               'allowed_marks': None},
+ 'blockquote': {'prop': {'content': 'array', 'attrs': 'object'},
+                'required': ('type', 'content'),
+                'attrs': {'type': 'object',
+                          'properties': {'localId': {'type': 'string'}},
+                          'additionalProperties': False},
+                'allowed_content': ('bulletList', 'codeBlock', 'mediaGroup', 'mediaSingle', 'orderedList', 'paragraph'),
+                'allowed_marks': None},
+ 'bodiedExtension': {'prop': {'attrs': 'object', 'content': 'array', 'marks': 'array'},
+                     'required': ('type', 'attrs', 'content'),
+                     'attrs': {'type': 'object',
+                               'properties': {'extensionKey': {'type': 'string', 'minLength': 1},
+                                              'extensionType': {'type': 'string', 'minLength': 1},
+                                              'parameters': {},
+                                              'text': {'type': 'string'},
+                                              'layout': {'enum': ['wide', 'full-width', 'default']},
+                                              'localId': {'type': 'string', 'minLength': 1}},
+                               'required': ['extensionKey', 'extensionType'],
+                               'additionalProperties': False},
+                     'allowed_content': ('blockCard',
+                                         'blockquote',
+                                         'bulletList',
+                                         'codeBlock',
+                                         'decisionList',
+                                         'embedCard',
+                                         'extension',
+                                         'heading',
+                                         'mediaGroup',
+                                         'mediaSingle',
+                                         'orderedList',
+                                         'panel',
+                                         'paragraph',
+                                         'rule',
+                                         'table',
+                                         'taskList'),
+                     'allowed_marks': ('dataConsumer', 'fragment')},
+ 'bulletList': {'prop': {'content': 'array', 'attrs': 'object'},
+                'required': ('type', 'content'),
+                'attrs': {'type': 'object',
+                          'properties': {'localId': {'type': 'string'}},
+                          'additionalProperties': False},
+                'allowed_content': ('listItem',),
+                'allowed_marks': None},
+ 'caption': {'prop': {'attrs': 'object', 'content': 'array'},
+             'required': ('type',),
+             'attrs': {'type': 'object', 'properties': {'localId': {'type': 'string'}}, 'additionalProperties': False},
+             'allowed_content': ('date',
+                                 'emoji',
+                                 'hardBreak',
+                                 'inlineCard',
+                                 'mention',
+                                 'placeholder',
+                                 'status',
+                                 'text'),
+             'allowed_marks': None},
+ 'codeBlock': {'prop': {'attrs': 'object', 'content': 'array', 'marks': 'array'},
+               'required': ('type',),
+               'attrs': {'type': 'object',
+                         'properties': {'language': {'type': 'string'},
+                                        'uniqueId': {'type': 'string'},
+                                        'localId': {'type': 'string'}},
+                         'additionalProperties': False},
+               'allowed_content': ('text',),
+               'allowed_marks': ('breakout',)},
+ 'date': {'prop': {'attrs': 'object'},
+          'required': ('type', 'attrs'),
+          'attrs': {'type': 'object',
+                    'properties': {'timestamp': {'type': 'string', 'minLength': 1}, 'localId': {'type': 'string'}},
+                    'required': ['timestamp'],
+                    'additionalProperties': False},
+          'allowed_content': None,
+          'allowed_marks': None},
+ 'decisionItem': {'prop': {'attrs': 'object', 'content': 'array'},
+                  'required': ('type', 'attrs'),
+                  'attrs': {'type': 'object',
+                            'properties': {'localId': {'type': 'string'}, 'state': {'type': 'string'}},
+                            'required': ['localId', 'state'],
+                            'additionalProperties': False},
+                  'allowed_content': ('date',
+                                      'emoji',
+                                      'hardBreak',
+                                      'inlineCard',
+                                      'inlineExtension',
+                                      'mediaInline',
+                                      'mention',
+                                      'placeholder',
+                                      'status',
+                                      'text'),
+                  'allowed_marks': None},
+ 'decisionList': {'prop': {'attrs': 'object', 'content': 'array'},
+                  'required': ('type', 'attrs', 'content'),
+                  'attrs': {'type': 'object',
+                            'properties': {'localId': {'type': 'string'}},
+                            'required': ['localId'],
+                            'additionalProperties': False},
+                  'allowed_content': ('decisionItem',),
+                  'allowed_marks': None},
+ 'doc': {'prop': {'version': 'string', 'content': 'array'},
+         'required': ('version', 'type', 'content'),
+         'attrs': {},
+         'allowed_content': ('blockCard',
+                             'blockquote',
+                             'bodiedExtension',
+                             'bulletList',
+                             'codeBlock',
+                             'decisionList',
+                             'embedCard',
+                             'expand',
+                             'extension',
+                             'heading',
+                             'layoutSection',
+                             'mediaGroup',
+                             'mediaSingle',
+                             'orderedList',
+                             'panel',
+                             'paragraph',
+                             'rule',
+                             'table',
+                             'taskList'),
+         'allowed_marks': None},
+ 'embedCard': {'prop': {'attrs': 'object'},
+               'required': ('type', 'attrs'),
+               'attrs': {'type': 'object',
+                         'properties': {'url': {'type': 'string'},
+                                        'layout': {'enum': ['wide',
+                                                            'full-width',
+                                                            'center',
+                                                            'wrap-right',
+                                                            'wrap-left',
+                                                            'align-end',
+                                                            'align-start']},
+                                        'width': {'type': 'number', 'minimum': 0, 'maximum': 100},
+                                        'originalHeight': {'type': 'number'},
+                                        'originalWidth': {'type': 'number'},
+                                        'localId': {'type': 'string'}},
+                         'required': ['url', 'layout'],
+                         'additionalProperties': False},
+               'allowed_content': None,
+               'allowed_marks': None},
+ 'emoji': {'prop': {'attrs': 'object'},
+           'required': ('type', 'attrs'),
+           'attrs': {'type': 'object',
+                     'properties': {'id': {'type': 'string'},
+                                    'shortName': {'type': 'string'},
+                                    'text': {'type': 'string'},
+                                    'localId': {'type': 'string'}},
+                     'required': ['shortName'],
+                     'additionalProperties': False},
+           'allowed_content': None,
+           'allowed_marks': None},
+ 'expand': {'prop': {'attrs': 'object', 'content': 'array', 'marks': 'array'},
+            'required': ('type', 'attrs', 'content'),
+            'attrs': {'type': 'object',
+                      'properties': {'title': {'type': 'string'}, 'localId': {'type': 'string'}},
+                      'additionalProperties': False},
+            'allowed_content': ('blockCard',
+                                'blockquote',
+                                'bulletList',
+                                'codeBlock',
+                                'decisionList',
+                                'embedCard',
+                                'extension',
+                                'heading',
+                                'mediaGroup',
+                                'mediaSingle',
+                                'nestedExpand',
+                                'orderedList',
+                                'panel',
+                                'paragraph',
+                                'rule',
+                                'table',
+                                'taskList'),
+            'allowed_marks': ('breakout',)},
+ 'extension': {'prop': {'attrs': 'object', 'marks': 'array'},
+               'required': ('type', 'attrs'),
+               'attrs': {'type': 'object',
+                         'properties': {'extensionKey': {'type': 'string', 'minLength': 1},
+                                        'extensionType': {'type': 'string', 'minLength': 1},
+                                        'parameters': {},
+                                        'text': {'type': 'string'},
+                                        'layout': {'enum': ['wide', 'full-width', 'default']},
+                                        'localId': {'type': 'string', 'minLength': 1}},
+                         'required': ['extensionKey', 'extensionType'],
+                         'additionalProperties': False},
+               'allowed_content': None,
+               'allowed_marks': ('dataConsumer', 'fragment')},
+ 'hardBreak': {'prop': {'attrs': 'object'},
+               'required': ('type',),
+               'attrs': {'type': 'object',
+                         'properties': {'text': {'enum': ['\n']}, 'localId': {'type': 'string'}},
+                         'additionalProperties': False},
+               'allowed_content': None,
+               'allowed_marks': None},
+ 'heading': {'prop': {'attrs': 'object', 'content': 'array', 'marks': 'array'},
+             'required': ('type', 'attrs'),
+             'attrs': {'type': 'object',
+                       'properties': {'level': {'type': 'number', 'minimum': 1, 'maximum': 6},
+                                      'localId': {'type': 'string'}},
+                       'required': ['level'],
+                       'additionalProperties': False},
+             'allowed_content': ('date',
+                                 'emoji',
+                                 'hardBreak',
+                                 'inlineCard',
+                                 'inlineExtension',
+                                 'mediaInline',
+                                 'mention',
+                                 'placeholder',
+                                 'status',
+                                 'text'),
+             'allowed_marks': ('alignment', 'indentation')},
+ 'inlineCard': {'prop': {'attrs': 'object'},
+                'required': ('type', 'attrs'),
+                'attrs': {'anyOf': [{'type': 'object',
+                                     'properties': {'url': {'type': 'string'}, 'localId': {'type': 'string'}},
+                                     'required': ['url'],
+                                     'additionalProperties': False},
+                                    {'type': 'object',
+                                     'properties': {'data': {}, 'localId': {'type': 'string'}},
+                                     'required': ['data'],
+                                     'additionalProperties': False}]},
+                'allowed_content': None,
+                'allowed_marks': None},
+ 'inlineExtension': {'prop': {'attrs': 'object', 'marks': 'array'},
+                     'required': ('type', 'attrs'),
+                     'attrs': {'type': 'object',
+                               'properties': {'extensionKey': {'type': 'string', 'minLength': 1},
+                                              'extensionType': {'type': 'string', 'minLength': 1},
+                                              'parameters': {},
+                                              'text': {'type': 'string'},
+                                              'localId': {'type': 'string', 'minLength': 1}},
+                               'required': ['extensionKey', 'extensionType'],
+                               'additionalProperties': False},
+                     'allowed_content': None,
+                     'allowed_marks': ('dataConsumer', 'fragment')},
+ 'layoutColumn': {'prop': {'attrs': 'object', 'content': 'array'},
+                  'required': ('type', 'content', 'attrs'),
+                  'attrs': {'type': 'object',
+                            'properties': {'width': {'type': 'number', 'minimum': 0, 'maximum': 100},
+                                           'localId': {'type': 'string'}},
+                            'required': ['width'],
+                            'additionalProperties': False},
+                  'allowed_content': ('blockCard',
+                                      'blockquote',
+                                      'bodiedExtension',
+                                      'bulletList',
+                                      'codeBlock',
+                                      'decisionList',
+                                      'embedCard',
+                                      'expand',
+                                      'extension',
+                                      'heading',
+                                      'mediaGroup',
+                                      'mediaSingle',
+                                      'orderedList',
+                                      'panel',
+                                      'paragraph',
+                                      'rule',
+                                      'table',
+                                      'taskList'),
+                  'allowed_marks': None},
+ 'layoutSection': {'prop': {'marks': 'array', 'content': 'array', 'attrs': 'object'},
+                   'required': ('type', 'content'),
+                   'attrs': {'type': 'object',
+                             'properties': {'localId': {'type': 'string'}},
+                             'additionalProperties': False},
+                   'allowed_content': ('layoutColumn',),
+                   'allowed_marks': ('breakout',)},
+ 'listItem': {'prop': {'content': 'array', 'attrs': 'object'},
+              'required': ('type', 'content'),
+              'attrs': {'type': 'object', 'properties': {'localId': {'type': 'string'}}, 'additionalProperties': False},
+              'allowed_content': ('bulletList', 'codeBlock', 'mediaSingle', 'orderedList', 'paragraph', 'taskList'),
+              'allowed_marks': None},
+ 'mediaGroup': {'prop': {'content': 'array', 'attrs': 'object'},
+                'required': ('type', 'content'),
+                'attrs': {'type': 'object',
+                          'properties': {'localId': {'type': 'string'}},
+                          'additionalProperties': False},
+                'allowed_content': ('media',),
+                'allowed_marks': None},
+ 'mediaInline': {'prop': {'attrs': 'object', 'marks': 'array'},
+                 'required': ('type', 'attrs'),
+                 'attrs': {'type': 'object',
+                           'properties': {'type': {'enum': ['link', 'file', 'image']},
+                                          'id': {'type': 'string', 'minLength': 1},
+                                          'collection': {'type': 'string'},
+                                          'height': {'type': 'number'},
+                                          'width': {'type': 'number'},
+                                          'occurrenceKey': {'type': 'string', 'minLength': 1},
+                                          'alt': {'type': 'string'},
+                                          'data': {},
+                                          'localId': {'type': 'string'}},
+                           'required': ['id', 'collection'],
+                           'additionalProperties': False},
+                 'allowed_content': None,
+                 'allowed_marks': ('annotation', 'border', 'link')},
+ 'mediaSingle': {'prop': {'attrs': 'object', 'marks': 'array'},
+                 'required': ('type',),
+                 'attrs': {'type': 'object',
+                           'properties': {'width': {'type': 'number', 'minimum': 0, 'maximum': 100},
+                                          'layout': {'enum': ['wide',
+                                                              'full-width',
+                                                              'center',
+                                                              'wrap-right',
+                                                              'wrap-left',
+                                                              'align-end',
+                                                              'align-start']},
+                                          'widthType': {'enum': ['percentage', 'pixel']},
+                                          'localId': {'type': 'string'}},
+                           'required': ['layout'],
+                           'additionalProperties': False},
+                 'allowed_content': None,
+                 'allowed_marks': ('link',)},
+ 'media': {'prop': {'attrs': 'object', 'marks': 'array'},
+           'required': ('type', 'attrs'),
+           'attrs': {'anyOf': [{'type': 'object',
+                                'properties': {'type': {'enum': ['link', 'file']},
+                                               'id': {'type': 'string', 'minLength': 1},
+                                               'collection': {'type': 'string'},
+                                               'height': {'type': 'number'},
+                                               'width': {'type': 'number'},
+                                               'occurrenceKey': {'type': 'string', 'minLength': 1},
+                                               'alt': {'type': 'string'},
+                                               'localId': {'type': 'string'}},
+                                'required': ['type', 'id', 'collection'],
+                                'additionalProperties': False},
+                               {'type': 'object',
+                                'properties': {'type': {'enum': ['external']},
+                                               'url': {'type': 'string'},
+                                               'alt': {'type': 'string'},
+                                               'width': {'type': 'number'},
+                                               'height': {'type': 'number'},
+                                               'localId': {'type': 'string'}},
+                                'required': ['type', 'url'],
+                                'additionalProperties': False}]},
+           'allowed_content': None,
+           'allowed_marks': ('annotation', 'border', 'link')},
+ 'mention': {'prop': {'attrs': 'object'},
+             'required': ('type', 'attrs'),
+             'attrs': {'type': 'object',
+                       'properties': {'id': {'type': 'string'},
+                                      'text': {'type': 'string'},
+                                      'accessLevel': {'type': 'string'},
+                                      'userType': {'enum': ['DEFAULT', 'SPECIAL', 'APP']},
+                                      'localId': {'type': 'string'}},
+                       'required': ['id'],
+                       'additionalProperties': False},
+             'allowed_content': None,
+             'allowed_marks': None},
+ 'nestedExpand': {'prop': {'attrs': 'object', 'content': 'array'},
+                  'required': ('type', 'content', 'attrs'),
+                  'attrs': {'type': 'object',
+                            'properties': {'title': {'type': 'string'}, 'localId': {'type': 'string'}},
+                            'additionalProperties': False},
+                  'allowed_content': ('blockquote',
+                                      'bulletList',
+                                      'codeBlock',
+                                      'decisionList',
+                                      'heading',
+                                      'mediaGroup',
+                                      'mediaSingle',
+                                      'orderedList',
+                                      'panel',
+                                      'paragraph',
+                                      'rule',
+                                      'taskList'),
+                  'allowed_marks': None},
+ 'orderedList': {'prop': {'attrs': 'object', 'content': 'array'},
+                 'required': ('type', 'content'),
+                 'attrs': {'type': 'object',
+                           'properties': {'order': {'type': 'number', 'minimum': 0}, 'localId': {'type': 'string'}},
+                           'additionalProperties': False},
+                 'allowed_content': ('listItem',),
+                 'allowed_marks': None},
+ 'panel': {'prop': {'attrs': 'object', 'content': 'array'},
+           'required': ('type', 'attrs', 'content'),
+           'attrs': {'type': 'object',
+                     'properties': {'panelType': {'enum': ['info',
+                                                           'note',
+                                                           'tip',
+                                                           'warning',
+                                                           'error',
+                                                           'success',
+                                                           'custom']},
+                                    'panelIcon': {'type': 'string'},
+                                    'panelIconId': {'type': 'string'},
+                                    'panelIconText': {'type': 'string'},
+                                    'panelColor': {'type': 'string'},
+                                    'localId': {'type': 'string'}},
+                     'required': ['panelType'],
+                     'additionalProperties': False},
+           'allowed_content': ('blockCard',
+                               'bulletList',
+                               'codeBlock',
+                               'decisionList',
+                               'extension',
+                               'heading',
+                               'mediaGroup',
+                               'mediaSingle',
+                               'orderedList',
+                               'paragraph',
+                               'rule',
+                               'taskList'),
+           'allowed_marks': None},
+ 'paragraph': {'prop': {'attrs': 'object', 'content': 'array', 'marks': 'array'},
+               'required': ('type',),
+               'attrs': {'type': 'object',
+                         'properties': {'localId': {'type': 'string'}},
+                         'additionalProperties': False},
+               'allowed_content': ('date',
+                                   'emoji',
+                                   'hardBreak',
+                                   'inlineCard',
+                                   'inlineExtension',
+                                   'mediaInline',
+                                   'mention',
+                                   'placeholder',
+                                   'status',
+                                   'text'),
+               'allowed_marks': ('alignment', 'indentation')},
+ 'placeholder': {'prop': {'attrs': 'object'},
+                 'required': ('type', 'attrs'),
+                 'attrs': {'type': 'object',
+                           'properties': {'text': {'type': 'string'}, 'localId': {'type': 'string'}},
+                           'required': ['text'],
+                           'additionalProperties': False},
+                 'allowed_content': None,
+                 'allowed_marks': None},
+ 'rule': {'prop': {'attrs': 'object'},
+          'required': ('type',),
+          'attrs': {'type': 'object', 'properties': {'localId': {'type': 'string'}}, 'additionalProperties': False},
+          'allowed_content': None,
+          'allowed_marks': None},
+ 'status': {'prop': {'attrs': 'object'},
+            'required': ('type', 'attrs'),
+            'attrs': {'type': 'object',
+                      'properties': {'text': {'type': 'string', 'minLength': 1},
+                                     'color': {'enum': ['neutral', 'purple', 'blue', 'red', 'yellow', 'green']},
+                                     'localId': {'type': 'string'},
+                                     'style': {'type': 'string'}},
+                      'required': ['text', 'color'],
+                      'additionalProperties': False},
+            'allowed_content': None,
+            'allowed_marks': None},
+ 'tableCell': {'prop': {'attrs': 'object', 'content': 'array'},
+               'required': ('type', 'content'),
+               'attrs': {'type': 'object',
+                         'properties': {'colspan': {'type': 'number'},
+                                        'rowspan': {'type': 'number'},
+                                        'colwidth': {'type': 'array', 'items': {'type': 'number'}},
+                                        'background': {'type': 'string'},
+                                        'localId': {'type': 'string'}},
+                         'additionalProperties': False},
+               'allowed_content': ('blockCard',
+                                   'blockquote',
+                                   'bulletList',
+                                   'codeBlock',
+                                   'decisionList',
+                                   'embedCard',
+                                   'extension',
+                                   'heading',
+                                   'mediaGroup',
+                                   'mediaSingle',
+                                   'nestedExpand',
+                                   'orderedList',
+                                   'panel',
+                                   'paragraph',
+                                   'rule',
+                                   'taskList'),
+               'allowed_marks': None},
+ 'tableHeader': {'prop': {'attrs': 'object', 'content': 'array'},
+                 'required': ('type', 'content'),
+                 'attrs': {'type': 'object',
+                           'properties': {'colspan': {'type': 'number'},
+                                          'rowspan': {'type': 'number'},
+                                          'colwidth': {'type': 'array', 'items': {'type': 'number'}},
+                                          'background': {'type': 'string'},
+                                          'localId': {'type': 'string'}},
+                           'additionalProperties': False},
+                 'allowed_content': ('blockCard',
+                                     'blockquote',
+                                     'bulletList',
+                                     'codeBlock',
+                                     'decisionList',
+                                     'embedCard',
+                                     'extension',
+                                     'heading',
+                                     'mediaGroup',
+                                     'mediaSingle',
+                                     'nestedExpand',
+                                     'orderedList',
+                                     'panel',
+                                     'paragraph',
+                                     'rule',
+                                     'taskList'),
+                 'allowed_marks': None},
+ 'tableRow': {'prop': {'content': 'array', 'attrs': 'object'},
+              'required': ('type', 'content'),
+              'attrs': {'type': 'object', 'properties': {'localId': {'type': 'string'}}, 'additionalProperties': False},
+              'allowed_content': ('tableCell', 'tableHeader'),
+              'allowed_marks': None},
+ 'table': {'prop': {'attrs': 'object', 'content': 'array', 'marks': 'array'},
+           'required': ('type', 'content'),
+           'attrs': {'type': 'object',
+                     'properties': {'isNumberColumnEnabled': {'type': 'boolean'},
+                                    'width': {'type': 'number'},
+                                    'layout': {'enum': ['wide',
+                                                        'full-width',
+                                                        'center',
+                                                        'align-end',
+                                                        'align-start',
+                                                        'default']},
+                                    'localId': {'type': 'string', 'minLength': 1},
+                                    'displayMode': {'enum': ['default', 'fixed']}},
+                     'additionalProperties': False},
+           'allowed_content': ('tableRow',),
+           'allowed_marks': ('fragment',)},
+ 'taskItem': {'prop': {'attrs': 'object', 'content': 'array'},
+              'required': ('type', 'attrs'),
+              'attrs': {'type': 'object',
+                        'properties': {'localId': {'type': 'string'}, 'state': {'enum': ['TODO', 'DONE']}},
+                        'required': ['localId', 'state'],
+                        'additionalProperties': False},
+              'allowed_content': ('date',
+                                  'emoji',
+                                  'hardBreak',
+                                  'inlineCard',
+                                  'inlineExtension',
+                                  'mediaInline',
+                                  'mention',
+                                  'placeholder',
+                                  'status',
+                                  'text'),
+              'allowed_marks': None},
+ 'taskList': {'prop': {'attrs': 'object', 'content': 'array'},
+              'required': ('type', 'attrs', 'content'),
+              'attrs': {'type': 'object',
+                        'properties': {'localId': {'type': 'string'}},
+                        'required': ['localId'],
+                        'additionalProperties': False},
+              'allowed_content': ('taskItem', 'taskList'),
+              'allowed_marks': None},
+ 'text': {'prop': {'text': 'string', 'marks': 'array'},
+          'required': ('type', 'text'),
+          'attrs': {},
+          'allowed_content': None,
+          'allowed_marks': ('annotation',
+                            'backgroundColor',
+                            'code',
+                            'em',
+                            'link',
+                            'strike',
+                            'strong',
+                            'subsup',
+                            'textColor',
+                            'underline')}}
+
+MARK_LIST = {'alignment': {'prop': {'attrs': 'object'},
+               'required': ('type', 'attrs'),
+               'attrs': {'type': 'object',
+                         'properties': {'align': {'enum': ['center', 'end']}},
+                         'required': ['align'],
+                         'additionalProperties': False},
+               'allowed_content': None,
+               'allowed_marks': None},
+ 'annotation': {'prop': {'attrs': 'object'},
+                'required': ('type', 'attrs'),
+                'attrs': {'type': 'object',
+                          'properties': {'id': {'type': 'string'}, 'annotationType': {'enum': ['inlineComment']}},
+                          'required': ['id', 'annotationType'],
+                          'additionalProperties': False},
+                'allowed_content': None,
+                'allowed_marks': None},
+ 'backgroundColor': {'prop': {'attrs': 'object'},
+                     'required': ('type', 'attrs'),
+                     'attrs': {'type': 'object',
+                               'properties': {'color': {'type': 'string', 'pattern': '^#[0-9a-fA-F]{6}$'}},
+                               'required': ['color'],
+                               'additionalProperties': False},
+                     'allowed_content': None,
+                     'allowed_marks': None},
+ 'border': {'prop': {'attrs': 'object'},
+            'required': ('type', 'attrs'),
+            'attrs': {'type': 'object',
+                      'properties': {'size': {'type': 'number', 'minimum': 1, 'maximum': 3},
+                                     'color': {'type': 'string', 'pattern': '^#[0-9a-fA-F]{8}$|^#[0-9a-fA-F]{6}$'}},
+                      'required': ['size', 'color'],
+                      'additionalProperties': False},
+            'allowed_content': None,
+            'allowed_marks': None},
+ 'breakout': {'prop': {'attrs': 'object'},
+              'required': ('type', 'attrs'),
+              'attrs': {'type': 'object',
+                        'properties': {'mode': {'enum': ['wide', 'full-width']}, 'width': {'type': 'number'}},
+                        'required': ['mode'],
+                        'additionalProperties': False},
+              'allowed_content': None,
+              'allowed_marks': None},
+ 'code': {'prop': {}, 'required': ('type',), 'attrs': {}, 'allowed_content': None, 'allowed_marks': None},
+ 'dataConsumer': {'prop': {'attrs': 'object'},
+                  'required': ('type', 'attrs'),
+                  'attrs': {'type': 'object',
+                            'properties': {'sources': {'type': 'array', 'items': {'type': 'string'}, 'minItems': 1}},
+                            'required': ['sources'],
+                            'additionalProperties': False},
+                  'allowed_content': None,
+                  'allowed_marks': None},
+ 'em': {'prop': {}, 'required': ('type',), 'attrs': {}, 'allowed_content': None, 'allowed_marks': None},
+ 'fragment': {'prop': {'attrs': 'object'},
+              'required': ('type', 'attrs'),
+              'attrs': {'type': 'object',
+                        'properties': {'localId': {'type': 'string', 'minLength': 1}, 'name': {'type': 'string'}},
+                        'required': ['localId'],
+                        'additionalProperties': False},
+              'allowed_content': None,
+              'allowed_marks': None},
+ 'indentation': {'prop': {'attrs': 'object'},
+                 'required': ('type', 'attrs'),
+                 'attrs': {'type': 'object',
+                           'properties': {'level': {'type': 'number', 'minimum': 1, 'maximum': 6}},
+                           'required': ['level'],
+                           'additionalProperties': False},
+                 'allowed_content': None,
+                 'allowed_marks': None},
+ 'link': {'prop': {'attrs': 'object'},
+          'required': ('type', 'attrs'),
+          'attrs': {'type': 'object',
+                    'properties': {'href': {'type': 'string'},
+                                   'title': {'type': 'string'},
+                                   'id': {'type': 'string'},
+                                   'collection': {'type': 'string'},
+                                   'occurrenceKey': {'type': 'string'}},
+                    'required': ['href'],
+                    'additionalProperties': False},
+          'allowed_content': None,
+          'allowed_marks': None},
+ 'strike': {'prop': {}, 'required': ('type',), 'attrs': {}, 'allowed_content': None, 'allowed_marks': None},
+ 'strong': {'prop': {}, 'required': ('type',), 'attrs': {}, 'allowed_content': None, 'allowed_marks': None},
+ 'subsup': {'prop': {'attrs': 'object'},
+            'required': ('type', 'attrs'),
+            'attrs': {'type': 'object',
+                      'properties': {'type': {'enum': ['sub', 'sup']}},
+                      'required': ['type'],
+                      'additionalProperties': False},
+            'allowed_content': None,
+            'allowed_marks': None},
+ 'textColor': {'prop': {'attrs': 'object'},
+               'required': ('type', 'attrs'),
+               'attrs': {'type': 'object',
+                         'properties': {'color': {'type': 'string', 'pattern': '^#[0-9a-fA-F]{6}$'}},
+                         'required': ['color'],
+                         'additionalProperties': False},
+               'allowed_content': None,
+               'allowed_marks': None},
+ 'underline': {'prop': {}, 'required': ('type',), 'attrs': {}, 'allowed_content': None, 'allowed_marks': None}}
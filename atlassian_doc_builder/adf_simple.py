@@ -10,6 +10,8 @@ ADFHardBreak, ADFRule = tuple(
 
 
 class ADFText(ADFObject.node_class_factory('text')):
+    __slots__ = ()
+
     def __init__(self, text=None, chain_mode=True, **kwargs):
         if not text and 'text' not in kwargs:
             raise ValueError('Text cannot be empty.')
@@ -25,6 +27,8 @@ class ADFText(ADFObject.node_class_factory('text')):
 
 
 class ADFDate(ADFObject.node_class_factory('date')):
+    __slots__ = ()
+
     def __init__(self, timestamp=None, chain_mode=True, **kwargs):
         new_kwargs = {k: v for k, v in kwargs.items() if k != 'attrs'}
         super(ADFDate, self).__init__(chain_mode=chain_mode, **new_kwargs)
@@ -49,6 +53,8 @@ class ADFDate(ADFObject.node_class_factory('date')):
 
 
 class ADFPlaceholder(ADFObject.node_class_factory('placeholder')):
+    __slots__ = ()
+
     def __init__(self, text=None, chain_mode=True, **kwargs):
         new_kwargs = {k: v for k, v in kwargs.items() if k != 'attrs'}
         super(ADFPlaceholder, self).__init__(chain_mode=chain_mode, **new_kwargs)
@@ -65,6 +71,8 @@ class ADFPlaceholder(ADFObject.node_class_factory('placeholder')):
 
 
 class ADFStatus(ADFObject.node_class_factory('status')):
+    __slots__ = ()
+
     def __init__(self, text=None, color=None, chain_mode=True, **kwargs):
         new_kwargs = {k: v for k, v in kwargs.items() if k != 'attrs'}
         super(ADFPlaceholder, self).__init__(chain_mode=chain_mode, **new_kwargs)
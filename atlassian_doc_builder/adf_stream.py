@@ -0,0 +1,166 @@
+import codecs
+import csv
+import json
+
+from .adf_object import ADFObject, load_adf
+from .adf_table import _iter_raw_rows
+
+_JSON_DECODER = json.JSONDecoder()
+_JSON_ENCODER = json.JSONEncoder()
+_WHITESPACE = ' \t\n\r'
+
+
+class _StreamBuffer:
+    """
+    Text of a file object read on demand. The consumed text is dropped, only the value being decoded is kept.
+    """
+
+    def __init__(self, fp, chunk_size):
+        self.fp, self.chunk_size = fp, chunk_size
+        self.text, self.pos, self.eof = '', 0, False
+        self._utf8_decoder = codecs.getincrementaldecoder('utf-8')()
+
+    def _read(self, size):
+        chunk = self.fp.read(size)
+        if isinstance(chunk, bytes):
+            chunk = self._utf8_decoder.decode(chunk, final=not chunk)
+        self.eof = not chunk
+        self.text, self.pos = self.text[self.pos:] + chunk, 0
+
+    def peek(self):
+        # Next non-whitespace character, empty at the end of the file.
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text) or self.eof:
+                return self.text[self.pos:self.pos + 1]
+            self._read(self.chunk_size)
+
+    def expect(self, characters):
+        if not (char := self.peek()) or char not in characters:
+            raise json.JSONDecodeError(f'Expecting one of {characters!r}', self.text, self.pos)
+        self.pos += 1
+        return char
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = _JSON_DECODER.raw_decode(self.text, self.pos)
+                # A number or a literal at the end of the buffer may continue in the next chunk.
+                if end < len(self.text) or self.eof or self.text[self.pos] in '{["':
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            # Read as much as buffered, large values are decoded in amortised linear time.
+            self._read(max(self.chunk_size, len(self.text) - self.pos))
+
+
+def _iter_blocks(fp, fields, trusted, lazy, chunk_size):
+    buffer = _StreamBuffer(fp, chunk_size)
+    buffer.expect('{')
+    if buffer.peek() == '}':
+        return
+    while True:
+        if not isinstance(key := buffer.value(), str):
+            raise json.JSONDecodeError('Expecting property name', buffer.text, buffer.pos)
+        buffer.expect(':')
+        if key != 'content':
+            fields[key] = buffer.value()
+        elif buffer.expect('[') and buffer.peek() == ']':
+            buffer.expect(']')
+        else:
+            while True:
+                yield load_adf(buffer.value(), trusted=trusted, lazy=lazy)
+                if buffer.expect(',]') == ']':
+                    break
+        if buffer.expect(',}') == '}':
+            return
+
+
+def iter_load_adf(fp, trusted=False, lazy=False, chunk_size=1 << 16):
+    """
+    Load the top-level blocks of an ADF document one by one, reading the file incrementally.
+    Only one block is held in memory at a time. The blocks are not attached to a parent.
+    :param fp: File object opened in text or binary (UTF-8) mode.
+    :param trusted: See load_adf().
+    :param lazy: See load_adf().
+    :param chunk_size: Size of each read.
+    :return: Iterator of ADFObject, one per item of "content" of the top-level node.
+    """
+    yield from _iter_blocks(fp, {}, trusted, lazy, chunk_size)
+
+
+def load_adf_stream(fp, callback, trusted=False, lazy=False, chunk_size=1 << 16) -> ADFObject:
+    """
+    Load an ADF document incrementally, calling the callback with each top-level block. See iter_load_adf().
+    :param fp: File object opened in text or binary (UTF-8) mode.
+    :param callback: Called with each block as ADFObject.
+    :return: The top-level node with all its fields except "content", e.g. ADFDoc with "version".
+    """
+    fields = {}
+    for block in _iter_blocks(fp, fields, trusted, lazy, chunk_size):
+        callback(block)
+    return load_adf(fields, trusted=trusted)
+
+
+def iter_csv_table_chunks(csv_file, header=True, max_rows=None, formatters=None, as_doc=False, **csv_options):
+    """
+    Convert CSV to ADF tables, generating the JSON text piece by piece. The CSV file is read row by row.
+    The tables are the same as ADFTable.from_rows(), one text cell per value.
+    :param csv_file: Text stream of CSV, or any iterable of lines accepted by csv.reader().
+    :param header: True: The first row is the header row. False: No header row. Or the texts of the header row.
+    :param max_rows: Maximum number of rows in a table, excluding the header row. More rows are split into another
+        table, with the header row repeated. Default: No limit.
+    :param formatters: See ADFTable.from_rows(). The values are strings.
+    :param as_doc: Output a "doc" node. Otherwise, a JSON array of "table" nodes.
+    :param csv_options: Passed to csv.reader(), e.g. delimiter.
+    :return: Iterator of str
+    """
+    reader = csv.reader(csv_file, **csv_options)
+    if header is True:
+        header = next(reader, None)
+    raw_rows = _iter_raw_rows(reader, header or None, formatters)
+    table_start = '{"type": "table", "content": ['
+    if header:
+        table_start += _JSON_ENCODER.encode(next(raw_rows)) + ', '
+
+    yield '{"version": 1, "type": "doc", "content": [' if as_doc else '['
+    table_count, table_rows = 0, 0
+    for raw_row in raw_rows:
+        if table_rows == 0:
+            yield (', ' if table_count else '') + table_start
+            table_count += 1
+        else:
+            yield ', '
+        yield _JSON_ENCODER.encode(raw_row)
+        table_rows += 1
+        if table_rows == max_rows:
+            yield ']}'
+            table_rows = 0
+    if table_rows:
+        yield ']}'
+    elif table_count == 0 and header:
+        yield table_start[:-2] + ']}'  # A table of the header row only.
+    yield ']}' if as_doc else ']'
+
+
+def write_csv_tables(csv_file, fp, header=True, max_rows=None, formatters=None, as_doc=False, buffer_size=1 << 16,
+                     **csv_options):
+    """
+    Write CSV as ADF tables to a text stream, without holding the tables in memory. See iter_csv_table_chunks().
+    :param csv_file: Text stream of CSV, e.g. open(path, newline='').
+    :param fp: Text stream with write().
+    :param buffer_size: Number of characters collected before each write.
+    """
+    buffered, buffered_size = [], 0
+    for chunk in iter_csv_table_chunks(csv_file, header, max_rows, formatters, as_doc, **csv_options):
+        buffered.append(chunk)
+        buffered_size += len(chunk)
+        if buffered_size >= buffer_size:
+            fp.write(''.join(buffered))
+            buffered, buffered_size = [], 0
+    if buffered:
+        fp.write(''.join(buffered))
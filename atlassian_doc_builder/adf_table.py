@@ -1,13 +1,102 @@
-from typing import Optional, List
+from itertools import zip_longest
+from typing import Callable, Iterable, List, Mapping, Optional, Sequence, Union
 
 from .adf_content_node import ADFContentObject
-from .adf_object import ADFObject
+from .adf_frozen import freeze
+from .adf_object import ADFObject, LazyContentList, _cells_width
+
+
+def _row_width(row):
+    # Rows created by add('tableRow') are not ADFTableRow.
+    return row.width if isinstance(row, ADFTableRow) else _cells_width(row.local_info['content'])
+
+
+def _raw_row(texts, cell_type, colspan_attrs):
+    # Rendered tableRow of one paragraph per cell, shared attrs are never modified by the lazy loader.
+    return {'type': 'tableRow', 'content': [
+        {'attrs': colspan_attrs, 'type': cell_type, 'content': [
+            {'type': 'paragraph', 'content': [{'text': text, 'type': 'text'}]} if text else {'type': 'paragraph'}
+        ]}
+        for text in texts
+    ]}
+
+
+def _iter_raw_rows(rows, header, formatters):
+    # Rendered rows of ADFTable.from_rows(), the header row first. See ADFTable.from_rows().
+    formatters, colspan_attrs = formatters or {}, {'colspan': 1}
+    width, column_formatters = None, None
+    if header is not None:
+        yield _raw_row([str(text) for text in header], 'tableHeader', colspan_attrs)
+        width = len(header)
+    for row in rows:
+        values = row if isinstance(row, (list, tuple)) else list(row)
+        if width is None:
+            width = len(values)
+        if column_formatters is None:
+            column_formatters = [
+                formatters.get(i, formatters.get(header[i]) if header is not None else None) or str
+                for i in range(width)
+            ]
+        if len(values) > width:
+            raise ValueError('Input Row is wider than the existing table.')
+        yield _raw_row(
+            ['' if value is None else formatter(value) for formatter, value in zip(column_formatters, values)] +
+            [''] * (width - len(values)),
+            'tableCell', colspan_attrs
+        )
+
+
+class ColumnarContentList(LazyContentList):
+    """
+    "content" of a table from ADFTable.from_columns(columnar=True).
+    The texts of the cells are kept by column. The rows are kept as their index in the columns, rendered on demand
+    without being stored, and turned into ADFObject on the first access by index, iteration or pop().
+    """
+    HEADER_ROW = -1
+
+    def __init__(self, columns, header, owner, rows=None):
+        self._columns, self._header, self._colspan_attrs = columns, header, {'colspan': 1}
+        if rows is None:
+            rows = ([self.HEADER_ROW] if header is not None else []) + \
+                list(range(max((len(column) for column in columns), default=0)))
+        super(ColumnarContentList, self).__init__(rows, owner)
+
+    def _raw_row(self, row):
+        if row == self.HEADER_ROW:
+            return _raw_row(self._header, 'tableHeader', self._colspan_attrs)
+        return _raw_row(
+            [column[row] if row < len(column) else '' for column in self._columns], 'tableCell', self._colspan_attrs
+        )
+
+    def _materialize(self, index):
+        if isinstance(row := list.__getitem__(self, index), int):
+            # The row of a rendered table is loaded from that render, so that its edits reach the table.
+            list.__setitem__(self, index, self._owner._rendered['content'][index]
+                             if self._owner._rendered is not None else self._raw_row(row))
+        return super(ColumnarContentList, self)._materialize(index)
+
+    def raw_items(self, freeze_raw=False):
+        for child in list.__iter__(self):
+            if isinstance(child, int):
+                child = freeze(self._raw_row(child)) if freeze_raw else self._raw_row(child)
+            yield child
+
+    def _with_children(self, children, owner):
+        return ColumnarContentList(self._columns, self._header, owner, rows=children)
+
+
+def _content_values(values):
+    # Child nodes passed to assign_info('content', ...).
+    return values[0] if values and isinstance(values[0], list) else values
+
 
 ADFTableCell = ADFContentObject.node_class_factory('tableCell')
 ADFTableHeader = ADFContentObject.node_class_factory('tableHeader')
 
 
 class ADFTable(ADFContentObject.node_class_factory('table')):
+    __slots__ = ('_width',)  # Width of the widest row, not set when it is not counted yet.
+
     def __init__(self, chain_mode=True, **kwargs):
         super(ADFTable, self).__init__(chain_mode=chain_mode, **kwargs)
 
@@ -36,6 +125,92 @@ class ADFTable(ADFContentObject.node_class_factory('table')):
         table.extend_content(rows)
         return table
 
+    @classmethod
+    def from_rows(cls,
+                  rows: Iterable[Sequence],
+                  header: Optional[Sequence[str]] = None,
+                  formatters: Optional[Mapping[Union[int, str], Callable]] = None):
+        """
+        Build a table with a text cell per value, in a single pass over the rows.
+        The rows are kept rendered and built into nodes on first access, see load_adf(lazy=True).
+        :param rows: Iterable of rows, each one a sequence of values. Short rows are filled with empty cells.
+        :param header: Text of the header row. Default: No header row.
+        :param formatters: Function converting the values of a column to text, by column index or header text.
+            Default: str(). None is always an empty cell.
+        :return: ADFTable
+        """
+        raw_rows = list(_iter_raw_rows(rows, header, formatters))
+        table = cls()
+        table.local_info['content'] = LazyContentList(raw_rows, table)
+        table._width = len(raw_rows[0]['content']) if raw_rows else 0
+        return table
+
+    @classmethod
+    def from_columns(cls,
+                     columns: Mapping[str, Sequence],
+                     header=True,
+                     formatters: Optional[Mapping[Union[int, str], Callable]] = None,
+                     columnar=False):
+        """
+        Build a table from columns of values. See from_rows().
+        :param columns: Values of each column by the header text. Short columns are filled with empty cells.
+        :param header: Add a header row with the keys of the columns.
+        :param formatters: By column index or key of the column.
+        :param columnar: Keep the texts of the cells by column, see ColumnarContentList. A row takes a few bytes
+            until it is accessed. render() still builds all the rows, write_json() does not keep them.
+        :return: ADFTable
+        """
+        names = list(columns)
+        formatters = {
+            key if isinstance(key, int) else names.index(key): formatter
+            for key, formatter in (formatters or {}).items()
+        }
+        if not columnar:
+            return cls.from_rows(zip_longest(*columns.values()), header=names if header else None,
+                                 formatters=formatters)
+
+        table = cls()
+        table.local_info['content'] = ColumnarContentList(
+            tuple(
+                tuple('' if value is None else formatter(value) for value in values)
+                for formatter, values in ((formatters.get(i, str), values) for i, values in enumerate(columns.values()))
+            ),
+            [str(name) for name in names] if header else None, table
+        )
+        table._width = len(names)
+        return table
+
+    @classmethod
+    def from_dataframe(cls,
+                       dataframe,
+                       header=True,
+                       index=False,
+                       formatters: Optional[Mapping[Union[int, str], Callable]] = None):
+        """
+        Build a table from a pandas DataFrame. pandas is not required by the package. See from_rows().
+        :param dataframe: pandas.DataFrame, or any object with "columns", "index.name" and "itertuples()".
+        :param header: Add a header row with the column names.
+        :param index: Add the index as the first column.
+        :return: ADFTable
+        """
+        names = ([dataframe.index.name or ''] if index else []) + [str(name) for name in dataframe.columns]
+        return cls.from_rows(
+            dataframe.itertuples(index=index, name=None),
+            header=names if header else None, formatters=formatters
+        )
+
+    @classmethod
+    def from_array(cls,
+                   array,
+                   header: Optional[Sequence[str]] = None,
+                   formatters: Optional[Mapping[Union[int, str], Callable]] = None):
+        """
+        Build a table from a 2-dimensional NumPy array. NumPy is not required by the package. See from_rows().
+        :param array: numpy.ndarray, or any object with "tolist()".
+        :return: ADFTable
+        """
+        return cls.from_rows(array.tolist(), header=header, formatters=formatters)
+
     def append_row(self, spanned_layout: Optional[List[int]] = None):
         if spanned_layout is None:
             new_row = ADFTableRow.create(dimension=self._max_width)
@@ -50,22 +225,27 @@ class ADFTable(ADFContentObject.node_class_factory('table')):
         if any(row.type != 'tableRow' for row in rows):
             raise RuntimeError(f'ADFTable only accepts tableRow as child node. {rows=}')
 
-        if any(
-                sum((cell.local_info['attrs']['colspan'] for cell in row), 0) > self._max_width for row in rows
-        ) and self._max_width != 0:
+        if (max_width := self._max_width) != 0 and any(_row_width(row) > max_width for row in rows):
             raise ValueError('Input Row is wider than the existing table.')
 
         return super(ADFTable, self).extend_content(rows)
 
+    def assign_info(self, field, *values, **kwargs):
+        super(ADFTable, self).assign_info(field, *values, **kwargs)
+        if field == 'content' and (width := getattr(self, '_width', None)) is not None:
+            self._width = max((width, *(_row_width(row) for row in _content_values(values))))
+        return self
+
     @property
     def _max_width(self):
-        return max(
-            (sum((cell.local_info['attrs']['colspan'] for cell in row), 0) for row in self),
-            default=0
-        )
+        if getattr(self, '_width', None) is None:
+            self._width = max((_row_width(row) for row in self), default=0)
+        return self._width
 
 
 class ADFTableRow(ADFContentObject.node_class_factory('tableRow')):
+    __slots__ = ('_width',)  # Sum of colspan of the cells, not set when it is not counted yet.
+
     @classmethod
     def create(cls,
                dimension: Optional[int] = None,
@@ -90,3 +270,12 @@ class ADFTableRow(ADFContentObject.node_class_factory('tableRow')):
             raise RuntimeError(f'ADFTableRow only accept child type of "tableCell"or "tableHeader"')
 
         return super(ADFTableRow, self).extend_content(cells)
+
+    @property
+    def width(self):
+        """
+        Number of columns covered by the row, the sum of colspan of the cells.
+        """
+        if getattr(self, '_width', None) is None:
+            self._width = _cells_width(self)
+        return self._width
@@ -0,0 +1,157 @@
+import itertools
+import os
+import string
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Iterable, Mapping
+
+from .adf_frozen import FrozenDict, FrozenList
+from .adf_object import ADFObject, load_adf
+
+
+class ADFTemplate:
+    """
+    Template compiled from a node by compile_template(). Fill the variables with render() or load().
+    The template is a snapshot of the node, later changes of the node are not reflected.
+    """
+
+    def __init__(self, node: ADFObject):
+        self._rendered = node.render()
+        # Each entry: (path, container in the template, [(key, format pieces or None for a filled child)]).
+        # In post-order, children are filled before their parent.
+        self._plan = []
+
+        plan_stack, variables = [((), self._rendered, False)], set()
+        placeholders = {}  # path of the container -> [(key, pieces)]
+        while plan_stack:
+            path, container, children_visited = plan_stack.pop()
+            if children_visited:
+                if items := placeholders.pop(path, None):
+                    self._plan.append((path, container, items))
+                    if path:
+                        placeholders.setdefault(path[:-1], []).append((path[-1], None))
+                continue
+            plan_stack.append((path, container, True))
+            for key, value in (container.items() if isinstance(container, dict) else enumerate(container)):
+                if isinstance(value, str) and isinstance(container, dict):
+                    if pieces := self._parse(value):
+                        placeholders.setdefault(path, []).append((key, pieces))
+                        variables.update(name for _, name in pieces if name is not None)
+                elif isinstance(value, dict) or (isinstance(value, list) and key in ('content', 'marks')):
+                    plan_stack.append((path + (key,), value, False))
+        self.variables = frozenset(variables)
+
+    @staticmethod
+    def _parse(text):
+        # Same check as ADFObject.apply_variable().
+        if not (expressions := ADFObject.PATTERN_EXP.findall(text)):
+            return None
+        invalid_variables = [expression for expression in expressions if
+                             ADFObject.PATTERN_VAR.fullmatch(expression[1:-1].strip()) is None]
+        if invalid_variables:
+            raise ValueError(f'Invalid expression detected: {invalid_variables}')
+        return tuple((literal, name) for literal, name, _, _ in string.Formatter().parse(text))
+
+    def render(self, **kwargs) -> FrozenDict:
+        """
+        Render the template with the variables filled, as ADFObject.render() does after apply_variable().
+        Parts of the template without variables are shared between the outputs.
+        :param kwargs: Variables to be replaced. KeyError is raised if any is missing.
+        :return: FrozenDict
+        """
+        filled = {}
+        for path, container, items in self._plan:
+            new_container = dict(container) if isinstance(container, dict) else list(container)
+            for key, pieces in items:
+                new_container[key] = filled.pop(path + (key,)) if pieces is None else ''.join(
+                    literal + format(kwargs[name]) if name is not None else literal for literal, name in pieces
+                )
+            filled[path] = FrozenDict(new_container) if isinstance(container, dict) else FrozenList(new_container)
+        return filled.get((), self._rendered)
+
+    def load(self, **kwargs) -> ADFObject:
+        """
+        Build a new node with the variables filled. See render().
+        :return: ADFObject
+        """
+        return load_adf(self.render(**kwargs), trusted=True)
+
+
+def compile_template(node: ADFObject) -> ADFTemplate:
+    """
+    Compile a node into a template. The node is scanned once and not modified.
+    The variables of the template follow ADFObject.apply_variable().
+    :param node: Top node of the template.
+    :return: ADFTemplate
+    """
+    return ADFTemplate(node)
+
+
+_worker_template = None
+
+
+def _init_worker(template):
+    global _worker_template
+    _worker_template = template
+
+
+def _render_chunk(chunk, template, transform):
+    template = template if template is not None else _worker_template
+    if transform is None:
+        return [(index, template.render(**variables)) for index, variables in chunk]
+    return [(index, transform(template.render(**variables))) for index, variables in chunk]
+
+
+def render_batch(template: ADFTemplate, variable_sets: Iterable[Mapping], workers=None, executor='process',
+                 chunk_size=256, ordered=True, transform=None):
+    """
+    Render a template with each set of variables in a pool of workers. The results are streamed, the input is consumed
+    as the workers progress and may be a generator.
+    The template is sent to each worker process once, only the variables and the outputs are sent per render.
+    :param template: ADFTemplate from compile_template().
+    :param variable_sets: Iterable of mappings, each one passed to ADFTemplate.render().
+    :param workers: Number of workers. Default: Number of CPUs.
+    :param executor: "process" (ProcessPoolExecutor) or "thread" (ThreadPoolExecutor).
+    :param chunk_size: Number of renders sent to a worker at a time.
+    :param ordered: Yield the outputs in the order of the input. Otherwise, yield (index, output) as completed.
+    :param transform: Function applied to each output in the worker, e.g. json.dumps. Must be picklable for processes.
+    :return: Iterator of FrozenDict (or of the result of transform), paired with the index in the input if not ordered.
+    """
+    if executor not in ('process', 'thread'):
+        raise ValueError(f'Unknown executor: {executor}. Choose from ("process", "thread").')
+    return _iter_render_batch(
+        template, variable_sets, workers or os.cpu_count() or 1, executor, chunk_size, ordered, transform
+    )
+
+
+def _iter_render_batch(template, variable_sets, workers, executor, chunk_size, ordered, transform):
+    if executor == 'process':
+        pool, template_arg = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(template,)), None
+    else:
+        pool, template_arg = ThreadPoolExecutor(workers), template
+
+    indexed_input = enumerate(variable_sets)
+    chunks = iter(lambda: list(itertools.islice(indexed_input, chunk_size)), [])
+    pending = deque() if ordered else set()
+    try:
+        # Keep each worker busy with at most 2 chunks, the input and the outputs are not held at once.
+        for chunk in itertools.islice(chunks, workers * 2):
+            (pending.append if ordered else pending.add)(pool.submit(_render_chunk, chunk, template_arg, transform))
+        while pending:
+            if ordered:
+                done = [pending.popleft()]
+            else:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                for index, output in future.result():
+                    yield output if ordered else (index, output)
+                for chunk in itertools.islice(chunks, 1):
+                    next_future = pool.submit(_render_chunk, chunk, template_arg, transform)
+                    if ordered:
+                        pending.append(next_future)
+                    else:
+                        pending.add(next_future)
+    finally:
+        for future in pending:
+            future.cancel()
+        pool.shutdown()
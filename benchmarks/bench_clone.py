@@ -0,0 +1,36 @@
+import time
+import tracemalloc
+
+from atlassian_doc_builder import ADFLink, ADFParagraph, ADFText, load_adf
+
+
+def build_section(paragraphs):
+    # 5 objects per paragraph.
+    return ADFParagraph().extend_content([
+        node
+        for i in range(paragraphs)
+        for node in (ADFText(f'text {i}').add('strong'), ADFText('link').add(ADFLink(f'http://localhost/{i}')))
+    ])
+
+
+def measure(func, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(*args)
+    cost = time.perf_counter() - start
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return cost, current
+
+
+if __name__ == '__main__':
+    section = build_section(20)
+    section.render()
+    for name, case in {
+        'load_adf(render())': lambda: [load_adf(section.render(mutable=True)) for _ in range(500)],
+        'load_adf(trusted=True)': lambda: [load_adf(section.render(), trusted=True) for _ in range(500)],
+        'clone()': lambda: [section.clone() for _ in range(500)],
+    }.items():
+        cost, memory = measure(case)
+        print(f'500 copies of 100 objects {name:<26}{cost * 1000:10.1f} ms{memory / 2 ** 20:10.2f} MiB retained')
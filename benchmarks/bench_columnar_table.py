@@ -0,0 +1,44 @@
+import time
+import tracemalloc
+
+from atlassian_doc_builder import ADFParagraph, ADFTable, ADFText
+
+
+class NullWriter:
+    # Discard the output, only the memory used by the serializer is measured.
+    def write(self, text):
+        return len(text)
+
+
+def build_nodes(columns):
+    table = ADFTable.create([len(columns), len(next(iter(columns.values())))])
+    for row, values in zip(table, zip(*columns.values())):
+        for cell, value in zip(row, values):
+            cell.add(ADFParagraph().add(ADFText(str(value))))
+    return table
+
+
+def measure(func, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(*args)
+    cost = time.perf_counter() - start
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, cost, current
+
+
+if __name__ == '__main__':
+    rows = 20000
+    columns = {f'col {i}': list(range(i * rows, (i + 1) * rows)) for i in range(5)}
+    for name, build in {
+        'ADFTable.create()': build_nodes,
+        'from_columns()': lambda c: ADFTable.from_columns(c),
+        'from_columns(columnar=True)': lambda c: ADFTable.from_columns(c, columnar=True),
+    }.items():
+        table, _, memory = measure(build, columns)
+        start = time.perf_counter()
+        table.write_json(NullWriter())
+        cost = time.perf_counter() - start
+        print(f'{rows * 5} cells {name:<30}{memory / 2 ** 20:8.2f} MiB retained, write_json() {cost * 1000:8.1f} ms')
+        del table
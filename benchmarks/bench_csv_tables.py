@@ -0,0 +1,51 @@
+import csv
+import os
+import tempfile
+import time
+import tracemalloc
+
+from atlassian_doc_builder import ADFDoc, ADFTable, write_csv_tables
+
+
+class NullWriter:
+    # Discard the output, only the memory used by the conversion is measured.
+    def write(self, text):
+        return len(text)
+
+
+def write_csv(path, rows):
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['id', 'name', 'amount', 'date'])
+        writer.writerows([i, f'name {i}', i * 0.5, '2024-01-01'] for i in range(rows))
+
+
+def measure(func, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(*args)
+    cost = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return cost, peak
+
+
+def from_rows(f):
+    reader = csv.reader(f)
+    header = next(reader)
+    ADFDoc().add(ADFTable.from_rows(reader, header=header)).write_json(NullWriter())
+
+
+if __name__ == '__main__':
+    cases = {
+        'ADFTable.from_rows()': from_rows,
+        'write_csv_tables()': lambda f: write_csv_tables(f, NullWriter(), as_doc=True),
+        'write_csv_tables(max_rows)': lambda f: write_csv_tables(f, NullWriter(), max_rows=1000, as_doc=True),
+    }
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for rows in (10 ** 4, 10 ** 5):
+            write_csv(path := os.path.join(temp_dir, f'{rows}.csv'), rows)
+            for name, case in cases.items():
+                with open(path, newline='') as f:
+                    cost, peak = measure(case, f)
+                print(f'{rows:>7} rows {name:<28}{cost * 1000:10.1f} ms{peak / 2 ** 20:10.2f} MiB peak')
@@ -0,0 +1,60 @@
+import time
+import tracemalloc
+
+from atlassian_doc_builder import ADFDoc, ADFEm, ADFLink, ADFPanel, ADFParagraph, ADFStrong, ADFTable, ADFTableCell, \
+    ADFTableHeader, ADFTableRow, ADFText
+
+
+def build_row(cell_class, texts):
+    return ADFTableRow().extend_content([
+        cell_class(attrs={'colspan': 1}).add(ADFParagraph().add(ADFText(text))) for text in texts
+    ])
+
+
+def build_doc(sections):
+    # Each section: The same disclaimer panel, a status table with the same header row and an empty paragraph.
+    # 36 objects per section, 27 of them repeated.
+    doc = ADFDoc()
+    for i in range(sections):
+        doc.extend_content([
+            ADFPanel('warning').extend_content([
+                ADFParagraph().extend_content([
+                    ADFText('Generated report. ').add(ADFEm()),
+                    ADFText('Do not edit').add(ADFStrong()),
+                    ADFText(', see the guide').add(ADFLink('http://localhost/guide')),
+                ]),
+                ADFParagraph().add(ADFText('Contact the owners for any question.')),
+            ]),
+            ADFTable().extend_content([
+                build_row(ADFTableHeader, ['Job', 'Status', 'Duration']),
+                build_row(ADFTableCell, [f'job {i}', 'passed', f'{i % 60} s']),
+            ]),
+            ADFParagraph(),
+        ])
+    return doc
+
+
+def measure(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def retained(func, *args):
+    tracemalloc.start()
+    result = func(*args)
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return current
+
+
+if __name__ == '__main__':
+    # The retained memory of the cases with render() includes the document and its render.
+    for name, case in {
+        'build': lambda: build_doc(5000),
+        'build, dedupe()': lambda: build_doc(5000).dedupe(),
+        'build, render()': lambda: (doc := build_doc(5000), doc.render()),
+        'build, dedupe(), render()': lambda: (doc := build_doc(5000).dedupe(), doc.render()),
+    }.items():
+        print(f'5k sections {name:<28}{measure(case) * 1000:10.1f} ms{retained(case) / 2 ** 20:10.2f} MiB retained')
@@ -0,0 +1,37 @@
+import json
+import time
+
+from atlassian_doc_builder import ADFDoc, ADFParagraph, ADFText, diff, load_adf
+
+
+def build_doc(paragraphs):
+    return ADFDoc().extend_content([
+        ADFParagraph().extend_content([ADFText(f'line {i}').add('strong'), ADFText(' text')]) for i in range(paragraphs)
+    ])
+
+
+def measure(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    # The documents are hashed by the first diff(), the next calls only compare the changed subtrees.
+    old = build_doc(20000)
+    old_render = old.render()
+    for name, edit in {
+        'no change': lambda doc: None,
+        '1 text changed': lambda doc: setattr(doc[10000, 0], 'text', 'edited'),
+        '1 paragraph inserted': lambda doc: doc.local_info['content'].insert(10000, ADFParagraph()),
+    }.items():
+        new = build_doc(20000)
+        edit(new)
+        new._invalidate()
+        new_render = new.render()
+        print(f'60k nodes, {name:<22}'
+              f'first diff(){measure(diff, old, new) * 1000:10.1f} ms'
+              f'    next diff(){measure(diff, old, new) * 1000:10.1f} ms'
+              f'    diff() of renders{measure(diff, old_render, new_render) * 1000:10.1f} ms'
+              f'    json.dumps() =={measure(lambda: json.dumps(old_render) == json.dumps(new_render)) * 1000:10.1f} ms')
+        old = load_adf(old_render)
@@ -0,0 +1,40 @@
+import gc
+import time
+
+from atlassian_doc_builder import ADFDoc, ADFTaskItem, ADFTaskList, ADFText
+
+
+def build_doc(items):
+    # Task lists of 10 items with 1 text each, 30% of the items to do.
+    return ADFDoc().extend_content([
+        ADFTaskList(f'list-{i}').extend_content([
+            ADFTaskItem('TODO' if j % 10 < 3 else 'DONE', f'task-{i}-{j}').add(ADFText(f'task {j}')) for j in range(10)
+        ]) for i in range(items // 10)
+    ])
+
+
+def walk_find(doc, node_type=None, **attrs):
+    return [
+        node for node, _, _ in doc.walk()
+        if (node_type is None or node.type == node_type) and
+        all((node.local_info.get('attrs') or {}).get(name) == value for name, value in attrs.items())
+    ]
+
+
+def measure(func, *args, **kwargs):
+    gc.collect()  # Not counting the collection of the objects allocated before.
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    doc = build_doc(50000)
+    print(f'105k nodes {"build_index()":<40}{measure(doc.build_index) * 1000:10.3f} ms')
+    for name, args, kwargs in [
+        ('localId', (), {'localId': 'task-2500-5'}),
+        ('taskList', ('taskList',), {}),
+        ('taskItem, state="TODO"', ('taskItem',), {'state': 'TODO'}),
+    ]:
+        print(f'105k nodes {name:<26}{"walk()":<14}{measure(walk_find, doc, *args, **kwargs) * 1000:10.3f} ms')
+        print(f'105k nodes {name:<26}{"index.find()":<14}{measure(doc.index.find, *args, **kwargs) * 1000:10.3f} ms')
@@ -0,0 +1,37 @@
+import json
+import timeit
+
+from atlassian_doc_builder import load_adf
+
+
+def build_fixture(paragraphs):
+    # 1 doc + paragraphs with 2 texts, one with a link. 6 objects per paragraph.
+    return {'type': 'doc', 'version': 1, 'content': [
+        {'type': 'paragraph', 'content': [
+            {'type': 'text', 'text': f'text {i}', 'marks': [{'type': 'strong'}]},
+            {'type': 'text', 'text': 'link', 'marks': [{'type': 'link', 'attrs': {'href': f'http://localhost/{i}'}}]},
+        ]}
+        for i in range(paragraphs)
+    ]}
+
+
+def edit_and_render(doc):
+    doc[10, 0].assign_info('text', 'x')
+    return doc.render()
+
+
+if __name__ == '__main__':
+    fixture = build_fixture(100000 // 6)
+    assert json.dumps(load_adf(fixture).render()) == json.dumps(load_adf(fixture, trusted=True).render())
+    # Children never accessed keep the key order of the input.
+    assert json.dumps(load_adf(fixture).render(), sort_keys=True) == \
+        json.dumps(load_adf(fixture, lazy=True).render(), sort_keys=True)
+
+    for name, case in {
+        'load_adf()': lambda: load_adf(fixture),
+        'load_adf(trusted=True)': lambda: load_adf(fixture, trusted=True),
+        'load_adf(lazy=True)': lambda: load_adf(fixture, lazy=True),
+        'lazy, edit 1 + render': lambda: edit_and_render(load_adf(fixture, lazy=True)),
+    }.items():
+        cost = min(timeit.repeat(case, number=1, repeat=3))
+        print(f'100k objects {name:<26}{cost * 1000:10.1f} ms')
@@ -0,0 +1,35 @@
+import time
+import tracemalloc
+
+from atlassian_doc_builder import ADFParagraph, ADFText, load_adf
+
+
+def build_paragraph(texts):
+    # 4 objects per text, 3 of them are marks. 100 distinct links.
+    return ADFParagraph().extend_content([
+        ADFText(f'text {i}').add('strong').add('em').add('link', attrs={'href': f'http://localhost/{i % 100}'})
+        for i in range(texts)
+    ])
+
+
+def measure(func, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(*args)
+    cost = time.perf_counter() - start
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return cost, current
+
+
+if __name__ == '__main__':
+    fixture = build_paragraph(20000).render(mutable=True)
+    for name, case in {
+        'add()': lambda: build_paragraph(20000),
+        'load_adf()': lambda: load_adf(fixture),
+        'load_adf(trusted=True)': lambda: load_adf(fixture, trusted=True),
+        'load_adf(trusted=True).render()': lambda: load_adf(fixture, trusted=True).render(),
+    }.items():
+        cost, memory = measure(case)
+        print(f'20k texts with 3 marks {name:<35}{cost * 1000:10.1f} ms{memory / 2 ** 20:10.2f} MiB retained')
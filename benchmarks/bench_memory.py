@@ -0,0 +1,40 @@
+import tracemalloc
+
+from atlassian_doc_builder import ADFDoc, ADFObject, ADFParagraph, ADFText, load_adf
+
+
+def build_doc(paragraphs):
+    # 1 doc + paragraphs with a text and a mark. 3 objects per paragraph.
+    doc = ADFDoc()
+    doc.extend_content([ADFParagraph().add(ADFText(f'text {i}').add('strong')) for i in range(paragraphs)])
+    return doc
+
+
+def count_objects(node):
+    stack, count = [node], 0
+    while stack:
+        cur_node = stack.pop()
+        count += 1
+        stack.extend(child for field in ('content', 'marks') for child in cur_node.local_info.get(field, ()))
+    return count
+
+
+def bytes_per_object(build, *args):
+    tracemalloc.start()
+    node = build(*args)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return memory / count_objects(node)
+
+
+if __name__ == '__main__':
+    fixture = build_doc(100000).render(mutable=True)
+    for name, build in {
+        'ADFParagraph/ADFText': lambda: build_doc(100000),
+        'ADFObject()': lambda: ADFObject('doc', version=1).extend_content([
+            ADFObject('paragraph').add(ADFObject('text', text=f'text {i}').add('strong')) for i in range(100000)
+        ]),
+        'load_adf()': lambda: load_adf(fixture),
+        'load_adf(trusted=True)': lambda: load_adf(fixture, trusted=True),
+    }.items():
+        print(f'300k objects {name:<26}{bytes_per_object(build):8.0f} bytes per object')
@@ -0,0 +1,46 @@
+import json
+import time
+
+from atlassian_doc_builder import ADFDoc, ADFParagraph, ADFText, apply_patch, load_adf
+
+OPERATIONS = [
+    {'op': 'replace', 'path': '/content/20000/content/0/text', 'value': 'edited'},
+    {'op': 'add', 'path': '/content/30000', 'value': {
+        'type': 'paragraph', 'content': [{'type': 'text', 'text': 'new'}]
+    }},
+]
+
+
+def build_text(paragraphs):
+    return json.dumps(ADFDoc().extend_content([
+        ADFParagraph().extend_content([ADFText(f'line {i}').add('strong'), ADFText(' text')]) for i in range(paragraphs)
+    ]).render())
+
+
+def patch_loaded(text):
+    doc = load_adf(json.loads(text))
+    doc[20000, 0].text = 'edited'
+    doc.local_info['content'].insert(30000, load_adf(OPERATIONS[1]['value']))
+    doc._invalidate()
+    return json.dumps(doc.render())
+
+
+def patch_lazy(text):
+    return json.dumps(apply_patch(json.loads(text), OPERATIONS).render())
+
+
+def measure(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    # Load the stored document, apply 2 edits and store it again.
+    text = build_text(40000)
+    assert patch_loaded(text) == patch_lazy(text)
+    for name, func in {
+        'load_adf(), edit': patch_loaded,
+        'apply_patch()': patch_lazy,
+    }.items():
+        print(f'120k nodes, {name:<20}{measure(func, text) * 1000:10.1f} ms')
@@ -0,0 +1,75 @@
+import gc
+import sys
+import time
+
+from atlassian_doc_builder import ADFDoc, ADFParagraph, ADFText
+
+
+def build_doc(node_count):
+    # 1 doc + paragraphs with 1 text and 1 mark each. A wide document.
+    doc = ADFDoc()
+    doc.extend_content([ADFParagraph().add(ADFText(f'text {i}').add('em')) for i in range((node_count - 1) // 3)])
+    return doc
+
+
+def legacy_render(node):
+    # The former BFS rendering with list.pop(0), kept as a reference.
+    render_queue, top_node_rendered = [(node, None)], None
+    while render_queue:
+        cur_node, parent_node = render_queue.pop(0)
+        current_level_rendered = {
+            prop_key: prop_value
+            for prop_key, prop_value in cur_node.local_info.items()
+            if prop_value is not None and prop_key not in {'type', 'content'}
+        }
+        current_level_rendered['type'] = cur_node.type
+        if 'marks' in cur_node.local_info:
+            current_level_rendered['marks'] = [legacy_render(child_node) for child_node in cur_node.local_info['marks']]
+        if 'content' in cur_node.local_info:
+            current_level_rendered['content'] = []
+            render_queue.extend((child_node, current_level_rendered) for child_node in cur_node.local_info['content'])
+        if parent_node is not None:
+            parent_node['content'].append(current_level_rendered)
+        else:
+            top_node_rendered = current_level_rendered
+    return top_node_rendered
+
+
+def measure(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def measure_each(func, items):
+    # Mean cost of func over many small inputs, a single call is below the timer resolution.
+    # The objects built before are left out of the garbage collections, like the rest of a long-running process.
+    gc.collect()
+    gc.freeze()
+    try:
+        start = time.perf_counter()
+        results = [func(item) for item in items]
+        return (time.perf_counter() - start) / len(items), results[-1]
+    finally:
+        gc.unfreeze()
+
+
+if __name__ == '__main__':
+    # python -B benchmarks/bench_render.py [max_exponent] [max_legacy_exponent]
+    # Documents below 10^5 nodes are rendered 10^5 / nodes times, the mean cost is reported.
+    max_exponent = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    max_legacy_exponent = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    print(f'{"nodes":>10}{"render() ms":>14}{"us/node":>10}{"1 edit ms":>12}{"legacy ms":>14}{"us/node":>10}')
+    for exponent in range(1, max_exponent + 1):
+        docs = [build_doc(10 ** exponent) for _ in range(max(1, 10 ** (5 - exponent)))]
+        cost, rendered = measure_each(ADFDoc.render, docs)
+        for doc in docs:
+            doc[len(doc) // 2, 0].text = 'edited'
+        edit_cost, _ = measure_each(ADFDoc.render, docs)
+        line = f'{10 ** exponent:>10}{cost * 1000:>14.3f}{cost * 1e6 / 10 ** exponent:>10.2f}{edit_cost * 1000:>12.3f}'
+        if exponent <= max_legacy_exponent:
+            legacy_cost, legacy_rendered = measure_each(legacy_render, docs)
+            assert legacy_rendered == docs[-1].render()
+            line += f'{legacy_cost * 1000:>14.3f}{legacy_cost * 1e6 / 10 ** exponent:>10.2f}'
+        print(line)
@@ -0,0 +1,38 @@
+import json
+import os
+import time
+
+from atlassian_doc_builder import ADFDoc, ADFParagraph, ADFText, compile_template, render_batch
+
+
+def build_template(paragraphs):
+    return ADFDoc().extend_content([
+        ADFParagraph().add(ADFText(f'Dear {{name}}, item {i}' if i % 10 == 0 else f'text {i}'))
+        for i in range(paragraphs)
+    ])
+
+
+def variable_sets(count):
+    return ({'name': f'customer {i}'} for i in range(count))
+
+
+if __name__ == '__main__':
+    template, count = compile_template(build_template(500)), 5000
+    # Each output is serialized, as a page would be published.
+    cases = {
+        'serial': lambda: [json.dumps(template.render(**variables)) for variables in variable_sets(count)],
+        'render_batch(thread)': lambda: [
+            json.dumps(output) for output in render_batch(template, variable_sets(count), executor='thread')
+        ],
+        'render_batch(process)': lambda: [
+            json.dumps(output) for output in render_batch(template, variable_sets(count), executor='process')
+        ],
+        'render_batch(process, dumps)': lambda: list(
+            render_batch(template, variable_sets(count), executor='process', transform=json.dumps)
+        ),
+    }
+    for name, case in cases.items():
+        start = time.perf_counter()
+        case()
+        cost = time.perf_counter() - start
+        print(f'{count} renders, {os.cpu_count()} CPUs {name:<30}{cost:10.2f} s')
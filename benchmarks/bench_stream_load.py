@@ -0,0 +1,44 @@
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+from atlassian_doc_builder import ADFDoc, ADFParagraph, ADFText, iter_load_adf, load_adf
+
+
+def write_doc(path, paragraphs):
+    doc = ADFDoc()
+    doc.extend_content([ADFParagraph().add(ADFText(f'text {i}').add('em')) for i in range(paragraphs)])
+    with open(path, 'w') as f:
+        doc.write_json(f)
+
+
+def measure(func, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(*args)
+    cost = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return cost, peak
+
+
+def count_texts(blocks):
+    return sum(len(block) for block in blocks)
+
+
+if __name__ == '__main__':
+    cases = {
+        'load_adf(json.load())': lambda f: count_texts(load_adf(json.load(f))),
+        'iter_load_adf()': lambda f: count_texts(iter_load_adf(f)),
+        'iter_load_adf(trusted)': lambda f: count_texts(iter_load_adf(f, trusted=True)),
+    }
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for paragraphs in (10 ** 3, 10 ** 4, 10 ** 5):
+            write_doc(path := os.path.join(temp_dir, f'{paragraphs}.json'), paragraphs)
+            for name, case in cases.items():
+                with open(path, 'rb') as f:
+                    cost, peak = measure(case, f)
+                size = os.path.getsize(path) / 2 ** 20
+                print(f'{size:8.1f} MiB file {name:<24}{cost * 1000:10.1f} ms{peak / 2 ** 20:10.2f} MiB peak')
@@ -0,0 +1,48 @@
+import timeit
+
+from atlassian_doc_builder import ADFParagraph, ADFTable, ADFTableRow, ADFText
+
+
+def build_by_append_row(rows, cols):
+    table = ADFTable.create([cols, 1])
+    for _ in range(rows - 1):
+        table.append_row()
+    return table
+
+
+def build_by_extend_content(rows, cols):
+    table = ADFTable()
+    for _ in range(rows):
+        table.extend_content(ADFTableRow.create(cols))
+    return table
+
+
+def build_cell_by_cell(rows, cols):
+    table = ADFTable.create([cols, rows])
+    for i, row in enumerate(table):
+        for j, cell in enumerate(row):
+            cell.add(ADFParagraph().add(ADFText(f'{i}.{j}')))
+    return table
+
+
+def build_from_rows(rows, cols):
+    return ADFTable.from_rows([f'{i}.{j}' for j in range(cols)] for i in range(rows))
+
+
+if __name__ == '__main__':
+    for rows in (10 ** 4, 10 ** 5):
+        for name, case in {
+            'append_row()': lambda: build_by_append_row(rows, 5),
+            'extend_content()': lambda: build_by_extend_content(rows, 5),
+        }.items():
+            cost = min(timeit.repeat(case, number=1, repeat=3))
+            print(f'{rows:>7} rows x 5 cols {name:<24}{cost * 1000:10.1f} ms')
+
+    # 100k cells, rendered as they would be published.
+    for name, case in {
+        'create() cell by cell': lambda: build_cell_by_cell(20000, 5).render(),
+        'from_rows()': lambda: build_from_rows(20000, 5),
+        'from_rows().render()': lambda: build_from_rows(20000, 5).render(),
+    }.items():
+        cost = min(timeit.repeat(case, number=1, repeat=3))
+        print(f'  20000 rows x 5 cols {name:<24}{cost * 1000:10.1f} ms')
@@ -0,0 +1,32 @@
+import timeit
+
+import jsonschema
+
+from atlassian_doc_builder import ADFDoc, ADFParagraph, ADFText, adf_schema
+
+
+def build_doc(paragraphs, texts_per_paragraph):
+    doc = ADFDoc()
+    for i in range(paragraphs):
+        doc.add(ADFParagraph().extend_content([
+            ADFText(f'text {i}-{j}').add('strong') for j in range(texts_per_paragraph)
+        ]))
+    return doc
+
+
+if __name__ == '__main__':
+    # 1 doc + 500 paragraphs + 500 * 9 texts + 500 * 9 marks = 9501 objects
+    doc = build_doc(500, 9)
+    rendered = doc.render()
+    repeat = 5
+
+    cases = {
+        'jsonschema.validate (per call compile)': lambda: jsonschema.validate(rendered, adf_schema()),
+        'ADFDoc.validate()': lambda: doc.validate(),
+        'ADFDoc.validate(fast=True)': lambda: doc.validate(fast=True),
+        'ADFDoc.render() only': lambda: doc.render(),
+    }
+    for name, case in cases.items():
+        case()  # Warm up
+        cost = min(timeit.repeat(case, number=1, repeat=repeat))
+        print(f'{name:<45}{cost * 1000:10.2f} ms/doc')
@@ -0,0 +1,35 @@
+import time
+
+from atlassian_doc_builder import ADFDoc, ADFHeading, ADFParagraph, ADFText, load_adf
+
+
+def build_doc(node_count):
+    # 1 doc + paragraphs with 2 texts each, a heading in the first tenth.
+    doc = ADFDoc()
+    doc.extend_content([ADFParagraph().extend_content([ADFText(f'text {i}'), ADFText(' end')])
+                        for i in range((node_count - 1) // 3)])
+    doc.local_info['content'][len(doc) // 10] = ADFHeading(1).add(ADFText('heading'))
+    return doc
+
+
+def first_heading(doc):
+    return next(node for node, _, _ in doc.walk() if node.type == 'heading')
+
+
+def measure(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    doc = build_doc(300000)
+    lazy_doc = load_adf(doc.render(), lazy=True)
+    for name, case in {
+        'walk(order="pre")': lambda: sum(1 for _ in doc.walk()),
+        'walk(order="post")': lambda: sum(1 for _ in doc.walk(order='post')),
+        'walk(order="bfs")': lambda: sum(1 for _ in doc.walk(order='bfs')),
+        'first heading': lambda: first_heading(doc),
+        'first heading, lazy': lambda: first_heading(lazy_doc),
+    }.items():
+        print(f'300k nodes {name:<24}{measure(case) * 1000:10.1f} ms')
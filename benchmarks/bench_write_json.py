@@ -0,0 +1,38 @@
+import json
+import time
+import tracemalloc
+
+from atlassian_doc_builder import ADFDoc, ADFParagraph, ADFText
+
+
+class NullWriter:
+    # Discard the output, only the memory used by the serializer is measured.
+    def write(self, text):
+        return len(text)
+
+
+def build_doc(paragraphs):
+    doc = ADFDoc()
+    doc.extend_content([ADFParagraph().add(ADFText(f'text {i}').add('em')) for i in range(paragraphs)])
+    return doc
+
+
+def measure(func, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(*args)
+    cost = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return cost, peak
+
+
+if __name__ == '__main__':
+    cases = {
+        'json.dumps(render())': lambda doc: NullWriter().write(json.dumps(doc.render())),
+        'write_json()': lambda doc: doc.write_json(NullWriter()),
+    }
+    for paragraphs in (10 ** 3, 10 ** 4, 10 ** 5):
+        for name, case in cases.items():
+            cost, peak = measure(case, build_doc(paragraphs))  # A new document, nothing rendered yet.
+            print(f'{paragraphs * 3 + 1:>8} nodes {name:<24}{cost * 1000:10.1f} ms{peak / 2 ** 20:10.2f} MiB peak')
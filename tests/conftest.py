@@ -2,8 +2,48 @@ import pytest
 import json
 import yaml
 
+from atlassian_doc_builder import ADFDoc, ADFHeading, ADFLink, ADFParagraph, ADFTaskItem, ADFTaskList, ADFText
+
 
 @pytest.fixture
 def reference_test_objects():
     with open('tests/test_cases.yaml') as f:
         return yaml.safe_load(f)
+
+
+@pytest.fixture
+def build_doc():
+    def build():
+        return ADFDoc().extend_content([
+            ADFHeading(1).add(ADFText('Title')),
+            ADFParagraph().extend_content([ADFText('foo').add('strong'), ADFText('bar')]),
+            ADFParagraph().add(ADFText('baz')),
+            ADFParagraph(),
+        ])
+    return build
+
+
+@pytest.fixture
+def build_task_doc():
+    def build():
+        return ADFDoc().extend_content([
+            ADFHeading(1).add(ADFText('Tasks')),
+            ADFTaskList('list-1').extend_content([
+                ADFTaskItem('TODO', 'task-1').add(ADFText('foo')),
+                ADFTaskItem('DONE', 'task-2').add(ADFText('bar')),
+                ADFTaskItem('TODO', 'task-3').add(ADFText('baz')),
+            ]),
+            ADFHeading(2).add(ADFText('Notes')),
+        ])
+    return build
+
+
+@pytest.fixture
+def build_template():
+    def build():
+        return ADFDoc().extend_content([
+            ADFParagraph().add(ADFText('Hello {name}, {greeting}!')),
+            ADFParagraph().add(ADFText('static')),
+            ADFParagraph().add(ADFText('link').add(ADFLink('http://localhost/{path}'))),
+        ])
+    return build
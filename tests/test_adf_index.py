@@ -0,0 +1,105 @@
+import pytest
+
+from atlassian_doc_builder import ADFHeading, ADFIndex, ADFObject, ADFParagraph, ADFTaskItem, ADFText, apply_patch, \
+    load_adf
+
+
+class TestADFIndex:
+    def test_find(self, build_task_doc):
+        doc = build_task_doc()
+        index = doc.build_index()
+        assert isinstance(index, ADFIndex) and doc.index is index
+        assert index.find('heading') == [doc[0], doc[2]]
+        assert index.find_one(localId='task-2') is doc[1, 1]
+        assert index.find('taskItem', state='TODO') == [doc[1, 0], doc[1, 2]]
+        assert index.find('taskList', localId='task-2') == []
+        assert index.find('rule') == [] and index.find_one(localId='foo') is None
+        with pytest.raises(ValueError):
+            index.find(state='TODO')
+
+    def test_indexed_attrs(self, build_task_doc):
+        doc = build_task_doc()
+        index = doc.build_index(attrs=('localId', 'state'))
+        assert index.find(state='DONE') == [doc[1, 1]]
+        assert len(index.find('text')) == 5
+
+    def test_add(self, build_task_doc):
+        doc = build_task_doc()
+        index = doc.build_index()
+        doc.add(ADFHeading(3).add(ADFText('More')))
+        doc[1].extend_content([ADFTaskItem('TODO', 'task-4')])
+        doc[1, 3].add(ADFText('qux'))
+        assert index.find('heading') == [doc[0], doc[2], doc[3]]
+        assert index.find_one(localId='task-4') is doc[1, 3]
+        assert len(index.find('text')) == 7
+
+    def test_attrs_changed(self, build_task_doc):
+        doc = build_task_doc()
+        index = doc.build_index()
+        doc[1, 0].local_id = 'task-5'
+        doc[1, 0].state = 'DONE'
+        assert index.find_one(localId='task-1') is None
+        assert index.find_one(localId='task-5') is doc[1, 0]
+        assert index.find('taskItem', state='TODO') == [doc[1, 2]]
+
+    def test_apply_variable(self, build_task_doc):
+        doc = build_task_doc()
+        doc[1, 0].local_id = '{task}'
+        doc[1, 0, 0].add(ADFObject('link', attrs={'href': 'http://{task}'}))
+        index = doc.build_index()
+        doc.apply_variable(task='task-7')
+        assert index.find_one(localId='task-7') is doc[1, 0]
+        assert index.find_one(localId='{task}') is None
+        assert index.find('link') == []
+
+    def test_detached(self, build_task_doc):
+        doc = build_task_doc()
+        index = doc.build_index()
+        task_list = doc.local_info['content'].pop(1)
+        task_list._parent = None
+        assert index.find('taskItem') == [] and index.find_one(localId='list-1') is None
+        assert index.find('text') == [doc[0, 0], doc[1, 0]]
+        assert len(index._entries) == 5  # The detached nodes found are removed.
+
+    def test_apply_patch(self, build_task_doc):
+        doc = build_task_doc()
+        index = doc.build_index()
+        apply_patch(doc, [
+            {'op': 'add', 'path': '/content/3', 'value': ADFParagraph().render()},
+            {'op': 'replace', 'path': '/content/1/content/0/attrs/localId', 'value': 'task-6'},
+            {'op': 'remove', 'path': '/content/1/content/1'},
+        ])
+        assert index.find('paragraph') == [doc[3]]
+        assert index.find_one(localId='task-6') is doc[1, 0]
+        assert index.find_one(localId='task-2') is None
+
+    def test_apply_patch_field_replaced(self, build_task_doc):
+        doc = build_task_doc()
+        index = doc.build_index()
+        apply_patch(doc, [{'op': 'replace', 'path': '/content/1/content', 'value': [
+            ADFTaskItem('DONE', 'task-7').add(ADFText('qux')).render(),
+        ]}])
+        assert index.find('taskItem') == [doc[1, 0]]
+        assert index.find_one(localId='task-1') is None
+        assert index.find_one(localId='task-7') is doc[1, 0]
+        assert index.find('text') == [doc[0, 0], doc[2, 0], doc[1, 0, 0]]  # In the order indexed.
+
+    def test_apply_patch_field_removed(self, build_task_doc):
+        doc = build_task_doc()
+        index = doc.build_index()
+        apply_patch(doc, [{'op': 'remove', 'path': '/content/1/content'}])
+        assert index.find('taskItem') == [] and index.find_one(localId='task-2') is None
+        assert index.find('text') == [doc[0, 0], doc[2, 0]]
+
+    def test_lazy(self, build_task_doc):
+        doc = load_adf(build_task_doc().render(), lazy=True)
+        assert doc.build_index().find_one(localId='task-3') is doc[1, 2]
+
+    def test_not_copied(self, build_task_doc):
+        doc = build_task_doc()
+        doc.build_index()
+        copied = doc.clone()
+        assert copied.index is None
+        copied.add(ADFHeading(3))
+        assert len(doc.index.find('heading')) == 2
+        assert doc.drop_index().index is None
@@ -1,6 +1,12 @@
+import io
+import json
+import pickle
+
+import jsonschema
 import pytest
 
-from atlassian_doc_builder import ADFDoc, ADFObject, load_adf
+from atlassian_doc_builder import ADFDoc, ADFLink, ADFObject, ADFPanel, ADFParagraph, ADFText, ADFTable, \
+    apply_patch, load_adf, adf_validator, set_schema_source, shared_mark
 from .utils import render_output_text
 
 
@@ -124,6 +130,584 @@ class TestADFObject:
         assert text.parent is paragraph
 
 
+class TestADFDocValidate:
+    def test_validator_reused(self):
+        assert adf_validator() is adf_validator()
+
+    @pytest.mark.parametrize("fast", [False, True])
+    def test_validate_success(self, reference_test_objects, fast):
+        doc = load_adf(reference_test_objects['test_get_content_by_index_basic'])
+        assert render_output_text(doc.validate(fast=fast)) == \
+               render_output_text(reference_test_objects['test_get_content_by_index_basic'])
+
+    @pytest.mark.parametrize("fast", [False, True])
+    def test_validate_failure(self, fast):
+        with pytest.raises(jsonschema.ValidationError):
+            ADFDoc().add(ADFText('foo')).validate(fast=fast)
+
+
+class TestADFObjectValidateTree:
+    def test_validate_tree_success(self, reference_test_objects):
+        doc = load_adf(reference_test_objects['test_get_content_by_index_basic'])
+        assert doc.validate_tree() is doc
+        assert doc.validate_tree() is doc
+
+    def test_validate_tree_long_file(self):
+        with open('tests/test_smoke_long.json') as f:
+            input_object = json.load(f)
+        assert render_output_text(load_adf(input_object).validate(incremental=True)) == \
+               render_output_text(input_object)
+
+    def test_validate_tree_invalidate_ancestors(self, reference_test_objects):
+        doc = load_adf(reference_test_objects['test_get_content_by_index_basic']).validate_tree()
+        doc[0, 1].assign_info('text', '')
+        with pytest.raises(jsonschema.ValidationError):
+            doc.validate_tree()
+        doc[0, 1].assign_info('text', 'baz')
+        assert doc.validate_tree() is doc
+
+    def test_validate_tree_add(self, reference_test_objects):
+        doc = load_adf(reference_test_objects['test_get_content_by_index_basic']).validate_tree()
+        doc[1].add(ADFObject('rule'))
+        with pytest.raises(jsonschema.ValidationError):
+            doc.validate_tree()
+
+    def test_validate_tree_apply_variable(self, reference_test_objects):
+        paragraph = load_adf(reference_test_objects['test_apply_var_in']).validate_tree()
+        paragraph.apply_variable(text_a='', text_b='bar')
+        with pytest.raises(jsonschema.ValidationError):
+            paragraph.validate_tree()
+
+    def test_validate_tree_forbidden_child(self):
+        with pytest.raises(jsonschema.ValidationError):
+            ADFDoc().add(ADFText('foo')).validate_tree()
+
+    def test_validate_tree_forbidden_attrs(self):
+        status = ADFObject('status', attrs={'text': 'foo', 'color': 'blue'})
+        ADFDoc().add(ADFObject('paragraph', content=status)).validate_tree()
+        status.assign_info('attrs', color='pink')
+        with pytest.raises(jsonschema.ValidationError):
+            status.parent.parent.validate_tree()
+
+    def test_validate_tree_empty_table(self):
+        with pytest.raises(jsonschema.ValidationError):
+            ADFDoc().add(ADFTable()).validate(incremental=True)
+
+    def test_validate_tree_item_position(self):
+        doc = ADFDoc().add(ADFObject('bulletList').add(ADFObject('listItem').extend_content([
+            ADFParagraph(), ADFObject('bulletList').add(ADFObject('listItem').add(ADFParagraph().add(ADFText('foo'))))
+        ])))
+        doc.validate(incremental=True)
+        # The nested list becomes the first child of the item.
+        apply_patch(doc, [{'op': 'remove', 'path': '/content/0/content/0/content/0'}])
+        with pytest.raises(jsonschema.ValidationError):
+            doc.validate(incremental=True)
+        with pytest.raises(jsonschema.ValidationError):
+            doc.validate()
+
+
+class TestADFObjectCheckStructure:
+    @pytest.fixture(autouse=True)
+    def check_structure(self, monkeypatch):
+        monkeypatch.setattr(ADFObject, 'check_structure', True)
+
+    def test_add_allowed_child(self):
+        ADFDoc().add(ADFObject('bulletList').add(ADFObject('listItem').add(ADFObject('paragraph').add(
+            ADFText('foo').add('strong')
+        ))))
+
+    @pytest.mark.parametrize("parent_type,child_type", [
+        ("doc", "text"),
+        ("listItem", "table"),
+        ("bulletList", "paragraph"),
+        ("tableRow", "paragraph"),
+    ])
+    def test_add_forbidden_child(self, parent_type, child_type):
+        with pytest.raises(ValueError):
+            ADFObject(parent_type).add(child_type)
+
+    def test_extend_forbidden_child(self):
+        with pytest.raises(ValueError):
+            ADFObject('listItem').extend_content([ADFObject('paragraph'), ADFTable()])
+
+    def test_add_forbidden_mark(self):
+        with pytest.raises(ValueError):
+            ADFText('foo').add('breakout')
+
+    def test_load_adf_forbidden_child(self):
+        with pytest.raises(ValueError):
+            load_adf({'type': 'doc', 'version': 1, 'content': [{'type': 'text', 'text': 'foo'}]})
+
+    def test_check_structure_disabled(self, monkeypatch):
+        monkeypatch.setattr(ADFObject, 'check_structure', False)
+        assert ADFObject('doc').add('text').render()['content'][0]['type'] == 'text'
+
+
+class TestADFObjectRenderCache:
+    def test_render_cached(self, reference_test_objects):
+        doc = load_adf(reference_test_objects['test_get_content_by_index_basic'])
+        assert doc.render() is doc.render()
+
+    def test_render_read_only(self, reference_test_objects):
+        rendered = load_adf(reference_test_objects['test_get_content_by_index_basic']).render()
+        with pytest.raises(TypeError):
+            rendered['version'] = 2
+        with pytest.raises(TypeError):
+            rendered['content'].append({'type': 'paragraph'})
+        with pytest.raises(TypeError):
+            rendered['content'][0]['content'][0].update(text='baz')
+
+    def test_render_mutable(self, reference_test_objects):
+        doc = load_adf(reference_test_objects['test_get_content_by_index_basic'])
+        rendered = doc.render(mutable=True)
+        rendered['content'].clear()
+        assert type(rendered) is dict
+        assert render_output_text(doc) == render_output_text(reference_test_objects['test_get_content_by_index_basic'])
+
+    def test_render_changed_path_only(self, reference_test_objects):
+        doc = load_adf(reference_test_objects['test_get_content_by_index_basic'])
+        first = doc.render()
+        doc[0, 1].assign_info('text', 'baz')
+        second = doc.render()
+        assert second['content'][0]['content'][1]['text'] == 'baz'
+        assert first['content'][0]['content'][1]['text'] == 'bar'
+        assert second['content'][0]['content'][0] is first['content'][0]['content'][0]
+        assert second['content'][1] is first['content'][1]
+
+    def test_render_after_add(self):
+        doc = ADFDoc()
+        doc.render()
+        doc.add(paragraph := ADFObject('paragraph'))
+        paragraph.render()
+        paragraph.add(ADFText('foo').add('strong'))
+        assert doc.render()['content'][0]['content'][0]['marks'][0]['type'] == 'strong'
+
+    def test_render_after_mark_changed(self):
+        text = ADFText('foo').add(link := ADFObject('link', attrs={'href': 'http://localhost'}))
+        text.render()
+        link.assign_info('attrs', href='http://docker_host')
+        assert text.render()['marks'][0]['attrs']['href'] == 'http://docker_host'
+
+    def test_render_after_apply_variable(self, reference_test_objects):
+        template = load_adf(reference_test_objects['test_apply_var_in'])
+        template.render()
+        template.apply_variable(text_a='foo', text_b='bar')
+        assert render_output_text(template) == render_output_text(reference_test_objects['test_apply_var_out'])
+
+    def test_render_not_sharing_attrs(self):
+        link = ADFObject('link', attrs={'href': 'http://localhost'})
+        assert link.render()['attrs'] is not link.local_info['attrs']
+
+    def test_render_pickle(self, reference_test_objects):
+        rendered = load_adf(reference_test_objects['test_get_content_by_index_basic']).render()
+        assert pickle.loads(pickle.dumps(rendered)) == rendered
+
+
+class TestADFObjectJson:
+    def test_iter_json_chunks_long_file(self):
+        with open('tests/test_smoke_long.json') as f:
+            doc = load_adf(json.load(f))
+        assert ''.join(doc.iter_json_chunks()) == json.dumps(doc.render())
+
+    def test_iter_json_chunks_partially_rendered(self, reference_test_objects):
+        doc = load_adf(reference_test_objects['test_get_content_by_index_basic'])
+        doc[0, 1].render()
+        assert ''.join(doc.iter_json_chunks()) == json.dumps(doc.render())
+        assert ''.join(doc.iter_json_chunks()) == json.dumps(doc.render())
+
+    def test_iter_json_chunks_leaf(self):
+        text = ADFText('f\u00f6\u00f6 "bar"').add('strong').add(ADFObject('link', attrs={'href': 'http://localhost'}))
+        assert ''.join(text.iter_json_chunks()) == json.dumps(text.render())
+
+    def test_iter_json_chunks_no_render_cache(self, reference_test_objects):
+        doc = load_adf(reference_test_objects['test_get_content_by_index_basic'])
+        ''.join(doc.iter_json_chunks())
+        assert doc._rendered is None and doc[0, 0]._rendered is None
+
+    def test_write_json(self, reference_test_objects):
+        doc = ADFDoc().extend_content([ADFObject('paragraph', content=ADFText(f'{i}')) for i in range(100)])
+        output = io.StringIO()
+        assert doc.write_json(output, buffer_size=64) is doc
+        assert output.getvalue() == json.dumps(doc.render())
+
+
+class TestLoadADFTrusted:
+    @pytest.mark.parametrize("test_case", [
+        "test_smoke_doc",
+        "test_smoke_em",
+        "test_smoke_link",
+        "test_chain_mode_false",
+        "test_get_content_by_index_basic",
+    ])
+    def test_same_as_load_adf(self, reference_test_objects, test_case):
+        input_object = reference_test_objects[test_case]
+        assert json.dumps(load_adf(input_object, trusted=True).render()) == json.dumps(load_adf(input_object).render())
+
+    def test_long_file(self):
+        with open('tests/test_smoke_long.json') as f:
+            input_object = json.load(f)
+        result = load_adf(input_object, trusted=True)
+        assert render_output_text(result.validate()) == render_output_text(input_object)
+
+    def test_node_class_and_parent(self, reference_test_objects):
+        doc = load_adf(reference_test_objects['test_get_content_by_index_basic'], trusted=True)
+        assert type(doc) is ADFDoc
+        assert doc[0, 1].text == 'bar'
+        assert doc[0, 1].parent.parent is doc
+
+    def test_editable(self, reference_test_objects):
+        doc = load_adf(reference_test_objects['test_get_content_by_index_basic'], trusted=True)
+        doc.render()
+        doc[1].add(ADFText('baz').add('strong'))
+        assert doc.validate()['content'][1]['content'][0]['marks'][0]['type'] == 'strong'
+
+    def test_input_not_shared(self, reference_test_objects):
+        input_object = reference_test_objects['test_smoke_link']
+        link = load_adf(input_object, trusted=True)
+        link.assign_info('attrs', href='http://docker_host')
+        assert input_object['attrs']['href'] == 'http://localhost'
+
+    def test_list_input(self, reference_test_objects):
+        nodes = load_adf([reference_test_objects['test_smoke_em'], reference_test_objects['test_smoke_doc']],
+                         trusted=True)
+        assert [node.type for node in nodes] == ['em', 'doc']
+
+    def test_unknown_type(self):
+        with pytest.raises(RuntimeError):
+            load_adf({'type': 'foo'}, trusted=True)
+
+
+class TestLoadADFLazy:
+    @staticmethod
+    def raw_child(node, index):
+        return list.__getitem__(node.local_info['content'], index)
+
+    def test_same_as_load_adf(self, reference_test_objects):
+        input_object = reference_test_objects['test_get_content_by_index_basic']
+        assert json.dumps(load_adf(input_object, lazy=True).render()) == json.dumps(load_adf(input_object).render())
+
+    def test_long_file(self):
+        with open('tests/test_smoke_long.json') as f:
+            input_object = json.load(f)
+        doc = load_adf(input_object, lazy=True)
+        assert render_output_text(doc.render()) == render_output_text(input_object)
+        assert ''.join(doc.iter_json_chunks()) == json.dumps(input_object)
+        assert render_output_text(doc.validate(incremental=True)) == render_output_text(input_object)
+
+    def test_children_materialized_on_access(self, reference_test_objects):
+        doc = load_adf(reference_test_objects['test_get_content_by_index_basic'], lazy=True)
+        assert all(isinstance(self.raw_child(doc, i), dict) for i in range(len(doc)))
+        assert doc[0, 1].text == 'bar'
+        assert isinstance(self.raw_child(doc, 0), ADFObject)
+        assert isinstance(self.raw_child(doc, 1), dict)
+        assert doc[0, 1].parent.parent is doc
+        assert [node.type for node in doc] == ['paragraph', 'paragraph']
+        assert isinstance(self.raw_child(doc, 1), ADFObject)
+
+    def test_render_untouched_children_verbatim(self, reference_test_objects):
+        input_object = reference_test_objects['test_get_content_by_index_basic']
+        doc = load_adf(input_object, lazy=True)
+        doc[0, 1].text = 'baz'
+        result = doc.render()
+        assert result['content'][0]['content'][1]['text'] == 'baz'
+        assert result['content'][1] == input_object['content'][1]
+        assert isinstance(self.raw_child(doc, 1), dict)
+
+    def test_edit_after_render(self, reference_test_objects):
+        doc = load_adf(reference_test_objects['test_get_content_by_index_basic'], lazy=True)
+        first = doc.render()
+        assert doc[1]._rendered is first['content'][1]
+        doc[1].add(ADFText('baz'))
+        second = doc.render()
+        assert second['content'][0] is first['content'][0]
+        assert second['content'][1]['content'][-1]['text'] == 'baz'
+
+    def test_list_methods(self):
+        doc = load_adf({'type': 'doc', 'version': 1, 'content': [
+            {'type': 'paragraph', 'content': [{'type': 'text', 'text': str(i)}]} for i in range(4)
+        ]}, lazy=True)
+        assert [node[0].text for node in doc.local_info['content'][1:3]] == ['1', '2']
+        assert doc.local_info['content'].pop()[0].text == '3'
+        assert [node[0].text for node in reversed(doc.local_info['content'])] == ['2', '1', '0']
+        doc.add(ADFObject('paragraph'))
+        assert len(doc.render()['content']) == 4
+
+    def test_apply_variable(self):
+        doc = load_adf({'type': 'doc', 'version': 1, 'content': [
+            {'type': 'paragraph', 'content': [{'type': 'text', 'text': '{name}'}]}
+        ]}, lazy=True)
+        doc.render()
+        assert doc.apply_variable(name='foo').render()['content'][0]['content'][0]['text'] == 'foo'
+
+
+class TestADFObjectClone:
+    @staticmethod
+    def build_section():
+        return ADFParagraph().extend_content([
+            ADFText('foo {name}').add('strong'),
+            ADFText('link').add(ADFObject('link', attrs={'href': 'http://localhost'})),
+        ])
+
+    def test_same_render(self):
+        section = self.build_section()
+        clone = section.clone()
+        assert render_output_text(clone) == render_output_text(section)
+        assert clone.parent is None
+        assert clone[0].parent is clone
+        assert clone[1] is not section[1]
+
+    def test_share_fields_and_render(self):
+        section = self.build_section()
+        section.render()
+        clone = section.clone()
+        link, cloned_link = section[1].local_info['marks'][0], clone[1].local_info['marks'][0]
+        assert cloned_link.local_info['attrs'] is link.local_info['attrs']
+        assert clone.render() is section.render()
+
+    def test_copy_on_write(self):
+        section = self.build_section()
+        section.render()
+        clone = section.clone()
+        clone[1].local_info['marks'][0].assign_info('attrs', href='http://docker_host')
+        assert clone.render()['content'][1]['marks'][0]['attrs']['href'] == 'http://docker_host'
+        assert section.render()['content'][1]['marks'][0]['attrs']['href'] == 'http://localhost'
+        section[1].local_info['marks'][0].assign_info('attrs', href='http://remote_host')
+        assert clone.render()['content'][1]['marks'][0]['attrs']['href'] == 'http://docker_host'
+        assert section.render()['content'][1]['marks'][0]['attrs']['href'] == 'http://remote_host'
+
+    def test_add_to_clone(self):
+        section = self.build_section()
+        clone = section.clone()
+        clone.add(ADFText('bar'))
+        clone[0].add('em')
+        assert len(section) == 2 and len(section[0].local_info['marks']) == 1
+        assert len(clone) == 3 and len(clone[0].local_info['marks']) == 2
+
+    def test_apply_variable(self):
+        section = ADFParagraph().add(ADFText('link').add(ADFObject('link', attrs={'href': '{host}'})))
+        clone = section.clone().apply_variable(host='http://localhost')
+        assert clone.render()['content'][0]['marks'][0]['attrs']['href'] == 'http://localhost'
+        assert section.render()['content'][0]['marks'][0]['attrs']['href'] == '{host}'
+
+    def test_repeated_section(self):
+        section = self.build_section()
+        doc = ADFDoc().extend_content([section.clone().apply_variable(name=str(i)) for i in range(3)])
+        assert [paragraph[0].text for paragraph in doc] == ['foo 0', 'foo 1', 'foo 2']
+        doc.validate()
+
+    def test_lazy_node(self, reference_test_objects):
+        doc = load_adf(reference_test_objects['test_get_content_by_index_basic'], lazy=True)
+        doc[0, 0]
+        clone = doc.clone()
+        assert render_output_text(clone) == render_output_text(doc)
+        assert clone[0] is not doc[0] and clone[0].parent is clone
+        assert clone[1].parent is clone
+
+
+class TestSharedMark:
+    @staticmethod
+    def marks_of(text):
+        return text.local_info['marks']
+
+    def test_add_by_type(self):
+        first, second = ADFText('foo').add('strong').add('em'), ADFText('bar').add('strong')
+        assert self.marks_of(first)[0] is self.marks_of(second)[0]
+        assert self.marks_of(first)[0].parent is None
+        assert first.render()['marks'] == [{'type': 'strong'}, {'type': 'em'}]
+
+    def test_add_by_type_with_fields(self):
+        first = ADFText('foo').add('link', attrs={'href': 'http://localhost'})
+        second = ADFText('bar').add('link', attrs={'href': 'http://localhost'})
+        third = ADFText('baz').add('link', attrs={'href': 'http://docker_host'})
+        assert self.marks_of(first)[0] is self.marks_of(second)[0]
+        assert self.marks_of(first)[0] is not self.marks_of(third)[0]
+        assert third.render()['marks'][0]['attrs']['href'] == 'http://docker_host'
+
+    def test_not_shared_in_chain_mode_false(self):
+        strong = ADFText('foo', chain_mode=False).add('strong')
+        assert strong.parent is not None
+        assert strong is not ADFText('bar', chain_mode=False).add('strong')
+
+    def test_read_only(self):
+        text = ADFText('foo').add('link', attrs={'href': 'http://localhost'})
+        with pytest.raises(TypeError):
+            self.marks_of(text)[0].assign_info('attrs', href='http://docker_host')
+        assert text.render()['marks'][0]['attrs']['href'] == 'http://localhost'
+
+    @pytest.mark.parametrize("load_args", [{}, {'trusted': True}, {'lazy': True}])
+    def test_load_adf(self, load_args):
+        source = {'type': 'paragraph', 'content': [
+            {'type': 'text', 'text': text, 'marks': [{'type': 'strong'}, {'type': 'link', 'attrs': {'href': '#'}}]}
+            for text in ('foo', 'bar')
+        ]}
+        paragraph = load_adf(source, **load_args)
+        assert self.marks_of(paragraph[0])[0] is self.marks_of(paragraph[1])[0]
+        assert self.marks_of(paragraph[0])[1] is self.marks_of(paragraph[1])[1]
+        assert render_output_text(paragraph) == render_output_text(source)
+        with open('tests/test_smoke_long.json') as f:
+            input_object = json.load(f)
+        assert render_output_text(load_adf(input_object, **load_args)) == render_output_text(input_object)
+
+    @pytest.mark.parametrize("load_args", [{}, {'trusted': True}, {'lazy': True}])
+    def test_variables_not_shared(self, load_args):
+        source = {'type': 'text', 'text': 'foo', 'marks': [{'type': 'link', 'attrs': {'href': '{host}'}}]}
+        first, second = load_adf(source, **load_args), load_adf(source, **load_args)
+        assert self.marks_of(first)[0] is not self.marks_of(second)[0]
+        assert self.marks_of(first)[0].parent is first
+        assert first.apply_variable(host='http://localhost').render()['marks'][0]['attrs']['href'] == 'http://localhost'
+        assert second.render()['marks'][0]['attrs']['href'] == '{host}'
+
+    def test_shared_mark(self):
+        link = shared_mark(ADFLink('http://localhost'))
+        assert shared_mark(ADFLink('http://localhost')) is link
+        assert shared_mark('link', attrs={'href': 'http://docker_host'}) is not link
+        assert shared_mark(link) is link
+        first, second = ADFText('foo').add(link), ADFText('bar').add(link)
+        assert self.marks_of(first)[0] is self.marks_of(second)[0] is link
+        assert link.parent is None
+
+    def test_shared_mark_invalid(self):
+        with pytest.raises(ValueError):
+            shared_mark('paragraph')
+        with pytest.raises(ValueError):
+            shared_mark(self.marks_of(ADFText('foo').add(ADFLink('http://localhost')))[0])
+
+    def test_clone_and_pickle(self):
+        text = ADFText('foo').add('link', attrs={'href': 'http://localhost'})
+        assert self.marks_of(text.clone())[0] is self.marks_of(text)[0]
+        loaded_mark = self.marks_of(pickle.loads(pickle.dumps(text)))[0]
+        assert loaded_mark.parent is None
+        with pytest.raises(TypeError):
+            loaded_mark.assign_info('attrs', href='http://docker_host')
+
+
+class TestADFObjectStructure:
+    @staticmethod
+    def build_section(name='foo'):
+        return ADFDoc().extend_content([
+            ADFParagraph().extend_content([
+                ADFText(name).add('strong'),
+                ADFText('link').add(ADFObject('link', attrs={'href': 'http://localhost', 'title': 'bar'})),
+            ]),
+            ADFParagraph(),
+        ])
+
+    def test_equal(self):
+        section = self.build_section()
+        loaded = load_adf(json.loads(json.dumps(section.render(), sort_keys=True)))
+        assert section == loaded and hash(section) == hash(loaded)
+        assert section == load_adf(section.render(), trusted=True) == load_adf(section.render(), lazy=True)
+        assert section != self.build_section('bar') and section[0] != section[1]
+        assert section != section.render()
+
+    def test_hash_after_change(self):
+        section, other_section = self.build_section(), self.build_section()
+        assert len({section, other_section}) == 1
+        section[0, 0].text = 'bar'
+        assert section != other_section and hash(section) != hash(other_section)
+        section[0, 0].text = 'foo'
+        assert section == other_section and hash(section) == hash(other_section)
+
+    def test_hash_lazy_children(self):
+        section = self.build_section()
+        lazy_section = load_adf(section.render(mutable=True), lazy=True)
+        assert hash(lazy_section) == hash(section)
+        lazy_section[0, 0].text = 'bar'
+        assert lazy_section != section and hash(lazy_section) != hash(section)
+
+    def test_equal_value_types(self):
+        tables = [ADFObject('table', attrs={'isNumberColumnEnabled': value}) for value in (True, 1, 1.0)]
+        assert len(set(tables)) == 3
+        assert tables[0] != tables[1] and tables[1] != tables[2]
+        lazy_tables = [load_adf({'type': 'doc', 'content': [table.render()]}, lazy=True) for table in tables]
+        assert lazy_tables[0] != lazy_tables[1] and lazy_tables[0] == load_adf(lazy_tables[0].render(), lazy=True)
+
+    def test_digest_pickled(self):
+        text = ADFText('foo').add('strong')
+        loaded_text = pickle.loads(pickle.dumps(text))
+        assert loaded_text.digest() == text.digest() and loaded_text == text
+        text.digest()
+        loaded_text = pickle.loads(pickle.dumps(text))
+        assert loaded_text._digest == text.digest() and hash(loaded_text) == hash(text)
+
+    def test_digest(self):
+        section = self.build_section()
+        assert isinstance(section.digest(), bytes) and len(section.digest()) == 16
+        assert section.digest() == load_adf(section.render(), lazy=True).digest()
+        assert section[0].digest() != section[1].digest()
+
+    def test_dedupe(self):
+        doc = ADFDoc().extend_content([
+            ADFPanel('info').extend_content(self.build_section().local_info['content'])
+            for _ in range(3)
+        ])
+        rendered = doc.render(mutable=True)
+        assert doc.dedupe() is doc
+        assert render_output_text(doc) == render_output_text(rendered)
+        panels = list(doc)
+        assert panels[0].local_info['attrs'] is panels[2].local_info['attrs']
+        assert panels[0].render() is panels[2].render()
+        assert panels[0][0, 1].local_info['marks'][0] is panels[1][0, 1].local_info['marks'][0]
+        assert panels[0][1].render() is panels[1][1].render()
+
+        panels[2].assign_info('attrs', panelType='note')
+        panels[1][0, 0].text = 'bar'
+        assert panels[0].render() == rendered['content'][0]
+        assert panels[1].render()['content'][0]['content'][0]['text'] == 'bar'
+        assert panels[2].render()['attrs']['panelType'] == 'note'
+        doc.validate()
+
+
+class TestADFObjectWalk:
+    @staticmethod
+    def build_doc():
+        return ADFDoc().extend_content([
+            ADFPanel('info').extend_content([ADFParagraph().add(ADFText('foo').add('strong'))]),
+            ADFParagraph().extend_content([ADFText('bar'), ADFText('baz')]),
+        ])
+
+    @pytest.mark.parametrize("order, expected", [
+        ('pre', ['doc', 'panel', 'paragraph', 'text', 'paragraph', 'text', 'text']),
+        ('post', ['text', 'paragraph', 'panel', 'text', 'text', 'paragraph', 'doc']),
+        ('bfs', ['doc', 'panel', 'paragraph', 'paragraph', 'text', 'text', 'text']),
+    ])
+    def test_order(self, order, expected):
+        assert [node.type for node, _, _ in self.build_doc().walk(order=order)] == expected
+
+    def test_depth_and_path(self):
+        doc = self.build_doc()
+        entries = list(doc.walk(marks=True))
+        assert [(node.type, depth, path) for node, depth, path in entries] == [
+            ('doc', 0, ''),
+            ('panel', 1, '/content/0'),
+            ('paragraph', 2, '/content/0/content/0'),
+            ('text', 3, '/content/0/content/0/content/0'),
+            ('strong', 4, '/content/0/content/0/content/0/marks/0'),
+            ('paragraph', 1, '/content/1'),
+            ('text', 2, '/content/1/content/0'),
+            ('text', 2, '/content/1/content/1'),
+        ]
+        assert entries[-1][0] is doc[1, 1]
+
+    def test_prune(self):
+        doc = self.build_doc()
+        assert [node.type for node, _, _ in doc.walk(prune=lambda node: node.type == 'panel')] == \
+               ['doc', 'paragraph', 'text', 'text']
+        assert list(doc.walk(order='post', prune=lambda node: node.type == 'doc')) == []
+
+    def test_lazy(self):
+        doc = load_adf(self.build_doc().render(), lazy=True)
+        assert [node.type for node, _, _ in doc.walk(materialize=False)] == ['doc']
+        walker = doc.walk()
+        assert [next(walker)[0].type, next(walker)[0].type] == ['doc', 'panel']
+        assert isinstance(list.__getitem__(doc.local_info['content'], 0), ADFPanel)
+        assert isinstance(list.__getitem__(doc[0].local_info['content'], 0), dict)
+
+    def test_invalid_order(self):
+        with pytest.raises(ValueError):
+            self.build_doc().walk(order='in')
+
+
 class TestADFObjectCoverage:
     def test_load_malformed_object(self):
         with pytest.raises(ValueError):
@@ -164,6 +748,33 @@ class TestADFObjectFactory:
         # Reset the original class. Don't do it in production
         ADFObject.node_class_registry[node_type] = original_class
 
+    @pytest.mark.parametrize("node", [
+        ADFText('foo'), ADFObject('paragraph'), ADFTable.create(dimension=(1, 1)),
+        load_adf({'type': 'paragraph'}, trusted=True),
+    ])
+    def test_no_instance_dict(self, node):
+        assert not hasattr(node, '__dict__')
+
+    def test_type_details_on_class(self):
+        paragraph, generic_paragraph = ADFParagraph(), ADFObject('paragraph')
+        assert ADFParagraph.type == 'paragraph' and ADFParagraph.is_node and not ADFParagraph.is_mark
+        assert paragraph._node_prop is ADFParagraph._node_prop is generic_paragraph._node_prop
+        assert (generic_paragraph.type, generic_paragraph.is_node) == ('paragraph', True)
+
+    def test_type_details_reset_with_schema_source(self):
+        node_prop = ADFParagraph()._node_prop
+        set_schema_source('bundled')
+        assert not isinstance(ADFParagraph.__dict__['_node_prop'], dict)
+        assert ADFParagraph()._node_prop == node_prop
+
+    @pytest.mark.parametrize("node", [
+        ADFText('foo').add('strong'), ADFObject('text', text='foo').add('strong'),
+    ])
+    def test_pickle_and_clone(self, node):
+        for copied_node in (pickle.loads(pickle.dumps(node)), node.clone()):
+            assert type(copied_node) is type(node)
+            assert copied_node.render() == node.render()
+
 
 class TestADFContentObject:
     def test_index_access(self, reference_test_objects):
@@ -0,0 +1,247 @@
+import copy
+import json
+
+import pytest
+
+from atlassian_doc_builder import ADFDoc, ADFLink, ADFObject, ADFParagraph, ADFTable, ADFText, \
+    apply_patch, diff, load_adf
+from .utils import render_output_text
+
+
+def apply_json_patch(document, operations):
+    # Reference implementation of RFC 6902 add/remove/replace.
+    document = copy.deepcopy(json.loads(json.dumps(document)))
+    for operation in operations:
+        if operation['path'] == '':
+            document = json.loads(json.dumps(operation['value']))
+            continue
+        *parents, key = [k.replace('~1', '/').replace('~0', '~') for k in operation['path'].split('/')[1:]]
+        container = document
+        for parent in parents:
+            container = container[int(parent) if isinstance(container, list) else parent]
+        key = int(key) if isinstance(container, list) else key
+        value = json.loads(json.dumps(operation.get('value')))
+        if operation['op'] == 'remove':
+            del container[key]
+        elif operation['op'] == 'add' and isinstance(container, list):
+            container.insert(key, value)
+        else:
+            container[key] = value
+    return document
+
+
+EDITS = [
+    lambda doc: doc.local_info['content'].reverse(),
+    lambda doc: doc.local_info['content'].extend([ADFParagraph(), ADFParagraph().add(ADFText('end'))]),
+    lambda doc: doc.local_info['content'].clear(),
+    lambda doc: doc[1].local_info['content'].insert(0, ADFText('start')),
+    lambda doc: doc[2].local_info.pop('content'),
+    lambda doc: doc[1, 0].local_info['marks'].append(ADFLink('http://localhost')),
+    lambda doc: doc[0].local_info['attrs'].update(level=3),
+    lambda doc: doc[1, 0].local_info['marks'].__setitem__(0, ADFObject('em')),
+    lambda doc: doc[1, 0].local_info['marks'].__setitem__(0, ADFLink('http://localhost')),
+]
+
+
+class TestDiff:
+    def test_no_change(self, build_doc):
+        assert diff(build_doc(), build_doc()) == []
+
+    def test_no_change_lazy(self, build_doc):
+        old, new = load_adf(build_doc().render(), lazy=True), load_adf(build_doc().render(), lazy=True)
+        assert diff(old, new) == []
+        assert all(isinstance(child, dict) for child in list.__iter__(old.local_info['content']))
+
+    def test_text_changed(self, build_doc):
+        new = build_doc()
+        new[1, 1].text = 'qux'
+        assert diff(build_doc(), new) == [{'op': 'replace', 'path': '/content/1/content/1/text', 'value': 'qux'}]
+
+    def test_attrs_changed(self, build_doc):
+        new = build_doc()
+        new[0].level = 2
+        assert diff(build_doc(), new) == [{'op': 'replace', 'path': '/content/0/attrs/level', 'value': 2}]
+
+    def test_node_added_and_removed(self, build_doc):
+        old, new = build_doc(), build_doc()
+        new.local_info['content'].insert(1, ADFParagraph().add(ADFText('new')))
+        new.local_info['content'].pop()
+        operations = diff(old, new)
+        assert [operation['op'] for operation in operations] == ['remove', 'add']
+        assert operations[1]['path'] == '/content/1'
+        assert render_output_text(apply_json_patch(old.render(), operations)) == render_output_text(new)
+
+    def test_type_changed(self, build_doc):
+        new = build_doc()
+        new.local_info['content'][3] = ADFObject('rule')
+        assert diff(build_doc(), new) == [{'op': 'replace', 'path': '/content/3', 'value': {'type': 'rule'}}]
+
+    def test_marks_changed(self, build_doc):
+        new = build_doc()
+        new[1, 1].add('em')
+        new[1, 0].local_info.pop('marks')
+        assert diff(build_doc(), new) == [
+            {'op': 'add', 'path': '/content/1/content/1/marks', 'value': [{'type': 'em'}]},
+            {'op': 'remove', 'path': '/content/1/content/0/marks'},
+        ]
+
+    def test_mark_type_changed(self, build_doc):
+        new = build_doc()
+        new[1, 0].local_info['marks'][0] = ADFObject('em')
+        assert diff(build_doc(), new) == \
+               [{'op': 'replace', 'path': '/content/1/content/0/marks/0', 'value': {'type': 'em'}}]
+
+    def test_equal_python_hash(self):
+        # hash(-1) == hash(-2), the digests differ.
+        old, new = ADFObject('orderedList', attrs={'order': -1}), ADFObject('orderedList', attrs={'order': -2})
+        assert old.digest() != new.digest()
+        old_doc, new_doc = ADFDoc().add(old), ADFDoc().add(new)
+        assert diff(old_doc, new_doc) == diff(old_doc.render(), new_doc.render()) == \
+               [{'op': 'replace', 'path': '/content/0/attrs/order', 'value': -2}]
+
+    def test_strict(self, monkeypatch, build_doc):
+        old, new = build_doc(), build_doc()
+        new[2, 0].text = 'qux'
+        monkeypatch.setattr(ADFObject, 'digest', lambda node: b'')  # Every node collides.
+        monkeypatch.setattr('atlassian_doc_builder.adf_patch._child_digest', lambda child: b'')
+        assert diff(old, new) == []
+        assert diff(old, new, strict=True) == [{'op': 'replace', 'path': '/content/2/content/0/text', 'value': 'qux'}]
+
+    def test_repetitive_content(self, monkeypatch):
+        old = ADFDoc().extend_content([ADFParagraph().add(ADFText('foo')) for _ in range(3000)])
+        new = old.clone()
+        new.local_info['content'].insert(1500, ADFObject('rule'))
+        new._invalidate()
+        assert diff(old, new) == [{'op': 'add', 'path': '/content/1500', 'value': {'type': 'rule'}}]
+        # Beyond the limit, the children between the common prefix and suffix are patched in place.
+        monkeypatch.setattr('atlassian_doc_builder.adf_patch._MATCHED_CHILDREN_LIMIT', 0)
+        new[0, 0].text, new[-1, 0].text = 'bar', 'baz'
+        operations = diff(old, new)
+        assert len(operations) == 3
+        assert render_output_text(apply_json_patch(old.render(), operations)) == render_output_text(new)
+
+    def test_pointer_escaped(self):
+        old, new = ADFObject('panel', attrs={'a/b~c': 1}), ADFObject('panel', attrs={'a/b~c': 2})
+        assert diff(old, new) == [{'op': 'replace', 'path': '/attrs/a~1b~0c', 'value': 2}]
+
+    def test_rendered_input(self, build_doc):
+        new = build_doc()
+        new[2, 0].text = 'qux'
+        assert diff(build_doc().render(), new.render(mutable=True)) == \
+               [{'op': 'replace', 'path': '/content/2/content/0/text', 'value': 'qux'}]
+
+    @pytest.mark.parametrize("edit", EDITS)
+    def test_patch_applied(self, edit, build_doc):
+        old, new = build_doc(), build_doc()
+        edit(new)
+        new._invalidate()
+        for old_input, new_input in ((old, new), (old.render(), new.render(mutable=True))):
+            operations = diff(old_input, new_input)
+            assert render_output_text(apply_json_patch(old.render(), operations)) == render_output_text(new)
+
+    def test_top_node_replaced(self, build_doc):
+        new = ADFParagraph().add(ADFText('foo'))
+        assert diff(build_doc(), new) == [{'op': 'replace', 'path': '', 'value': new.render()}]
+
+
+class TestApplyPatch:
+    @pytest.mark.parametrize("edit", EDITS)
+    def test_diff_applied(self, edit, build_doc):
+        old, new = build_doc(), build_doc()
+        old.render()
+        edit(new)
+        new._invalidate()
+        assert apply_patch(old, diff(old, new)) == new
+        assert render_output_text(old) == render_output_text(new)
+
+    def test_lazy_path_only(self, build_doc):
+        doc = load_adf(build_doc().render(), lazy=True)
+        apply_patch(doc, [{'op': 'replace', 'path': '/content/2/content/0/text', 'value': 'qux'}])
+        assert [isinstance(child, dict) for child in list.__iter__(doc.local_info['content'])] == \
+               [True, True, False, True]
+        assert doc.render()['content'][2]['content'][0]['text'] == 'qux'
+
+    def test_render_invalidated(self, build_doc):
+        doc = build_doc()
+        rendered = doc.render()
+        apply_patch(doc, [
+            {'op': 'add', 'path': '/content/-', 'value': {'type': 'rule'}},
+            {'op': 'remove', 'path': '/content/0'},
+        ])
+        assert doc[0].render() is rendered['content'][1]
+        assert [child['type'] for child in doc.render()['content']] == ['paragraph', 'paragraph', 'paragraph', 'rule']
+        assert doc[3].parent is doc
+
+    def test_field_replaced(self, build_doc):
+        doc = build_doc()
+        old_texts = list(doc[1].local_info['content'])
+        apply_patch(doc, [{'op': 'replace', 'path': '/content/1/content', 'value': [{'type': 'text', 'text': 'qux'}]}])
+        assert [text.parent for text in old_texts] == [None, None]
+        assert doc[1, 0].parent is doc[1]
+
+    def test_field_removed(self, build_doc):
+        doc = build_doc()
+        old_texts, old_mark = list(doc[1].local_info['content']), doc[1, 0].local_info['marks'][0]
+        apply_patch(doc, [
+            {'op': 'remove', 'path': '/content/1/content/0/marks'},
+            {'op': 'remove', 'path': '/content/1/content'},
+        ])
+        assert [text.parent for text in old_texts] == [None, None]
+        assert old_mark.parent is None
+
+    def test_shared_mark_copied(self, build_doc):
+        doc = build_doc()
+        doc[1, 0].add('link', attrs={'href': 'http://localhost'})
+        other = ADFText('other').add('link', attrs={'href': 'http://localhost'})
+        shared = other.local_info['marks'][0]
+        apply_patch(doc, [{'op': 'replace', 'path': '/content/1/content/0/marks/1/attrs/href', 'value': 'http://a'}])
+        assert doc[1, 0].local_info['marks'][1] is not shared
+        assert doc[1, 0].local_info['marks'][1].parent is doc[1, 0]
+        assert doc[1, 0].render()['marks'][1]['attrs'] == {'href': 'http://a'}
+        assert shared.render()['attrs'] == {'href': 'http://localhost'}
+
+    def test_checks(self, build_doc):
+        doc = build_doc()
+        with pytest.raises(RuntimeError):
+            apply_patch(doc, [{'op': 'add', 'path': '/content/0', 'value': {'type': 'strong'}}])
+        with pytest.raises(KeyError):
+            apply_patch(doc, [{'op': 'add', 'path': '/content/0/foo', 'value': 1}])
+        with pytest.raises(IndexError):
+            apply_patch(doc, [{'op': 'remove', 'path': '/content/4'}])
+        with pytest.raises(ValueError):
+            apply_patch(doc, [{'op': 'move', 'path': '/content/0', 'from': '/content/1'}])
+        with pytest.raises(ValueError):
+            apply_patch(doc, [{'op': 'replace', 'path': 'content', 'value': []}])
+        assert doc == build_doc()
+
+    def test_test_operation(self, build_doc):
+        doc = build_doc()
+        apply_patch(doc, [
+            {'op': 'test', 'path': '/content/1/content/0', 'value': {
+                'type': 'text', 'text': 'foo', 'marks': [{'type': 'strong'}]
+            }},
+            {'op': 'test', 'path': '/content/0/attrs/level', 'value': 1},
+        ])
+        with pytest.raises(ValueError):
+            apply_patch(doc, [{'op': 'test', 'path': '/content/0/attrs', 'value': {'level': 2}}])
+
+    def test_table_width(self):
+        table = ADFTable.from_rows([['a', 'b']])
+        assert table[0].width == table._max_width == 2
+        apply_patch(table, [{'op': 'add', 'path': '/content/0/content/-', 'value': {
+            'type': 'tableCell', 'attrs': {'colspan': 1}, 'content': [{'type': 'paragraph'}]
+        }}])
+        assert table[0].width == table._max_width == 3
+
+    def test_table_width_kept(self):
+        table = ADFTable.from_rows([['a', 'b']] * 100)
+        assert table._max_width == 2
+        apply_patch(table, [{'op': 'replace', 'path': '/content/50/content/0/content/0/content/0/text', 'value': 'c'}])
+        table.append_row()
+        assert [isinstance(row, dict) for row in list.__iter__(table.local_info['content'])].count(False) == 2
+        apply_patch(table, [{'op': 'replace', 'path': '/content/0/content/1/attrs/colspan', 'value': 2}])
+        assert table._max_width == 3
+
+    def test_top_node_replaced(self, build_doc):
+        doc = apply_patch(build_doc().render(), [{'op': 'replace', 'path': '', 'value': {'type': 'paragraph'}}])
+        assert isinstance(doc, ADFParagraph)
@@ -0,0 +1,110 @@
+import io
+import json
+
+import pytest
+
+from atlassian_doc_builder import ADFDoc, ADFTable, load_adf, iter_load_adf, load_adf_stream
+from atlassian_doc_builder import iter_csv_table_chunks, write_csv_tables
+from .utils import render_output_text
+
+
+@pytest.fixture
+def long_document():
+    with open('tests/test_smoke_long.json') as f:
+        return json.load(f)
+
+
+class TestIterLoadADF:
+    @pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+    def test_same_as_load_adf(self, long_document, chunk_size):
+        fp = io.StringIO(json.dumps(long_document, indent=2))
+        blocks = [render_output_text(block) for block in iter_load_adf(fp, chunk_size=chunk_size)]
+        assert blocks == [render_output_text(block) for block in load_adf(long_document).render()['content']]
+
+    @pytest.mark.parametrize("trusted,lazy", [(True, False), (False, True)])
+    def test_load_options(self, long_document, trusted, lazy):
+        fp = io.StringIO(json.dumps(long_document))
+        blocks = [render_output_text(block) for block in iter_load_adf(fp, trusted=trusted, lazy=lazy)]
+        assert blocks == [render_output_text(block) for block in long_document['content']]
+
+    def test_binary_file(self):
+        document = {'type': 'doc', 'version': 1, 'content': [
+            {'type': 'paragraph', 'content': [{'type': 'text', 'text': '中文 \U0001f600'}]},
+        ]}
+        fp = io.BytesIO(json.dumps(document, ensure_ascii=False).encode('utf-8'))
+        assert [block[0].text for block in iter_load_adf(fp, chunk_size=1)] == ['中文 \U0001f600']
+
+    def test_empty_content(self):
+        assert list(iter_load_adf(io.StringIO('{"type": "doc", "version": 1, "content": []}'))) == []
+        assert list(iter_load_adf(io.StringIO('{}'))) == []
+
+    @pytest.mark.parametrize("text", [
+        '',
+        '[]',
+        '{"type": "doc", "content": [{"type": "paragraph"}',
+        '{"type": "doc", "content": [{"type": "paragraph"} {"type": "paragraph"}]}',
+        '{1: "doc"}',
+    ])
+    def test_malformed_input(self, text):
+        with pytest.raises(ValueError):
+            list(iter_load_adf(io.StringIO(text), chunk_size=4))
+
+
+class TestLoadADFStream:
+    def test_callback(self, long_document):
+        blocks = []
+        doc = load_adf_stream(io.StringIO(json.dumps(long_document)), blocks.append, chunk_size=3)
+        assert type(doc) is ADFDoc
+        assert doc.local_info['version'] == 1
+        assert len(doc) == 0
+        assert [render_output_text(block) for block in blocks] == \
+            [render_output_text(block) for block in long_document['content']]
+
+    def test_fields_after_content(self):
+        doc = load_adf_stream(io.StringIO('{"content": [], "version": 1, "type": "doc"}'), lambda block: None,
+                              chunk_size=1)
+        assert doc.render() == {'version': 1, 'type': 'doc', 'content': []}
+
+
+class TestCSVTables:
+    csv_text = 'id,name\n1,foo\n2,\n3\n4,bar\n'
+
+    def test_same_as_from_rows(self):
+        tables = json.loads(''.join(iter_csv_table_chunks(io.StringIO(self.csv_text))))
+        expected = ADFTable.from_rows([['1', 'foo'], ['2', ''], ['3'], ['4', 'bar']], header=['id', 'name'])
+        assert [render_output_text(table) for table in tables] == [render_output_text(expected)]
+
+    def test_split_tables(self):
+        tables = json.loads(''.join(iter_csv_table_chunks(io.StringIO(self.csv_text), max_rows=3)))
+        assert [len(table['content']) for table in tables] == [4, 2]
+        assert all(table['content'][0]['content'][0]['type'] == 'tableHeader' for table in tables)
+        tables = json.loads(''.join(iter_csv_table_chunks(io.StringIO(self.csv_text), max_rows=2)))
+        assert [len(table['content']) for table in tables] == [3, 3]
+
+    def test_header_options(self):
+        tables = json.loads(''.join(iter_csv_table_chunks(io.StringIO(self.csv_text), header=False, max_rows=2)))
+        assert [len(table['content']) for table in tables] == [2, 2, 1]
+        assert tables[0]['content'][0]['content'][0]['type'] == 'tableCell'
+        tables = json.loads(''.join(iter_csv_table_chunks(io.StringIO('1;2\n'), header=['a', 'b'], delimiter=';')))
+        assert len(tables[0]['content']) == 2
+
+    def test_formatters(self):
+        tables = json.loads(''.join(iter_csv_table_chunks(io.StringIO(self.csv_text), formatters={'name': str.upper})))
+        assert tables[0]['content'][1]['content'][1]['content'][0]['content'][0]['text'] == 'FOO'
+
+    def test_empty_csv(self):
+        assert json.loads(''.join(iter_csv_table_chunks(io.StringIO('')))) == []
+        assert [len(table['content']) for table in
+                json.loads(''.join(iter_csv_table_chunks(io.StringIO('id,name\n'))))] == [1]
+
+    def test_write_doc(self):
+        output = io.StringIO()
+        write_csv_tables(io.StringIO(self.csv_text), output, max_rows=2, as_doc=True, buffer_size=16)
+        doc = load_adf(json.loads(output.getvalue()))
+        assert type(doc) is ADFDoc
+        assert len(doc) == 2
+        doc.validate()
+
+    def test_wide_row(self):
+        with pytest.raises(ValueError):
+            ''.join(iter_csv_table_chunks(io.StringIO('a\n1,2\n')))
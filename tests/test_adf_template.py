@@ -0,0 +1,105 @@
+import json
+
+import pytest
+
+from atlassian_doc_builder import ADFDoc, ADFParagraph, ADFText, compile_template, load_adf, render_batch
+from .utils import render_output_text
+
+
+class TestCompileTemplate:
+    def test_same_as_apply_variable(self, build_template):
+        variables = {'name': 'foo', 'greeting': 'bar', 'path': 'baz'}
+        result = compile_template(build_template()).render(**variables)
+        assert render_output_text(result) == render_output_text(build_template().apply_variable(**variables))
+
+    def test_template_not_modified(self, build_template):
+        doc = build_template()
+        expected = render_output_text(doc)
+        template = compile_template(doc)
+        template.render(name='foo', greeting='bar', path='baz')
+        assert render_output_text(doc) == expected
+
+    def test_multiple_renders(self, build_template):
+        template = compile_template(build_template())
+        first = template.render(name='foo', greeting='bar', path='baz')
+        second = template.render(name='qux', greeting='quux', path=1)
+        assert first['content'][0]['content'][0]['text'] == 'Hello foo, bar!'
+        assert second['content'][0]['content'][0]['text'] == 'Hello qux, quux!'
+        assert second['content'][2]['content'][0]['marks'][0]['attrs']['href'] == 'http://localhost/1'
+        # Nodes without variables are shared.
+        assert first['content'][1] is second['content'][1]
+
+    def test_variables(self, build_template):
+        assert compile_template(build_template()).variables == {'name', 'greeting', 'path'}
+
+    def test_no_variable(self):
+        doc = ADFDoc().add(ADFParagraph().add(ADFText('static')))
+        template = compile_template(doc)
+        assert template.variables == set()
+        assert template.render() is doc.render()
+
+    def test_load(self, build_template):
+        template = compile_template(build_template())
+        node = template.load(name='foo', greeting='bar', path='baz')
+        assert type(node) is ADFDoc
+        assert node[0, 0].text == 'Hello foo, bar!'
+        node[0, 0].text = 'changed'
+        assert template.render(name='foo', greeting='bar', path='baz')['content'][0]['content'][0]['text'] == \
+            'Hello foo, bar!'
+
+    def test_lazy_template(self, build_template):
+        template = compile_template(load_adf(build_template().render(mutable=True), lazy=True))
+        assert template.render(name='foo', greeting='bar', path='baz')['content'][0]['content'][0]['text'] == \
+            'Hello foo, bar!'
+
+    def test_missing_variable(self, build_template):
+        with pytest.raises(KeyError):
+            compile_template(build_template()).render(name='foo')
+
+    def test_invalid_expression(self):
+        with pytest.raises(ValueError):
+            compile_template(ADFDoc().add(ADFParagraph().add(ADFText('{name.__class__}'))))
+
+
+class TestRenderBatch:
+    @staticmethod
+    def variable_sets(count):
+        return ({'name': f'n{i}', 'greeting': 'hi', 'path': i} for i in range(count))
+
+    @pytest.mark.parametrize("executor", ["process", "thread"])
+    def test_ordered(self, executor, build_template):
+        template = compile_template(build_template())
+        outputs = list(render_batch(template, self.variable_sets(20), workers=2, executor=executor, chunk_size=3))
+        assert [render_output_text(output) for output in outputs] == \
+            [render_output_text(template.render(**variables)) for variables in self.variable_sets(20)]
+
+    @pytest.mark.parametrize("executor", ["process", "thread"])
+    def test_unordered(self, executor, build_template):
+        template = compile_template(build_template())
+        outputs = render_batch(template, self.variable_sets(20), workers=2, executor=executor, chunk_size=3,
+                               ordered=False)
+        assert sorted((index, output['content'][0]['content'][0]['text']) for index, output in outputs) == \
+            [(i, f'Hello n{i}, hi!') for i in range(20)]
+
+    def test_empty_input(self, build_template):
+        assert list(render_batch(compile_template(build_template()), [], executor='thread')) == []
+
+    def test_stop_early(self, build_template):
+        outputs = render_batch(compile_template(build_template()), self.variable_sets(1000), workers=2, chunk_size=1)
+        assert next(outputs)['content'][0]['content'][0]['text'] == 'Hello n0, hi!'
+        outputs.close()
+
+    def test_missing_variable(self, build_template):
+        with pytest.raises(KeyError):
+            list(render_batch(compile_template(build_template()), [{'name': 'foo'}], executor='thread'))
+
+    def test_unknown_executor(self, build_template):
+        with pytest.raises(ValueError):
+            render_batch(compile_template(build_template()), [], executor='foo')
+
+    @pytest.mark.parametrize("executor", ["process", "thread"])
+    def test_transform(self, executor, build_template):
+        outputs = render_batch(compile_template(build_template()), self.variable_sets(5), workers=2, executor=executor,
+                               transform=json.dumps)
+        assert [json.loads(output)['content'][0]['content'][0]['text'] for output in outputs] == \
+            [f'Hello n{i}, hi!' for i in range(5)]
@@ -2,7 +2,7 @@ import pytest
 
 from atlassian_doc_builder import ADFHeading, ADFCodeBlock, ADFPanel
 from atlassian_doc_builder import ADFParagraph, ADFBlockquote, ADFBulletList, ADFOrderList, ADFListItem, ADFExpand
-from atlassian_doc_builder import ADFText
+from atlassian_doc_builder import ADFDoc, ADFText
 from atlassian_doc_builder import ADFTaskList, ADFTaskItem
 from atlassian_doc_builder import ADFDecisionList, ADFDecisionItem
 
@@ -80,3 +80,12 @@ class TestADFContentObject:
         else:
             for k, v in addition_args.items():
                 assert getattr(obj, k) == v
+
+    def test_decision_objects(self):
+        decision_list = ADFDecisionList(local_id='list').add(ADFDecisionItem(state='DECIDED', local_id='item'))
+        assert decision_list.type == 'decisionList' and decision_list[0].type == 'decisionItem'
+        assert decision_list.render() == {
+            'type': 'decisionList', 'attrs': {'localId': 'list'},
+            'content': [{'type': 'decisionItem', 'attrs': {'state': 'DECIDED', 'localId': 'item'}}],
+        }
+        ADFDoc().add(decision_list).validate()
@@ -0,0 +1,56 @@
+import pytest
+
+from atlassian_doc_builder import adf_node_list, adf_mark_list, set_schema_source
+from atlassian_doc_builder import adf_schema_tables
+from atlassian_doc_builder.adf_schema_compiler import decode_node_list, decode_mark_list, write_schema_tables
+from atlassian_doc_builder.adf_schema_store import load_bundled_schema
+
+
+@pytest.fixture
+def restore_schema_source():
+    yield
+    set_schema_source('bundled')
+
+
+class TestSchemaCompiler:
+    def test_tables_up_to_date(self):
+        schema = load_bundled_schema()
+        assert adf_schema_tables.NODE_LIST == decode_node_list(schema)
+        assert adf_schema_tables.MARK_LIST == decode_mark_list(schema)
+
+    def test_bundled_source_uses_tables(self):
+        assert adf_node_list() is adf_schema_tables.NODE_LIST
+        assert adf_mark_list() is adf_schema_tables.MARK_LIST
+
+    def test_decoded_source_matches_tables(self, tmp_path, restore_schema_source):
+        set_schema_source('cached', url='http://127.0.0.1:9/adf-json-schema', cache_dir=str(tmp_path))
+        assert adf_node_list() is not adf_schema_tables.NODE_LIST
+        assert adf_node_list() == adf_schema_tables.NODE_LIST
+
+    @pytest.mark.parametrize("node_type,child_type,allowed", [
+        ("doc", "paragraph", True),
+        ("doc", "text", False),
+        ("listItem", "paragraph", True),
+        ("listItem", "bulletList", True),
+        ("listItem", "table", False),
+        ("tableRow", "tableHeader", True),
+        ("nestedExpand", "paragraph", True),
+    ])
+    def test_allowed_content(self, node_type, child_type, allowed):
+        assert (child_type in adf_node_list()[node_type]['allowed_content']) == allowed
+
+    @pytest.mark.parametrize("node_type,mark_type,allowed", [
+        ("text", "strong", True),
+        ("text", "code", True),
+        ("text", "breakout", False),
+        ("paragraph", "alignment", True),
+        ("codeBlock", "breakout", True),
+    ])
+    def test_allowed_marks(self, node_type, mark_type, allowed):
+        assert (mark_type in adf_node_list()[node_type]['allowed_marks']) == allowed
+
+    def test_write_schema_tables(self, tmp_path):
+        write_schema_tables(path=(output := tmp_path / 'tables.py'))
+        namespace = {}
+        exec(output.read_text(), namespace)
+        assert namespace['NODE_LIST'] == adf_schema_tables.NODE_LIST
@@ -0,0 +1,95 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from atlassian_doc_builder import ADFDoc, adf_schema, adf_node_list, set_schema_source
+from atlassian_doc_builder.adf_schema_store import load_bundled_schema, load_cached_schema, load_schema
+
+
+class SchemaServer:
+    def __init__(self, schema, etag='"v1"'):
+        self.schema, self.etag, self.requests = schema, etag, []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests.append(dict(self.headers))
+                if self.headers.get('If-None-Match') == server.etag:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                body = json.dumps(server.schema).encode()
+                self.send_response(200)
+                self.send_header('ETag', server.etag)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = HTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f'http://127.0.0.1:{self.httpd.server_port}/adf-json-schema'
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+
+@pytest.fixture
+def schema_server():
+    server = SchemaServer(load_bundled_schema())
+    yield server
+    server.httpd.shutdown()
+    server.httpd.server_close()
+
+
+@pytest.fixture
+def restore_schema_source():
+    yield
+    set_schema_source('bundled')
+
+
+class TestSchemaStore:
+    def test_bundled_schema(self):
+        schema = load_bundled_schema()
+        assert 'doc_node' in schema['definitions']
+
+    def test_unknown_source_not_allowed(self):
+        with pytest.raises(ValueError):
+            load_schema('foo')
+        with pytest.raises(ValueError):
+            set_schema_source('foo')
+
+    def test_live_schema(self, schema_server):
+        assert load_schema('live', url=schema_server.url) == schema_server.schema
+        assert len(schema_server.requests) == 1
+
+    def test_cached_schema_conditional_refresh(self, schema_server, tmp_path):
+        first = load_cached_schema(schema_server.url, cache_dir=str(tmp_path))
+        second = load_cached_schema(schema_server.url, cache_dir=str(tmp_path))
+        assert first == second == schema_server.schema
+        assert 'If-None-Match' not in schema_server.requests[0]
+        assert schema_server.requests[1]['If-None-Match'] == schema_server.etag
+
+    def test_cached_schema_updated(self, schema_server, tmp_path):
+        load_cached_schema(schema_server.url, cache_dir=str(tmp_path))
+        schema_server.schema, schema_server.etag = {'definitions': {}}, '"v2"'
+        assert load_cached_schema(schema_server.url, cache_dir=str(tmp_path)) == {'definitions': {}}
+
+    def test_cached_schema_offline(self, schema_server, tmp_path):
+        url = schema_server.url
+        load_cached_schema(url, cache_dir=str(tmp_path))
+        schema_server.httpd.shutdown()
+        schema_server.httpd.server_close()
+        assert load_cached_schema(url, cache_dir=str(tmp_path), timeout=1) == schema_server.schema
+
+    def test_cached_schema_offline_without_cache(self, tmp_path):
+        schema = load_cached_schema('http://127.0.0.1:9/adf-json-schema', cache_dir=str(tmp_path), timeout=1)
+        assert schema == load_bundled_schema()
+
+    def test_set_schema_source(self, schema_server, tmp_path, restore_schema_source):
+        set_schema_source('cached', url=schema_server.url, cache_dir=str(tmp_path))
+        assert adf_schema() == schema_server.schema
+        assert len(adf_node_list()) > 0
+        ADFDoc().validate()
+        assert len(schema_server.requests) == 1
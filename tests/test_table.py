@@ -1,6 +1,7 @@
 import pytest
 
-from atlassian_doc_builder import ADFTable
+from atlassian_doc_builder import ADFDoc, ADFObject, ADFParagraph, ADFTable, ADFTableCell, ADFText, load_adf
+from .utils import render_output_text
 
 
 class TestADFTable:
@@ -96,3 +97,164 @@ class TestADFTable:
         table = ADFTable.create([cols, rows])
         with pytest.raises(ValueError):
             table.append_row([1] * (cols + 10))
+
+    def test_width_tracked_by_append_row(self):
+        table = ADFTable.create([3, 1])
+        for _ in range(5):
+            table.append_row()
+        assert table._max_width == 3
+        table.append_row([1, 1])
+        assert table._max_width == 3
+        assert [row.width for row in table] == [3] * 6 + [2]
+
+    def test_width_after_adding_cells_to_row(self):
+        table = ADFTable.create([2, 2])
+        table[1].add(ADFTableCell(attrs={'colspan': 3}))
+        assert table[1].width == 5
+        assert table._max_width == 5
+
+    def test_width_after_changing_colspan(self):
+        table = ADFTable.create([2, 2])
+        assert table._max_width == 2
+        table[0, 1].assign_info('attrs', colspan=4)
+        assert table[0].width == 5
+        assert table._max_width == 5
+        assert len(table.append_row()) == 5
+
+    def test_width_of_loaded_table(self):
+        table = load_adf(ADFTable.create(spanned_layout=[[1, 1], [3]]).render(mutable=True))
+        assert type(table[0, 0]) is ADFTableCell
+        assert table._max_width == 3
+        with pytest.raises(ValueError):
+            table.append_row([2, 2])
+
+    def test_width_with_generic_row(self):
+        table = ADFTable.create([2, 1])
+        assert table._max_width == 2
+        table.add(ADFObject('tableRow').add(ADFTableCell(attrs={'colspan': 4})))
+        assert table._max_width == 4
+
+    def test_width_with_generic_cell(self):
+        table = ADFTable.create([2, 1])
+        assert table._max_width == 2
+        table[0].add('tableCell', attrs={'colspan': 1})
+        assert table[0].width == table._max_width == 3
+        table[0].add('tableCell', attrs={'colspan': 2})
+        assert table[0].width == table._max_width == 5
+        table[0, 2].assign_info('attrs', colspan=3)
+        assert table[0].width == table._max_width == 7
+
+    def test_width_with_colspan_in_generic_row(self):
+        cell = ADFTableCell(attrs={'colspan': 1})
+        row = ADFObject('tableRow').add(cell)
+        table = ADFTable.create([2, 1]).add(row)
+        assert table._max_width == 2
+        cell.assign_info('attrs', colspan=3)
+        assert table._max_width == 3
+        row.add(ADFTableCell(attrs={'colspan': 1}))
+        assert table._max_width == 4
+
+
+class TestADFTableBulk:
+    @staticmethod
+    def cell_texts(table):
+        return [
+            [cell['content'][0].get('content', [{'text': ''}])[0]['text'] for cell in row['content']]
+            for row in table.render()['content']
+        ]
+
+    def test_from_rows(self):
+        table = ADFTable.from_rows([[1, 'a'], (2, None), iter([3])], header=['id', 'name'])
+        assert self.cell_texts(table) == [['id', 'name'], ['1', 'a'], ['2', ''], ['3', '']]
+        assert [cell.type for cell in table[0]] == ['tableHeader', 'tableHeader']
+        assert [cell.type for cell in table[1]] == ['tableCell', 'tableCell']
+        ADFDoc().add(table).validate()
+
+    def test_from_rows_same_as_create(self):
+        table = ADFTable.create([2, 1])
+        for cell in table[0]:
+            cell.add(ADFParagraph().add(ADFText('foo')))
+        assert render_output_text(ADFTable.from_rows([['foo', 'foo']])) == render_output_text(table)
+
+    def test_from_rows_formatters(self):
+        table = ADFTable.from_rows([[1, 0.5, 2]], header=['a', 'b', 'c'],
+                                   formatters={0: hex, 'b': '{:.0%}'.format})
+        assert self.cell_texts(table)[1] == ['0x1', '50%', '2']
+
+    def test_from_rows_width(self):
+        table = ADFTable.from_rows([[1, 2, 3], [4]])
+        assert table._max_width == 3
+        with pytest.raises(ValueError):
+            ADFTable.from_rows([[1], [2, 3]])
+        table.append_row()
+        assert table[2].width == 3
+
+    def test_from_rows_editable(self):
+        table = ADFTable.from_rows([[1, 2]])
+        table[0, 1, 0, 0].text = 'baz'
+        assert self.cell_texts(table) == [['1', 'baz']]
+
+    def test_from_rows_subclass(self):
+        class CustomTable(ADFTable):
+            __slots__ = ()
+
+        assert type(CustomTable.from_rows([[1, 2]])) is CustomTable
+        assert type(CustomTable.from_columns({'a': [1]})) is CustomTable
+        assert type(CustomTable.from_columns({'a': [1]}, columnar=True)) is CustomTable
+        assert self.cell_texts(CustomTable.from_rows([[1, 2]])) == [['1', '2']]
+
+    def test_from_rows_empty(self):
+        assert ADFTable.from_rows([])._max_width == 0
+        assert self.cell_texts(ADFTable.from_rows([], header=['a'])) == [['a']]
+
+    def test_from_columns(self):
+        table = ADFTable.from_columns({'a': [1, 2], 'b': [3]}, formatters={'b': hex})
+        assert self.cell_texts(table) == [['a', 'b'], ['1', '0x3'], ['2', '']]
+        table = ADFTable.from_columns({'a': [1, 2], 'b': [3]}, header=False, formatters={'b': hex})
+        assert self.cell_texts(table) == [['1', '0x3'], ['2', '']]
+
+    def test_from_dataframe(self):
+        pandas = pytest.importorskip('pandas')
+        dataframe = pandas.DataFrame({'a': [1, 2], 'b': ['x', 'y']})
+        assert self.cell_texts(ADFTable.from_dataframe(dataframe)) == [['a', 'b'], ['1', 'x'], ['2', 'y']]
+        assert self.cell_texts(ADFTable.from_dataframe(dataframe, header=False, index=True))[1] == ['1', '2', 'y']
+
+    def test_from_array(self):
+        numpy = pytest.importorskip('numpy')
+        table = ADFTable.from_array(numpy.arange(4).reshape(2, 2), header=['a', 'b'])
+        assert self.cell_texts(table) == [['a', 'b'], ['0', '1'], ['2', '3']]
+
+    def test_columnar(self):
+        columns = {'a': [1, 2, 3], 'b': ['x', None]}
+        table = ADFTable.from_columns(columns, formatters={'a': hex}, columnar=True)
+        expected = ADFTable.from_columns(columns, formatters={'a': hex})
+        assert render_output_text(table) == render_output_text(expected)
+        assert ''.join(table.iter_json_chunks()) == ''.join(expected.iter_json_chunks())
+        assert table._max_width == 2 and len(table) == 4
+        # Rows are not kept after rendering.
+        assert all(isinstance(row, int) for row in list.__iter__(table.local_info['content']))
+
+    def test_columnar_access(self):
+        table = ADFTable.from_columns({'a': [1, 2], 'b': [3, 4]}, columnar=True)
+        assert table[2, 1, 0, 0].text == '4'
+        assert table[2].parent is table
+        assert [cell.type for cell in table[0]] == ['tableHeader', 'tableHeader']
+        table[2, 1, 0, 0].text = 'foo'
+        assert self.cell_texts(table) == [['a', 'b'], ['1', '3'], ['2', 'foo']]
+        table.append_row()
+        assert len(table.render()['content']) == 4
+        ADFDoc().add(ADFTable.from_columns({'a': [1, 2], 'b': [3, 4]}, columnar=True)).validate()
+
+    def test_columnar_edit_after_render(self):
+        table = ADFTable.from_columns({'a': [1, 2], 'b': [3, 4]}, columnar=True)
+        table.render()
+        table[2, 1, 0, 0].text = 'foo'
+        assert self.cell_texts(table) == [['a', 'b'], ['1', '3'], ['2', 'foo']]
+        assert table[1].render() is table.render()['content'][1]
+
+    def test_columnar_clone(self):
+        table = ADFTable.from_columns({'a': [1, 2], 'b': [3, 4]}, header=False, columnar=True)
+        table[0, 0, 0, 0].text = 'foo'
+        clone = table.clone()
+        assert clone.local_info['content']._columns is table.local_info['content']._columns
+        assert self.cell_texts(clone) == self.cell_texts(table) == [['foo', '3'], ['2', '4']]